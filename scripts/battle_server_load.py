@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from battlesys.server import BattleServer
+from simple_battle_sequence import digimons
+
+
+async def _client(path: str, sessions: int, ready: asyncio.Barrier, duration: float,
+                  latencies: list[float]) -> int:
+    reader, writer = await asyncio.open_unix_connection(path)
+
+    async def call(request: dict) -> dict:
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def open_session() -> tuple[int, list[int]]:
+        reply = await call({'op': 'new', 'player': random.choice(list(digimons)),
+                            'enemy': random.choice(list(digimons))})
+        return reply['session'], reply['state']['moves'][0]
+
+    open_sessions = [await open_session() for _ in range(sessions)]
+    await ready.wait()
+    deadline = time.perf_counter() + duration
+    turns = 0
+    while time.perf_counter() < deadline:
+        # pipeline one move per session, then read the replies in order
+        start = time.perf_counter()
+        writer.write(b''.join(json.dumps({'op': 'move', 'session': session, 'move': random.choice(moves)}).encode()
+                              + b'\n' for session, moves in open_sessions))
+        await writer.drain()
+        replies = []
+        for _ in open_sessions:
+            replies.append(json.loads(await reader.readline()))
+            latencies.append(time.perf_counter() - start)
+        turns += len(replies)
+        for index, reply in enumerate(replies):
+            if reply['state']['winner'] is not None:
+                await call({'op': 'close', 'session': open_sessions[index][0]})
+                open_sessions[index] = await open_session()
+    writer.close()
+    return turns
+
+
+async def main(sessions: int, connections: int, duration: float) -> None:
+    server = BattleServer(digimons, max_sessions=sessions + connections)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'battlesys.sock')
+        await server.start_unix(path)
+        latencies: list[float] = []
+        per_connection = sessions // connections
+        ready = asyncio.Barrier(connections + 1)
+        clients = [asyncio.create_task(_client(path, per_connection, ready, duration, latencies))
+                   for _ in range(connections)]
+        await ready.wait()
+        start = time.perf_counter()
+        turns = sum(await asyncio.gather(*clients))
+        elapsed = time.perf_counter() - start
+        await server.close()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f"{per_connection * connections} open sessions over {connections} connections")
+    print(f"{turns / elapsed:.0f} turns/s, p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Local load generator for battlesys.server")
+    parser.add_argument('--sessions', type=int, default=10_000)
+    parser.add_argument('--connections', type=int, default=200)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.connections, args.duration))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import timeit
+import tracemalloc
+
+from battlesys.action import cast_move
+from battlesys.compact import CreatureTable
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsName
+
+
+ROSTER_SIZE = 100_000
+CALLS = 200_000
+
+
+def _template() -> Creature:
+    return Creature(name='Agumon',
+                    max_health=26,
+                    stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SAT: 9, StatsName.SDF: 7,
+                           StatsName.SPD: 8, StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos.FIRST: Move(name='Pound', hit_rate=100,
+                                               damage=Damage(power=40, nature=Nature.PHYSICAL))})
+
+
+def _measure(build) -> int:
+    tracemalloc.start()
+    roster = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del roster
+    return size
+
+
+if __name__ == '__main__':
+    template = _template()
+
+    dataclass_bytes = _measure(lambda: [
+        Creature(name=template.name, max_health=template.max_health,
+                 stats=dict(template.stats), moves=template.moves)
+        for _ in range(ROSTER_SIZE)])
+    table_bytes = _measure(lambda: CreatureTable(template for _ in range(ROSTER_SIZE)))
+    print(f"memory per creature: dataclass {dataclass_bytes / ROSTER_SIZE:.0f} B, "
+          f"table row {table_bytes / ROSTER_SIZE:.0f} B")
+
+    table = CreatureTable([template, template])
+    compact, foe = table[0], table[1]
+    for name, creature, target in (('dataclass', template, _template()), ('compact', compact, foe)):
+        stats = timeit.timeit(lambda: creature.current_stats(StatsName.ATK), number=CALLS)
+        cast = timeit.timeit(lambda: cast_move(creature, MovePos.FIRST, target), number=CALLS)
+        print(f"{name:>9}: current_stats {stats / CALLS * 1e9:.0f} ns, cast_move {cast / CALLS * 1e9:.0f} ns")
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from functools import lru_cache
 from logging import getLogger, StreamHandler, Formatter
 import random
-from battlesys.action import cast_move
-from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsAlteration, StatsName
+from battlesys.ai import ExpectimaxPolicy
+from battlesys.battle import DRAW, Battle, fresh_creature
+from battlesys.catalog import load_roster
+from battlesys.definitions import MovePos
 
 
 LOGGER = getLogger(__name__)
@@ -17,81 +18,24 @@ LOGGER.addHandler(HANDLER)
 
 
 
-def stats_map(**kwargs: int) -> dict[StatsName, int]:
-    stats = {
-        StatsName[arg.upper()]: value
-        for arg, value in kwargs.items()
-    }
-    stats.update({StatsName.EVA: 0, StatsName.ACC: 0})
-    return stats
-
-
-def moves_map(**kwargs: Move) -> dict[MovePos, Move]:
-    moves = {
-        MovePos[pos.upper()]: move
-        for pos, move in kwargs.items()
-    }
-    return moves
-
-
-@lru_cache
-def pepper_breath() -> Move:
-    return Move(
-        name='Pepper Breath',
-        hit_rate=90,
-        damage=Damage(power=45,
-                      nature=Nature.MAGICAL),
-        description="A small fire breath."
-    )
-
-
-@lru_cache
-def claw_attack() -> Move:
-    return Move(
-        name='Claw Attack',
-        hit_rate=100,
-        damage=Damage(power=35,
-                      nature=Nature.PHYSICAL),
-        alteration_rate=30,
-        alteration=StatsAlteration(StatsName.DFN, 1),
-        description="Attacks with a cutting claw that may reduce the enemy's defense."
-    )
-
-
-@lru_cache
-def blue_blaster() -> Move:
-    return Move(
-        name='Blue Blaster',
-        hit_rate=100,
-        damage=Damage(power=35,
-                      nature=Nature.MAGICAL),
-        alteration_rate=30,
-        alteration=StatsAlteration(StatsName.ACC, 1),
-        description="A small stream of blue flame. May reduce foe's accuracy."
-    )
-
-
-@lru_cache
-def horn_attack() -> Move:
-    return Move(
-        name='Horn Attack',
-        hit_rate=85,
-        damage=Damage(power=50,
-                      nature=Nature.PHYSICAL),
-        description="Attacks with powerful horn."
-    )
-
-
-digimons = dict(
-    agumon = Creature(name='Agumon',
-                        max_health=26,
-                        stats=stats_map(atk=10, dfn=8, sat=9, sdf=7, spd=8),
-                        moves=moves_map(first=pepper_breath(), second=claw_attack())),
-    gabumon = Creature(name='Gabumon',
-                       max_health=22,
-                       stats=stats_map(atk=8, dfn=8, sat=10, sdf=9, spd=7),
-                       moves=moves_map(first=blue_blaster(), second=horn_attack()))
-)
+digimons = load_roster()
+
+
+def player_policy(battle: Battle, side: int) -> MovePos:
+    creature = battle.creatures[side]
+    LOGGER.info(f"Selecione qual movimento seu {creature.name} deve utilizar e pressione `ENTER`")
+    for pos, move in creature.moves.items():
+        print(f"{pos}: {move.name.upper()} -> {move.description}")
+
+    move_pos = ''
+    while move_pos not in creature.moves:
+        move_pos = input(f"Selecione qual movimento seu {creature.name} deve utilizar e pressione `ENTER`: ")
+        if not move_pos.isnumeric():
+            continue
+        move_pos = MovePos(int(move_pos))
+
+    LOGGER.info(f"Selecionado {creature.moves.get(move_pos).name}")
+    return move_pos
 
 
 if __name__ == '__main__':
@@ -119,23 +63,18 @@ if __name__ == '__main__':
         LOGGER.info(f'Selecionado digimon {enemy.name} para a/o inimiga/')
         input()
 
-        while True:
-
-            LOGGER.info(f"Selecione qual movimento seu {player.name} deve utilizar e pressione `ENTER`")
-            for pos, move in player.moves.items():
-                print(f"{pos}: {move.name.upper()} -> {move.description}")
-
-            move_pos = ''
-            while move_pos not in player.moves:
-                move_pos = input(f"Selecione qual movimento seu {player.name} deve utilizar e pressione `ENTER`: ")
-                if not move_pos.isnumeric():
-                    continue
-                move_pos = MovePos(int(move_pos))
-
-            LOGGER.info(f"Selecionado {player.moves.get(move_pos).name}")
-
-            cast_move(player, move_pos, enemy)
-
+        battle = Battle(fresh_creature(player), fresh_creature(enemy),
+                        policies=(player_policy, ExpectimaxPolicy(budget_ms=200)))
+        while not battle.finished:
+            for action in battle.step():
+                caster, target = battle.creatures[action.caster], battle.creatures[1 - action.caster]
+                LOGGER.info(f"{caster.name} usou {caster.moves[action.move_pos].name}: {action.result} "
+                            f"({target.name} HP {max(0, target.health)}/{target.max_health})")
+
+        if battle.winner == DRAW:
+            LOGGER.info("A batalha terminou empatada")
+        else:
+            LOGGER.info(f"{battle.creatures[battle.winner].name} venceu a batalha em {battle.turn} turnos!")
 
     except KeyboardInterrupt:
         print()
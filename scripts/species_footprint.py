@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import timeit
+import tracemalloc
+
+from battlesys.action import cast_move
+from battlesys.catalog import load_roster
+from battlesys.definitions import Creature, MovePos, StatsName
+from battlesys.species import Species
+
+
+POPULATION = 1_000_000
+CALLS = 200_000
+
+
+def _measure(build) -> int:
+    tracemalloc.start()
+    population = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del population
+    return size
+
+
+if __name__ == '__main__':
+    template = load_roster()['agumon']
+    species = Species.from_creature(template)
+
+    dataclass_bytes = _measure(lambda: [
+        Creature(name=template.name, level=template.level, max_health=template.max_health,
+                 health=template.max_health, stats=dict(template.stats), moves=dict(template.moves))
+        for _ in range(POPULATION)])
+    individual_bytes = _measure(lambda: [species.spawn() for _ in range(POPULATION)])
+    print(f"memory per instance at {POPULATION:,}: dataclass {dataclass_bytes / POPULATION:.0f} B, "
+          f"species instance {individual_bytes / POPULATION:.0f} B")
+
+    for name, creature, target in (('dataclass', template, load_roster()['gabumon']),
+                                   ('species', species.spawn(), species.spawn())):
+        stats = timeit.timeit(lambda: creature.current_stats(StatsName.ATK), number=CALLS)
+        cast = timeit.timeit(lambda: cast_move(creature, MovePos.FIRST, target), number=CALLS)
+        print(f"{name:>9}: current_stats {stats / CALLS * 1e9:.0f} ns, cast_move {cast / CALLS * 1e9:.0f} ns")
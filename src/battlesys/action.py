@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
 
 
-from battlesys.definitions import Creature, MovePos, ResultType
+from typing import Callable
 
+from battlesys.conditions import ConditionScheduler
+from battlesys.definitions import Creature, Move, MoveEffect, MovePos, ResultType
+from battlesys.rng import BattleRNG
 
-def cast_move(caster: Creature, move_pos: MovePos, target: Creature) -> ResultType:
+
+CastObserver = Callable[[Creature, Move, Creature, MoveEffect], None]
+
+
+def cast_move(caster: Creature, move_pos: MovePos, target: Creature, rng: BattleRNG | None = None,
+              observer: CastObserver | None = None, conditions: ConditionScheduler | None = None) -> ResultType:
     move = caster.moves[move_pos]
-    move_effect = move.effect(caster, target)
+    move_effect = move.effect(caster, target, rng)
     result = target.apply(move_effect)
+    if conditions is not None and move_effect.condition is not None and result is ResultType.HIT:
+        conditions.afflict(target, move_effect.condition)
+    if observer is not None:
+        observer(caster, move, target, move_effect)
     return result
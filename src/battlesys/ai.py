@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+import random
+from dataclasses import dataclass
+from time import perf_counter
+
+from battlesys.battle import Battle
+from battlesys.calculator import hit_probability
+from battlesys.definitions import MoveEffect, MovePos, ResultType, StatsAlteration, StatsName
+from battlesys.snapshot import STAT_POSITION, STATS, BattleState, CreatureState
+
+
+WIN, LOSS, DRAW = 1.0, -1.0, 0.0
+
+# a chance outcome of one cast: probability, resulting state and its hash
+Outcome = tuple[float, BattleState, int]
+
+
+class _Timeout(Exception):
+    pass
+
+
+class ZobristKeys:
+    """Random 64-bit keys for every (side, health) and (side, stat, stage) feature of a :class:`BattleState`.
+
+    The hash of a state is the XOR of its features' keys, so a child's hash
+    follows from its parent's by XOR-ing out the features that changed and
+    XOR-ing in their new values. Stages at ``0`` contribute nothing.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self._random = random.Random(seed)
+        self._keys: dict[tuple, int] = {}
+
+    def key(self, *feature: object) -> int:
+        key = self._keys.get(feature)
+        if key is None:
+            key = self._keys[feature] = self._random.getrandbits(64)
+        return key
+
+    def health(self, side: int, health: int) -> int:
+        return self.key(side, StatsName.HP, health)
+
+    def stage(self, side: int, stat: StatsName, stage: int) -> int:
+        return self.key(side, stat, stage) if stage else 0
+
+    def search_key(self, side: int, turns_left: int) -> int:
+        """Key of what else a searched value depends on: the side it is scored for and the turns left to the draw."""
+        return self.key('side', side) ^ self.key('turns left', turns_left)
+
+    def hash(self, state: BattleState) -> int:
+        value = 0
+        for side, creature in enumerate(state.creatures):
+            value ^= self.health(side, creature.health)
+            for stat, stage in zip(STATS, creature.stages):
+                value ^= self.stage(side, stat, stage)
+        return value
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    move: MovePos
+    value: float
+    depth: int
+    nodes: int
+
+
+class ExpectimaxPolicy:
+    """Time-bounded search policy for a :class:`Battle`.
+
+    Each turn is searched as a max node over this side's moves and a min node
+    over the foe's moves (the foe is assumed to answer the chosen move at
+    worst), then as chance nodes over each cast's miss, hit and alteration
+    outcomes in speed order. Depths of 1, 2, ... turns are searched until
+    ``budget_ms`` runs out, and the move of the deepest completed search is
+    played. Values are kept in a fixed-size transposition table of
+    ``table_size`` slots keyed by a :class:`ZobristKeys` hash of the state,
+    the searching side and the turns left before the ``max_turns`` draw
+    (counted only once it is within reach of the search). As a battle policy
+    it searches to that battle's ``max_turns``. Conditions are not modelled.
+    """
+
+    def __init__(self, budget_ms: float = 50.0, max_depth: int = 32, table_size: int = 1 << 16,
+                 max_turns: int = 100, seed: int = 0) -> None:
+        self.budget_ms = budget_ms
+        self.max_depth = max_depth
+        self.max_turns = max_turns
+        self.keys = ZobristKeys(seed)
+        self._mask = (1 << max(0, table_size - 1).bit_length()) - 1
+        # slot -> (key, depth, value, best move)
+        self.table: list[tuple[int, int, float, MovePos] | None] = [None] * (self._mask + 1)
+        self.side = 0
+        self.nodes = 0
+        self._deadline = float('inf')
+
+    def __call__(self, battle: Battle, side: int) -> MovePos:
+        # the battle's horizon, and Battle.step counts the turn before asking for moves
+        self.max_turns = battle.max_turns
+        return self.search(BattleState.from_creatures(*battle.creatures, turn=battle.turn - 1), side).move
+
+    def search(self, state: BattleState, side: int) -> SearchResult:
+        self.side, self.nodes = side, 0
+        root_hash = self.keys.hash(state)
+        start = perf_counter()
+        result = None
+        for depth in range(1, self.max_depth + 1):
+            # the first depth always completes, so there is a move to return
+            self._deadline = start + self.budget_ms / 1000 if result is not None else float('inf')
+            try:
+                value, move = self._max(state, root_hash, depth)
+            except _Timeout:
+                break
+            result = SearchResult(move, value, depth, self.nodes)
+            if abs(value) == WIN:
+                break
+        return result
+
+    def _max(self, state: BattleState, state_hash: int, depth: int) -> tuple[float, MovePos]:
+        self.nodes += 1
+        if not self.nodes & 0xf and perf_counter() > self._deadline:
+            raise _Timeout
+        # a value beyond max_depth turns of the draw does not depend on the turn
+        turns_left = min(self.max_turns - state.turn, self.max_depth + 1)
+        key = state_hash ^ self.keys.search_key(self.side, turns_left)
+        slot = key & self._mask
+        entry = self.table[slot]
+        moves = list(state.creatures[self.side].moves)
+        if entry is not None and entry[0] == key and entry[3] in moves:
+            if entry[1] >= depth:
+                return entry[2], entry[3]
+            moves.remove(entry[3])
+            moves.insert(0, entry[3])
+
+        best_value, best_move = -float('inf'), moves[0]
+        replies = list(state.creatures[1 - self.side].moves)
+        for move in moves:
+            worst = float('inf')
+            for reply in replies:
+                worst = min(worst, self._turn(state, state_hash, move, reply, depth))
+                if worst <= best_value:
+                    break
+            if worst > best_value:
+                best_value, best_move = worst, move
+        self.table[slot] = (key, depth, best_value, best_move)
+        return best_value, best_move
+
+    def _turn(self, state: BattleState, state_hash: int, move: MovePos, reply: MovePos, depth: int) -> float:
+        first, second = state.creatures
+        order = (1, 0) if second.current_stats(StatsName.SPD) > first.current_stats(StatsName.SPD) else (0, 1)
+        choices = {self.side: move, 1 - self.side: reply}
+        value = 0.0
+        for probability, after_first, first_hash in self._casts(state, state_hash, order[0], choices[order[0]]):
+            if after_first.creatures[1 - order[0]].health <= 0:
+                value += probability * (WIN if order[0] == self.side else LOSS)
+                continue
+            for chance, after, after_hash in self._casts(after_first, first_hash, order[1], choices[order[1]]):
+                if after.creatures[1 - order[1]].health <= 0:
+                    outcome = WIN if order[1] == self.side else LOSS
+                elif state.turn + 1 >= self.max_turns:
+                    outcome = DRAW
+                elif depth == 1:
+                    outcome = self._evaluate(after)
+                else:
+                    outcome, _ = self._max(BattleState(after.creatures, state.turn + 1), after_hash, depth - 1)
+                value += probability * chance * outcome
+        return value
+
+    def _casts(self, state: BattleState, state_hash: int, caster: int, move_pos: MovePos) -> list[Outcome]:
+        attacker, defender = state.creatures[caster], state.creatures[1 - caster]
+        move = attacker.moves[move_pos]
+        hit = hit_probability(move.hit_rate, attacker.current_stats(StatsName.ACC),
+                              defender.current_stats(StatsName.EVA))
+        outcomes = []
+        if hit < 1:
+            outcomes.append((1 - hit, state, state_hash))
+        if hit > 0:
+            damage, _ = move.build_damage(attacker, defender)
+            altered = hit_probability(move.alteration_rate, 0, 0) if move.alteration is not None else 0.0
+            if altered < 1:
+                outcomes.append((hit * (1 - altered), *self._hit(state, state_hash, 1 - caster, damage, None)))
+            if altered > 0:
+                outcomes.append((hit * altered, *self._hit(state, state_hash, 1 - caster, damage, move.alteration)))
+        return outcomes
+
+    def _hit(self, state: BattleState, state_hash: int, side: int, damage: int,
+             alteration: StatsAlteration | None) -> tuple[BattleState, int]:
+        before = state.creatures[side]
+        after = before.apply(MoveEffect(damage=damage, alteration=alteration, result=ResultType.HIT))
+        if after.health != before.health:
+            state_hash ^= self.keys.health(side, before.health) ^ self.keys.health(side, after.health)
+        if alteration is not None:
+            position = STAT_POSITION[alteration.stats]
+            state_hash ^= (self.keys.stage(side, alteration.stats, before.stages[position])
+                           ^ self.keys.stage(side, alteration.stats, after.stages[position]))
+        return state.replace(side, after), state_hash
+
+    def _evaluate(self, state: BattleState) -> float:
+        mine, theirs = state.creatures[self.side], state.creatures[1 - self.side]
+        return 0.5 * (_health_fraction(mine) - _health_fraction(theirs))
+
+
+def _health_fraction(creature: CreatureState) -> float:
+    return max(0, creature.health) / creature.max_health
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from dataclasses import dataclass, field
+from math import ceil, log
+from typing import Iterable
+
+from battlesys.action import CastObserver
+from battlesys.definitions import Creature, Move, MoveEffect, Nature, ResultType
+
+
+_HITS = (ResultType.HIT, ResultType.CRIT)
+
+
+@dataclass
+class Histogram:
+    """Counts of non-negative integers in unit-wide bins; the last of the ``bins`` collects every larger value."""
+    bins: int = 256
+    counts: list[int] = field(default_factory=list)
+    total: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * self.bins
+
+    def add(self, value: int, count: int = 1) -> None:
+        self.counts[min(value, self.bins - 1)] += count
+        self.total += value * count
+
+    def merge(self, other: 'Histogram') -> None:
+        if other.bins != self.bins:
+            raise ValueError(f'cannot merge a histogram of {other.bins} bins into one of {self.bins}')
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.total += other.total
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        count = self.count
+        return self.total / count if count else 0.0
+
+
+@dataclass
+class QuantileSketch:
+    """Quantiles of a stream of non-negative values within ``accuracy`` relative error.
+
+    Positive values fall in logarithmic buckets ``(gamma ** (i - 1), gamma ** i]``
+    with ``gamma = (1 + accuracy) / (1 - accuracy)``, so the memory depends on
+    the range of the values but not on how many there are. Merging adds the
+    bucket counts, and the merge of two sketches is the sketch of both streams.
+    """
+    accuracy: float = 0.01
+    buckets: Counter = field(default_factory=Counter)
+    zeros: int = 0
+    count: int = 0
+    _log_gamma: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._log_gamma = log(self.gamma)
+
+    @property
+    def gamma(self) -> float:
+        return (1 + self.accuracy) / (1 - self.accuracy)
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value <= 0:
+            self.zeros += count
+        else:
+            self.buckets[ceil(log(value) / self._log_gamma)] += count
+        self.count += count
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        if other.accuracy != self.accuracy:
+            raise ValueError(f'cannot merge a sketch of accuracy {other.accuracy} into one of {self.accuracy}')
+        self.buckets.update(other.buckets)
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError(f'quantile {q} is not in [0, 1]')
+        if not self.count:
+            raise ValueError('empty sketch')
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        gamma = self.gamma
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                break
+        # the midpoint of the bucket in relative terms
+        return 2 * gamma ** index / (gamma + 1)
+
+
+@dataclass
+class CastStats:
+    """Online aggregate of cast outcomes: result counts, secondary effect rates and damage by :class:`Nature`.
+
+    Effects are added one at a time, from a generator through :meth:`update`
+    or from :func:`cast_move` through :meth:`observer`, and never kept, so
+    the memory stays constant however many casts are seen. Damage is
+    keyed by the nature of the move that dealt it, or ``None`` when the
+    move is not known. Partial aggregates, e.g. from parallel workers,
+    :meth:`merge` exactly into the aggregate of all their casts.
+    """
+    bins: int = 256
+    accuracy: float = 0.01
+    casts: int = 0
+    results: Counter = field(default_factory=Counter)
+    # hits of moves that may alter a stat (every hit when the move is not known) and the alterations they caused
+    alteration_chances: int = 0
+    alterations: Counter = field(default_factory=Counter)
+    conditions: Counter = field(default_factory=Counter)
+    damage: dict[Nature | None, Histogram] = field(default_factory=dict)
+    damage_quantiles: dict[Nature | None, QuantileSketch] = field(default_factory=dict)
+
+    def add(self, effect: MoveEffect, move: Move | None = None) -> None:
+        self.casts += 1
+        self.results[effect.result] += 1
+        if effect.result not in _HITS:
+            return
+        if move is None or move.alteration is not None:
+            self.alteration_chances += 1
+        if effect.alteration is not None:
+            self.alterations[effect.alteration.stats] += 1
+        if effect.condition is not None:
+            self.conditions[effect.condition.name] += 1
+        if effect.damage > 0:
+            nature = move.damage.nature if move is not None and move.damage is not None else None
+            self._damage(nature).add(effect.damage)
+            self._quantiles(nature).add(effect.damage)
+
+    def update(self, effects: Iterable[MoveEffect], move: Move | None = None) -> 'CastStats':
+        for effect in effects:
+            self.add(effect, move)
+        return self
+
+    def observer(self) -> CastObserver:
+        """A ``cast_move`` / ``Battle`` observer adding every cast to this aggregate."""
+        def observe(caster: Creature, move: Move, target: Creature, effect: MoveEffect) -> None:
+            self.add(effect, move)
+        return observe
+
+    def _damage(self, nature: Nature | None) -> Histogram:
+        histogram = self.damage.get(nature)
+        if histogram is None:
+            histogram = self.damage[nature] = Histogram(self.bins)
+        return histogram
+
+    def _quantiles(self, nature: Nature | None) -> QuantileSketch:
+        sketch = self.damage_quantiles.get(nature)
+        if sketch is None:
+            sketch = self.damage_quantiles[nature] = QuantileSketch(self.accuracy)
+        return sketch
+
+    def merge(self, other: 'CastStats') -> None:
+        self.casts += other.casts
+        self.results.update(other.results)
+        self.alteration_chances += other.alteration_chances
+        self.alterations.update(other.alterations)
+        self.conditions.update(other.conditions)
+        for nature, histogram in other.damage.items():
+            self._damage(nature).merge(histogram)
+        for nature, sketch in other.damage_quantiles.items():
+            self._quantiles(nature).merge(sketch)
+
+    @property
+    def hits(self) -> int:
+        return sum(self.results[result] for result in _HITS)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.casts if self.casts else 0.0
+
+    @property
+    def alteration_rate(self) -> float:
+        return sum(self.alterations.values()) / self.alteration_chances if self.alteration_chances else 0.0
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+from battlesys.definitions import Creature, Move, MovePos, ResultType, StatsName
+
+
+STATS: tuple[StatsName, ...] = tuple(StatsName)
+STAT_INDEX: dict[StatsName, int] = {stat: idx for idx, stat in enumerate(STATS)}
+RESULTS: tuple[ResultType, ...] = tuple(ResultType)
+RESULT_INDEX: dict[ResultType, int] = {result: idx for idx, result in enumerate(RESULTS)}
+
+MISS = RESULT_INDEX[ResultType.MISS]
+HIT = RESULT_INDEX[ResultType.HIT]
+NO_WINNER = -1
+
+_ACC = STAT_INDEX[StatsName.ACC]
+_EVA = STAT_INDEX[StatsName.EVA]
+# read by every turn's speed order and hit roll
+_ALWAYS_READ = (StatsName.SPD, StatsName.ACC, StatsName.EVA)
+
+
+@dataclass(frozen=True)
+class MoveTable:
+    """Columnar copy of a set of moves, indexed by move id."""
+    moves: tuple[Move, ...]
+    hit_rate: np.ndarray
+    power: np.ndarray
+    atk_stat: np.ndarray
+    def_stat: np.ndarray
+    alteration_stat: np.ndarray
+    alteration_count: np.ndarray
+    alteration_rate: np.ndarray
+
+    @classmethod
+    def build(cls, moves: Sequence[Move]) -> 'MoveTable':
+        moves = tuple(moves)
+        power, atk_stat, def_stat = [], [], []
+        alteration_stat, alteration_count = [], []
+        for move in moves:
+            if move.condition is not None and move.condition_rate:
+                raise ValueError(f'conditions are not modelled in batches ({move.name})')
+            if move.damage is None:
+                power.append(0)
+                atk_stat.append(STAT_INDEX[StatsName.ATK])
+                def_stat.append(STAT_INDEX[StatsName.DFN])
+            else:
+                atk, dfn = move.damage.stats
+                power.append(move.damage.power)
+                atk_stat.append(STAT_INDEX[atk])
+                def_stat.append(STAT_INDEX[dfn])
+            if move.alteration is None:
+                alteration_stat.append(-1)
+                alteration_count.append(0)
+            else:
+                alteration_stat.append(STAT_INDEX[move.alteration.stats])
+                alteration_count.append(move.alteration.count)
+        return cls(moves=moves,
+                   hit_rate=np.array([move.hit_rate for move in moves], dtype=np.int64),
+                   power=np.array(power, dtype=np.int64),
+                   atk_stat=np.array(atk_stat, dtype=np.int64),
+                   def_stat=np.array(def_stat, dtype=np.int64),
+                   alteration_stat=np.array(alteration_stat, dtype=np.int64),
+                   alteration_count=np.array(alteration_count, dtype=np.int64),
+                   alteration_rate=np.array([move.alteration_rate for move in moves], dtype=np.int64))
+
+
+def check_pair(first: Creature, second: Creature) -> None:
+    """Raises the ``KeyError`` or ``ZeroDivisionError`` a scalar battle of the pair would hit on its stats.
+
+    Arrays hold a 0 for a missing stat and divide by a zero defense into
+    ``inf``, so a batch has to refuse such pairs up front to match the engine.
+    """
+    for caster, target in ((first, second), (second, first)):
+        for stat in _ALWAYS_READ:
+            if stat not in caster.stats:
+                raise KeyError(stat)
+        for move in caster.moves.values():
+            if move.damage is None or not move.damage.power:
+                continue
+            atk, dfn = move.damage.stats
+            if atk not in caster.stats:
+                raise KeyError(atk)
+            if dfn not in target.stats:
+                raise KeyError(dfn)
+            if not target.stats[dfn]:
+                raise ZeroDivisionError(f'{target.name or "target"} has no {dfn} to divide {move.name} by')
+
+
+def modifier_factors(modifiers_count: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`battlesys.definitions.modifier_factor`."""
+    factor = 1 + 0.5 * np.minimum(6, np.abs(modifiers_count))
+    return np.power(factor, np.sign(modifiers_count).astype(np.float64))
+
+
+Policy = Callable[['BattleBatch', int], np.ndarray]
+
+
+class BattleBatch:
+    """N independent 1v1 battles stored as arrays and resolved turn by turn.
+
+    Side ``0`` and side ``1`` of every battle always target each other. The
+    turn rules are the scalar ones: the fastest creature (current
+    :attr:`StatsName.SPD`, ties going to side ``0``) acts first, a creature
+    whose health drops to zero ends its battle, and battles still running
+    after ``max_turns`` are draws.
+    """
+
+    def __init__(self, pairs: Sequence[tuple[Creature, Creature]], seed: int | None = None) -> None:
+        moves: dict[int, int] = {}
+        table: list[Move] = []
+        n = len(pairs)
+        self.size = n
+        rows: dict[int, int] = {}
+        creatures: list[Creature] = []
+        layout = np.zeros((n, 2), dtype=np.int64)
+        checked: set[tuple[int, int]] = set()
+        for battle, pair in enumerate(pairs):
+            if (id(pair[0]), id(pair[1])) not in checked:
+                check_pair(*pair)
+                checked.add((id(pair[0]), id(pair[1])))
+            for side, creature in enumerate(pair):
+                if id(creature) not in rows:
+                    rows[id(creature)] = len(creatures)
+                    creatures.append(creature)
+                layout[battle, side] = rows[id(creature)]
+
+        base = np.zeros((len(creatures), len(STATS)), dtype=np.int64)
+        move_ids = np.full((len(creatures), len(MovePos)), -1, dtype=np.int64)
+        for row, creature in enumerate(creatures):
+            for stat, value in creature.stats.items():
+                base[row, STAT_INDEX[stat]] = value
+            for pos, move in creature.moves.items():
+                if id(move) not in moves:
+                    moves[id(move)] = len(table)
+                    table.append(move)
+                move_ids[row, pos - 1] = moves[id(move)]
+
+        self.max_health = np.array([creature.max_health for creature in creatures], dtype=np.int64)[layout]
+        self.health = self.max_health.copy()
+        self.level = np.array([creature.level for creature in creatures], dtype=np.int64)[layout]
+        self.base = base[layout]
+        self.stages = np.zeros_like(self.base)
+        self.moves = move_ids[layout]
+
+        self.table = MoveTable.build(table)
+        self.rng = np.random.default_rng(seed)
+        self.turns = np.zeros(n, dtype=np.int64)
+        self.winner = np.full(n, NO_WINNER, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self._index = np.arange(n)
+
+    @classmethod
+    def replicate(cls, first: Creature, second: Creature, n: int, seed: int | None = None) -> 'BattleBatch':
+        return cls([(first, second)] * n, seed=seed)
+
+    def randint(self, high: np.ndarray | int, rows: int = 1) -> np.ndarray:
+        """``rows`` draws per battle, uniform over ``0 .. high - 1``, with shape ``(rows, N)``."""
+        return self.rng.integers(0, high, size=(rows, self.size))
+
+    def current_stats(self, side: np.ndarray | int, stat_name: StatsName) -> np.ndarray:
+        side = np.broadcast_to(side, (self.size,))
+        if stat_name == StatsName.HP:
+            return self.health[self._index, side]
+        stat = STAT_INDEX[stat_name]
+        stages = self.stages[self._index, side, stat]
+        if stat_name in [StatsName.EVA, StatsName.ACC]:
+            return stages
+        return (self.base[self._index, side, stat] * modifier_factors(stages)).astype(np.int64)
+
+    def cast(self, caster: np.ndarray | int, slots: np.ndarray, active: np.ndarray | None = None) -> np.ndarray:
+        """Every ``caster`` uses the move at ``slots`` (``MovePos - 1``) on its foe.
+
+        Returns the :data:`RESULTS` index of each cast; inactive battles report
+        :attr:`ResultType.FAIL`.
+        """
+        idx = self._index
+        caster = np.broadcast_to(np.asarray(caster, dtype=np.int64), (self.size,))
+        target = 1 - caster
+        if active is None:
+            active = ~self.done
+        move = self.moves[idx, caster, slots]
+        active = active & (move >= 0)
+        move = np.where(active, move, 0)
+        table = self.table
+
+        hit_rate = table.hit_rate[move]
+        ratio = (modifier_factors(self.stages[idx, caster, _ACC])
+                 / modifier_factors(self.stages[idx, target, _EVA]))
+        rolls = self.randint(100, rows=2) + 1
+        hit = active & (hit_rate != 0) & (rolls[0] <= hit_rate * ratio)
+
+        atk_stat, def_stat = table.atk_stat[move], table.def_stat[move]
+        atk = (self.base[idx, caster, atk_stat]
+               * modifier_factors(self.stages[idx, caster, atk_stat])).astype(np.int64)
+        dfn = (self.base[idx, target, def_stat]
+               * modifier_factors(self.stages[idx, target, def_stat])).astype(np.int64)
+        power = table.power[move]
+        if np.any(hit & (power != 0) & (dfn == 0)):
+            # lowered stages can still bring a defense to 0, as in the scalar formula
+            raise ZeroDivisionError('division by zero')
+        basis = (2 * self.level[idx, caster] / 5) + 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            raw = 2 + (basis * power * (atk / dfn) / 50)
+        damage = np.where(hit & (power != 0), np.maximum(1, np.trunc(raw)), 0).astype(np.int64)
+        self.health[idx, target] -= damage
+
+        alteration_rate = table.alteration_rate[move]
+        altered = hit & (alteration_rate != 0) & (rolls[1] <= alteration_rate)
+        altered &= table.alteration_stat[move] >= 0
+        np.add.at(self.stages,
+                  (idx[altered], target[altered], table.alteration_stat[move][altered]),
+                  table.alteration_count[move][altered])
+
+        results = np.where(hit, HIT, MISS)
+        return np.where(active, results, RESULT_INDEX[ResultType.FAIL])
+
+    def random_slots(self, side: int) -> np.ndarray:
+        valid = self.moves[:, side, :] >= 0
+        available = valid.sum(axis=-1)
+        choice = self.randint(np.maximum(available, 1))[0]
+        rank = np.cumsum(valid, axis=-1) - 1
+        return np.argmax(valid & (rank == choice[:, None]), axis=-1)
+
+    def turn(self, slots: np.ndarray) -> None:
+        """Resolves one turn; ``slots`` has shape ``(N, 2)`` with one move slot per side."""
+        running = ~self.done
+        self.turns += running
+        speed = np.stack([self.current_stats(0, StatsName.SPD),
+                          self.current_stats(1, StatsName.SPD)], axis=-1)
+        first = (speed[:, 1] > speed[:, 0]).astype(np.int64)
+        for caster in (first, 1 - first):
+            self.cast(caster, slots[self._index, caster], running)
+            fainted = running & (self.health[self._index, 1 - caster] <= 0)
+            self.winner[fainted] = caster[fainted]
+            running &= ~fainted
+        self.done |= self.winner != NO_WINNER
+
+    def run(self, policies: tuple[Policy, Policy] | None = None, max_turns: int = 100) -> None:
+        if policies is None:
+            policies = (BattleBatch.random_slots, BattleBatch.random_slots)
+        while not self.done.all():
+            self.turn(np.stack([policies[0](self, 0), policies[1](self, 1)], axis=-1))
+            self.done |= self.turns >= max_turns
+
+    def win_rate(self, side: int = 0) -> float:
+        return float(np.mean(self.winner == side))
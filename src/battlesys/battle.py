@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from typing import Callable
+
+from battlesys.action import CastObserver, cast_move
+from battlesys.conditions import ConditionScheduler
+from battlesys.definitions import Creature, MovePos, ResultType, StatsName
+from battlesys.rng import BattleRNG
+
+
+DRAW = -1
+
+Policy = Callable[['Battle', int], MovePos]
+
+
+def random_policy(battle: 'Battle', side: int) -> MovePos:
+    return battle.rng.choice(battle.positions[side])
+
+
+def first_move_policy(battle: 'Battle', side: int) -> MovePos:
+    return battle.positions[side][0]
+
+
+def fixed_policy(move_pos: MovePos) -> Policy:
+    def policy(battle: 'Battle', side: int) -> MovePos:
+        return move_pos
+    return policy
+
+
+def fresh_creature(template: Creature) -> Creature:
+    """A full-health copy of ``template`` sharing its (read-only) stats and moves."""
+    return Creature(name=template.name,
+                    level=template.level,
+                    max_health=template.max_health,
+                    health=template.max_health,
+                    stats=template.stats,
+                    moves=template.moves)
+
+
+@dataclass(frozen=True)
+class Action:
+    caster: int
+    move_pos: MovePos
+    result: ResultType
+
+
+@dataclass(frozen=True)
+class BattleOutcome:
+    winner: int
+    turns: int
+
+
+class Battle:
+    """Headless 1v1 battle between ``first`` (side ``0``) and ``second`` (side ``1``).
+
+    Each turn both policies pick a :class:`MovePos`, then the creatures act in
+    order of current :attr:`StatsName.SPD` (ties go to side ``0``), always
+    targeting the foe. The battle ends as soon as a creature's health drops
+    to zero, or as a draw after ``max_turns`` turns. Conditions inflicted by
+    the moves tick on ``conditions`` at the end of every turn, and a knock
+    out by condition on both sides is a draw. The creatures are mutated in
+    place, and ``observer`` is handed to every :func:`cast_move`.
+    """
+
+    __slots__ = ('creatures', 'policies', 'positions', 'rng', 'max_turns', 'turn', 'winner', 'observer',
+                 'conditions')
+
+    def __init__(self, first: Creature, second: Creature,
+                 policies: tuple[Policy, Policy] = (random_policy, random_policy),
+                 rng: BattleRNG | None = None, max_turns: int = 100,
+                 observer: CastObserver | None = None, conditions: ConditionScheduler | None = None) -> None:
+        self.creatures = (first, second)
+        self.policies = policies
+        self.positions = (list(first.moves), list(second.moves))
+        self.rng = BattleRNG() if rng is None else rng
+        self.max_turns = max_turns
+        self.turn = 0
+        self.winner: int | None = None
+        self.observer = observer
+        self.conditions = ConditionScheduler() if conditions is None else conditions
+
+    @property
+    def finished(self) -> bool:
+        return self.winner is not None
+
+    def order(self) -> tuple[int, int]:
+        first, second = self.creatures
+        return (1, 0) if second.current_stats(StatsName.SPD) > first.current_stats(StatsName.SPD) else (0, 1)
+
+    def step(self) -> list[Action]:
+        if self.winner is not None:
+            return []
+        self.turn += 1
+        creatures, rng = self.creatures, self.rng
+        choices = (self.policies[0](self, 0), self.policies[1](self, 1))
+        actions = []
+        for caster in self.order():
+            target = creatures[1 - caster]
+            result = cast_move(creatures[caster], choices[caster], target, rng, self.observer, self.conditions)
+            actions.append(Action(caster, choices[caster], result))
+            if target.health <= 0:
+                self.winner = caster
+                return actions
+        if self.conditions.tick():
+            first, second = creatures[0].health <= 0, creatures[1].health <= 0
+            if first or second:
+                self.winner = DRAW if first and second else int(first)
+                return actions
+        if self.turn >= self.max_turns:
+            self.winner = DRAW
+        return actions
+
+    def run(self) -> BattleOutcome:
+        step = self.step
+        while self.winner is None:
+            step()
+        return BattleOutcome(self.winner, self.turn)
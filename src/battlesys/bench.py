@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import copy
+import json
+import platform
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence, TextIO
+
+from battlesys.action import cast_move
+from battlesys.battle import Battle, fresh_creature
+from battlesys.definitions import (Creature, Damage, Move, MovePos, Nature, StatsAlteration,
+                                   StatsName, modifier_factor)
+from battlesys.rng import BattleRNG
+from battlesys.snapshot import BattleState, cast_move_state
+
+
+DEFAULT_BASELINE = Path('benchmarks') / 'baseline.json'
+DEFAULT_THRESHOLD = 0.25
+# a baseline is compared against many later runs, so it takes the best of more repeats than a check
+BASELINE_REPEAT = 25
+
+Benchmark = Callable[[], Callable[[], object]]
+
+
+def _creature(name: str, **stats: int) -> Creature:
+    return Creature(name=name, max_health=26,
+                    stats={**{StatsName[stat.upper()]: value for stat, value in stats.items()},
+                           StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos.FIRST: Move(name='Pepper Breath', hit_rate=90,
+                                               damage=Damage(power=45, nature=Nature.MAGICAL)),
+                           MovePos.SECOND: Move(name='Claw Attack', hit_rate=100,
+                                                damage=Damage(power=35, nature=Nature.PHYSICAL),
+                                                alteration=StatsAlteration(StatsName.DFN, -1),
+                                                alteration_rate=30)})
+
+
+def _pair() -> tuple[Creature, Creature]:
+    return (fresh_creature(_creature('Agumon', atk=10, dfn=8, sat=9, sdf=7, spd=8)),
+            fresh_creature(_creature('Gabumon', atk=8, dfn=8, sat=10, sdf=9, spd=7)))
+
+
+def _bench_modifier_factor() -> Callable[[], object]:
+    return lambda: modifier_factor(-2)
+
+
+def _bench_current_stats() -> Callable[[], object]:
+    caster, _ = _pair()
+    caster.stats_modifiers[StatsName.ATK] = 2
+    return lambda: caster.current_stats(StatsName.ATK)
+
+
+def _bench_hit_or_miss() -> Callable[[], object]:
+    caster, target = _pair()
+    move, rng = caster.moves[MovePos.FIRST], BattleRNG(0)
+    return lambda: move.hit_or_miss(caster, target, rng)
+
+
+def _bench_build_damage() -> Callable[[], object]:
+    caster, target = _pair()
+    move = caster.moves[MovePos.FIRST]
+    return lambda: move.build_damage(caster, target)
+
+
+def _bench_effect() -> Callable[[], object]:
+    caster, target = _pair()
+    move, rng = caster.moves[MovePos.FIRST], BattleRNG(0)
+    return lambda: move.effect(caster, target, rng)
+
+
+def _bench_cast_move() -> Callable[[], object]:
+    caster, target = _pair()
+    rng = BattleRNG(0)
+    return lambda: cast_move(caster, MovePos.FIRST, target, rng)
+
+
+def _bench_deepcopy_branch() -> Callable[[], object]:
+    pair, rng = _pair(), BattleRNG(0)
+
+    def branch() -> object:
+        caster, target = copy.deepcopy(pair)
+        return cast_move(caster, MovePos.FIRST, target, rng)
+    return branch
+
+
+def _bench_snapshot_branch() -> Callable[[], object]:
+    state, rng = BattleState.from_creatures(*_pair()), BattleRNG(0)
+    return lambda: cast_move_state(state, 0, MovePos.FIRST, rng)
+
+
+def _bench_battle() -> Callable[[], object]:
+    first, second = _pair()
+    return lambda: Battle(fresh_creature(first), fresh_creature(second), rng=BattleRNG(0)).run()
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    'modifier_factor': _bench_modifier_factor,
+    'current_stats': _bench_current_stats,
+    'hit_or_miss': _bench_hit_or_miss,
+    'build_damage': _bench_build_damage,
+    'effect': _bench_effect,
+    'cast_move': _bench_cast_move,
+    'deepcopy_branch': _bench_deepcopy_branch,
+    'snapshot_branch': _bench_snapshot_branch,
+    'battle': _bench_battle,
+}
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current / self.baseline - 1
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.baseline:.0f} ns -> {self.current:.0f} ns (+{self.slowdown:.0%})"
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Best-of-``repeat`` nanoseconds per call, each repeat lasting at least ``min_time`` seconds."""
+    timer = timeit.Timer(benchmark())
+    number, elapsed = 1, timer.timeit(1)
+    while elapsed < min_time / 10:
+        number *= 10
+        elapsed = timer.timeit(number)
+    number = max(number, int(number * min_time / elapsed))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run_benchmarks(names: Sequence[str] | None = None, repeat: int = 5, min_time: float = 0.2) -> dict[str, float]:
+    return {name: time_benchmark(BENCHMARKS[name], repeat, min_time) for name in (names or BENCHMARKS)}
+
+
+def report(results: dict[str, float]) -> dict:
+    return {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> list[Regression]:
+    """Benchmarks slower than ``baseline`` by more than ``threshold`` (a fraction)."""
+    return [Regression(name, baseline[name], current)
+            for name, current in results.items()
+            if name in baseline and current > baseline[name] * (1 + threshold)]
+
+
+def main(argv: Sequence[str] | None = None, out: TextIO | None = None) -> int:
+    """Prints a table of the results to ``out``, or one JSON line with ``--json``; 1 on a regression."""
+    out = sys.stdout if out is None else out
+    parser = argparse.ArgumentParser(prog='battlesys bench', description="Times the combat hot path.")
+    parser.add_argument('names', nargs='*', metavar='NAME',
+                        help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown over the baseline, as a fraction (default: %(default)s)")
+    parser.add_argument('--output', type=Path, help="write the results as JSON to this file")
+    parser.add_argument('--update-baseline', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help=f"timings per benchmark, the best one counts (at least {BASELINE_REPEAT} "
+                             f"with --update-baseline)")
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--json', action='store_true',
+                        help="print the report and any regressions as a single JSON line instead of a table")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    repeat = max(args.repeat, BASELINE_REPEAT) if args.update_baseline else args.repeat
+    results = run_benchmarks(args.names, repeat, args.min_time)
+    if not args.json:
+        for name, nanoseconds in results.items():
+            print(f"{name:>16}: {nanoseconds:12.0f} ns", file=out)
+    if args.output:
+        args.output.write_text(json.dumps(report(results), indent=2))
+    regressions = []
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report(results), indent=2))
+    elif not args.baseline.exists():
+        if not args.json:
+            print(f"no baseline at {args.baseline}, skipping comparison", file=out)
+    else:
+        regressions = compare(results, json.loads(args.baseline.read_text())['results'], args.threshold)
+
+    if args.json:
+        print(json.dumps({**report(results), 'regressions': [str(regression) for regression in regressions]}),
+              file=out)
+    else:
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, used REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+'''
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class MatchupCache:
+    """Persistent least-recently-used cache of matchup results, e.g. keyed by :func:`definition_hash`.
+
+    Entries live in an SQLite database in WAL mode, so processes on one
+    host can read and write it concurrently, and at most ``maxsize``
+    of them are kept: every :meth:`put` evicts the least recently read or
+    written ones beyond that. A key hashes the full creature and move
+    definitions with the simulation settings and the engine version, so
+    editing any of them or upgrading to an engine that plays differently
+    makes new keys and the old entries just age out. Values are pickled.
+    It has the same ``get``/``put``/``save`` interface as
+    :class:`battlesys.sweep.SweepCache`. The hit, miss and eviction
+    counters are this process's, see :meth:`cache_info`.
+    """
+
+    def __init__(self, path: str | os.PathLike, maxsize: int = 100_000, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.hits = self.misses = self.evictions = 0
+        self._connection: sqlite3.Connection | None = None
+        self._pid = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, '_connection': None}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # a connection must not cross a fork, so every process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(_SCHEMA)
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Any | None:
+        connection = self.connection
+        row = connection.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        connection.execute('UPDATE entries SET used = ? WHERE key = ?', (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        with self.connection as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            connection.execute('INSERT OR REPLACE INTO entries (key, value, used) VALUES (?, ?, ?)',
+                               (key, pickle.dumps(value), time.time()))
+            excess = connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0] - self.maxsize
+            if excess > 0:
+                connection.execute('DELETE FROM entries WHERE key IN '
+                                   '(SELECT key FROM entries ORDER BY used LIMIT ?)', (excess,))
+                self.evictions += excess
+
+    def save(self) -> None:
+        """Every :meth:`put` is already committed; kept for the :class:`SweepCache` interface."""
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.connection.execute('SELECT 1 FROM entries WHERE key = ?', (key,)).fetchone() is not None
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self))
+
+    def cache_clear(self) -> None:
+        self.connection.execute('DELETE FROM entries')
+        self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
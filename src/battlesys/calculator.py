@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from math import comb, floor
+from typing import Iterator, Sequence
+
+from battlesys.definitions import Creature, MovePos, StatsName, modifier_factor
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+Stages = Sequence[int] | None
+
+
+def damage_value(level: int, power: int, attack: int, defense: int, attack_stage: int, defense_stage: int) -> int:
+    """What :meth:`Move.build_damage` deals without a critical hit, from base stats and their stages."""
+    if not power:
+        return 0
+    atk2def = int(attack * modifier_factor(attack_stage)) / int(defense * modifier_factor(defense_stage))
+    basis = (2 * level / 5) + 2
+    return max(1, int(2 + (basis * power * atk2def / 50)))
+
+
+def hit_probability(move_rate: int, caster_accuracy: int, target_evasiveness: int) -> float:
+    """Exact probability that :func:`battlesys.definitions.is_a_hit` returns ``True``."""
+    if not move_rate:
+        return 0.0
+    adjusted_hit_rate = move_rate * (modifier_factor(caster_accuracy) / modifier_factor(target_evasiveness))
+    return min(100, max(0, floor(adjusted_hit_rate))) / 100
+
+
+def ko_probabilities(hits_to_ko: int | None, probability: float, uses: int) -> tuple[float, ...]:
+    """Probability of landing at least ``hits_to_ko`` hits within 1, 2, ... ``uses`` casts."""
+    if hits_to_ko is None:
+        return (0.0,) * uses
+    return tuple(sum(comb(n, k) * probability ** k * (1 - probability) ** (n - k) for k in range(hits_to_ko, n + 1))
+                 for n in range(1, uses + 1))
+
+
+@dataclass(frozen=True)
+class MatrixEntry:
+    move_pos: MovePos
+    attack_stage: int
+    defense_stage: int
+    accuracy_stage: int
+    evasion_stage: int
+    damage: int
+    hit_probability: float
+    hits_to_ko: int | None
+    ko_probabilities: tuple[float, ...]
+
+    @property
+    def key(self) -> tuple[MovePos, int, int, int, int]:
+        return self.move_pos, self.attack_stage, self.defense_stage, self.accuracy_stage, self.evasion_stage
+
+
+class DamageMatrix:
+    """One :class:`MatrixEntry` per move and combination of stages, indexed by :attr:`MatrixEntry.key`."""
+
+    def __init__(self, entries: Sequence[MatrixEntry]) -> None:
+        self.entries = tuple(entries)
+        self._index = {entry.key: entry for entry in self.entries}
+
+    def __getitem__(self, key: tuple[MovePos, int, int, int, int]) -> MatrixEntry:
+        return self._index[key]
+
+    def __iter__(self) -> Iterator[MatrixEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def damage_range(self, move_pos: MovePos) -> tuple[int, int]:
+        damages = [entry.damage for entry in self.entries if entry.move_pos == move_pos]
+        return min(damages), max(damages)
+
+
+class DamageCalculator:
+    """Damage, hit and KO figures for every move of a caster against a target.
+
+    Each figure is memoized on its inputs (level, power, base stats and
+    stages for damage) in a bounded LRU cache of ``cache_size`` entries, so
+    repeated queries from AI or UI code become table lookups.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.damage_value = lru_cache(maxsize=cache_size)(damage_value)
+        self.hit_probability = lru_cache(maxsize=cache_size)(hit_probability)
+        self.ko_probabilities = lru_cache(maxsize=cache_size)(ko_probabilities)
+
+    def cache_info(self) -> dict[str, tuple]:
+        return {name: getattr(self, name).cache_info()
+                for name in ('damage_value', 'hit_probability', 'ko_probabilities')}
+
+    def cache_clear(self) -> None:
+        for name in ('damage_value', 'hit_probability', 'ko_probabilities'):
+            getattr(self, name).cache_clear()
+
+    def matrix(self, caster: Creature, target: Creature, attack_stages: Stages = None,
+               defense_stages: Stages = None, accuracy_stages: Stages = None, evasion_stages: Stages = None,
+               uses: int = 5) -> DamageMatrix:
+        """Every move of ``caster`` against ``target`` over the given stage ranges.
+
+        A range left as ``None`` stays at the creature's current stage: the
+        caster's attack stat and the target's defense stat are the ones each
+        move's nature reads. KO probabilities are for the target's current
+        health and 1 to ``uses`` casts.
+        """
+        entries = []
+        for move_pos, move in caster.moves.items():
+            power = move.damage.power if move.damage is not None else 0
+            atk_stat, def_stat = move.damage.stats if power else (StatsName.ATK, StatsName.DFN)
+            stage_ranges = (_stages(attack_stages, caster, atk_stat), _stages(defense_stages, target, def_stat),
+                            _stages(accuracy_stages, caster, StatsName.ACC),
+                            _stages(evasion_stages, target, StatsName.EVA))
+            for atk_stage, def_stage, acc_stage, eva_stage in product(*stage_ranges):
+                damage = (self.damage_value(caster.level, power, caster.stats[atk_stat], target.stats[def_stat],
+                                            atk_stage, def_stage) if power else 0)
+                probability = self.hit_probability(move.hit_rate, acc_stage, eva_stage)
+                hits_to_ko = -(-target.health // damage) if damage else None
+                entries.append(MatrixEntry(move_pos, atk_stage, def_stage, acc_stage, eva_stage, damage, probability,
+                                           hits_to_ko, self.ko_probabilities(hits_to_ko, probability, uses)))
+        return DamageMatrix(entries)
+
+
+def _stages(stages: Stages, creature: Creature, stat: StatsName) -> Sequence[int]:
+    return (creature.stats_modifiers.get(stat, 0),) if stages is None else stages
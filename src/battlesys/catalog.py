@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import marshal
+import os
+import re
+from contextlib import suppress
+from dataclasses import FrozenInstanceError
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+from battlesys.definitions import Condition, Creature, Damage, Move, MovePos, Nature, StatsAlteration, StatsName
+
+
+DEFAULT_CATALOG = Path(__file__).parent / 'data' / 'moves.jsonl'
+DEFAULT_ROSTER = Path(__file__).parent / 'data' / 'creatures.jsonl'
+CACHE_SUFFIX = '.idx'
+_CACHE_VERSION = 1
+
+_FIELDS = frozenset({'id', 'name', 'hit_rate', 'damage', 'alteration', 'alteration_rate', 'condition',
+                     'condition_rate', 'description'})
+_ID = re.compile(rb'"id"\s*:\s*"([^"\\]+)"')
+
+Index = dict[str, tuple[int, int]]
+
+
+class CatalogError(ValueError):
+    def __init__(self, path: str | os.PathLike, line: int | None, message: str) -> None:
+        self.path = path
+        self.line = line
+        self.message = message
+
+    def __str__(self) -> str:
+        where = str(self.path) if self.line is None else f"{self.path}:{self.line}"
+        return f"{where}: {self.message}"
+
+
+class UnknownMoveError(KeyError):
+    def __init__(self, move_id: str) -> None:
+        self.move_id = move_id
+
+    def __str__(self) -> str:
+        return f"No move {self.move_id!r} in the catalog"
+
+
+class CatalogMove(Move):
+    """A :class:`Move` that cannot be changed once built, so one instance can be shared."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, '_sealed', True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get('_sealed'):
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+_INTERNED: dict = {}
+
+
+def _intern(value: Damage | StatsAlteration | Condition) -> Damage | StatsAlteration | Condition:
+    return _INTERNED.setdefault(value, value)
+
+
+def _alteration(data: Mapping[str, Any] | None) -> StatsAlteration | None:
+    return None if data is None else _intern(StatsAlteration(StatsName(data['stats']), int(data['count'])))
+
+
+def move_from_dict(data: Mapping[str, Any]) -> CatalogMove:
+    """Builds a move from one catalog entry, sharing equal damages, alterations and conditions."""
+    unknown = data.keys() - _FIELDS
+    if unknown:
+        raise ValueError(f"unknown fields {sorted(unknown)}")
+    damage, condition = data.get('damage'), data.get('condition')
+    return CatalogMove(
+        name=str(data['name']),
+        hit_rate=int(data.get('hit_rate', 0)),
+        damage=None if damage is None else _intern(Damage(power=int(damage['power']),
+                                                          nature=Nature(damage['nature']))),
+        alteration=_alteration(data.get('alteration')),
+        alteration_rate=int(data.get('alteration_rate', 0)),
+        condition=None if condition is None else _intern(Condition(name=str(condition['name']),
+                                                                   damage=int(condition.get('damage', 0)),
+                                                                   alteration=_alteration(condition.get('alteration')),
+                                                                   period=int(condition.get('period', 1)),
+                                                                   duration=int(condition.get('duration', 3)))),
+        condition_rate=int(data.get('condition_rate', 0)),
+        description=str(data.get('description', '')),
+    )
+
+
+def cache_dir() -> Path:
+    """Home of the indexes of read-only catalogs: ``$XDG_CACHE_HOME/battlesys``, by default ``~/.cache/battlesys``."""
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'battlesys'
+
+
+def _cache_path(path: Path) -> Path:
+    if os.access(path.parent, os.W_OK):
+        return path.with_name(path.name + CACHE_SUFFIX)
+    # e.g. the packaged catalog of a system-wide install
+    digest = hashlib.sha256(os.fsencode(path.resolve())).hexdigest()[:16]
+    return cache_dir() / f"{path.name}.{digest}{CACHE_SUFFIX}"
+
+
+def _scan(path: Path) -> Index:
+    """``id -> (offset, length)`` of every entry line, without parsing the entries."""
+    index: Index = {}
+    offset = 0
+    with open(path, 'rb') as file:
+        for number, line in enumerate(file, 1):
+            if line.strip():
+                match = _ID.search(line)
+                if match is None:
+                    raise CatalogError(path, number, 'entry has no "id"')
+                move_id = match.group(1).decode()
+                if move_id in index:
+                    raise CatalogError(path, number, f"duplicate id {move_id!r}")
+                index[move_id] = (offset, len(line))
+            offset += len(line)
+    return index
+
+
+class MoveCatalog(Mapping[str, Move]):
+    """Moves read from a JSON Lines file, one entry per line, looked up by ``id``.
+
+    Only the id index is built up front; an entry is parsed the first time it
+    is looked up and the resulting :class:`CatalogMove` is kept, so every
+    lookup of an id returns the same object. The index is stored next to the
+    catalog (``<catalog>.idx``), or under :func:`cache_dir` when the catalog's
+    directory is not writable, and reused while the catalog file is unchanged.
+    """
+
+    def __init__(self, path: str | os.PathLike = DEFAULT_CATALOG, cache: bool = True) -> None:
+        self.path = Path(path)
+        self.cache_path = _cache_path(self.path) if cache else None
+        self._index = self._load_index()
+        self._moves: dict[str, CatalogMove] = {}
+
+    def _signature(self) -> tuple[int, int, int]:
+        stat = os.stat(self.path)
+        return _CACHE_VERSION, stat.st_size, stat.st_mtime_ns
+
+    def _load_index(self) -> Index:
+        signature = self._signature()
+        if self.cache_path is None:
+            return _scan(self.path)
+        try:
+            cached_signature, index = marshal.loads(self.cache_path.read_bytes())
+            if tuple(cached_signature) == signature:
+                return index
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        index = _scan(self.path)
+        temporary = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_bytes(marshal.dumps((signature, index)))
+            os.replace(temporary, self.cache_path)
+        except OSError:
+            # without a writable cache the catalog still works, it just rescans on every load
+            with suppress(OSError):
+                temporary.unlink(missing_ok=True)
+        return index
+
+    def __getitem__(self, move_id: str) -> CatalogMove:
+        move = self._moves.get(move_id)
+        if move is None:
+            move = self._moves[move_id] = self._parse(move_id)
+        return move
+
+    def _parse(self, move_id: str) -> CatalogMove:
+        try:
+            offset, length = self._index[move_id]
+        except KeyError:
+            raise UnknownMoveError(move_id) from None
+        with open(self.path, 'rb') as file:
+            file.seek(offset)
+            line = file.read(length)
+        try:
+            data = json.loads(line)
+            if data.get('id') != move_id:
+                raise ValueError(f"entry id {data.get('id')!r} does not match the index, the cache is stale")
+            return move_from_dict(data)
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            raise CatalogError(self.path, None, f"move {move_id!r}: {error}") from error
+
+    def __contains__(self, move_id: object) -> bool:
+        return move_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+@lru_cache
+def load_catalog(path: str | os.PathLike = DEFAULT_CATALOG) -> MoveCatalog:
+    """The shared catalog for ``path``, built once per process."""
+    return MoveCatalog(path)
+
+
+def creature_from_dict(data: Mapping[str, Any], moves: Mapping[str, Move]) -> Creature:
+    """Builds a full-health creature from one roster entry whose moves are catalog ids by position."""
+    stats = {StatsName.EVA: 0, StatsName.ACC: 0,
+             **{StatsName(stat): int(value) for stat, value in data['stats'].items()}}
+    max_health = int(data['max_health'])
+    return Creature(name=str(data['name']), level=int(data.get('level', 5)), max_health=max_health,
+                    health=max_health, stats=stats,
+                    moves={MovePos(int(pos)): moves[move_id] for pos, move_id in data['moves'].items()})
+
+
+def load_roster(path: str | os.PathLike = DEFAULT_ROSTER,
+                moves: Mapping[str, Move] | None = None) -> dict[str, Creature]:
+    """Creatures of a JSON Lines roster by ``id``, with their moves looked up in ``moves`` (the default catalog)."""
+    moves = load_catalog() if moves is None else moves
+    roster = {}
+    with open(path, 'rb') as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                roster[str(data['id'])] = creature_from_dict(data, moves)
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                raise CatalogError(path, number, str(error)) from error
+    return roster
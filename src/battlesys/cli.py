@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Only the standard library is imported up front: every subcommand imports the
+# subsystems it needs when it runs, so a short job pays for nothing it does not use.
+
+import argparse
+import json
+import shlex
+import sys
+from typing import TYPE_CHECKING, Any, Sequence, TextIO
+
+if TYPE_CHECKING:
+    from battlesys.definitions import Creature
+    from battlesys.montecarlo import MatchupResult
+
+
+# rosters by (roster, catalog) path, loaded once per process so that batch jobs share them
+_rosters: dict[tuple[str | None, str | None], dict] = {}
+
+
+def _roster(args: argparse.Namespace) -> dict:
+    roster = _rosters.get((args.roster, args.catalog))
+    if roster is None:
+        from battlesys.catalog import DEFAULT_CATALOG, DEFAULT_ROSTER, MoveCatalog, load_roster
+        roster = _rosters[args.roster, args.catalog] = load_roster(args.roster or DEFAULT_ROSTER,
+                                                                   MoveCatalog(args.catalog or DEFAULT_CATALOG))
+    return roster
+
+
+def _creatures(args: argparse.Namespace) -> tuple:
+    roster = _roster(args)
+    try:
+        return roster[args.first], roster[args.second]
+    except KeyError as missing:
+        raise SystemExit(f"unknown creature {missing}, the roster has {', '.join(roster)}") from None
+
+
+def _matchup(args: argparse.Namespace, first: 'Creature', second: 'Creature') -> 'MatchupResult':
+    if args.job is not None:
+        from battlesys.distributed import JobSpec, run_job
+        return run_job(args.job, JobSpec(first, second, args.battles, seed=args.seed, max_turns=args.max_turns,
+                                         shard_size=args.shard_size), workers=args.workers, lease=args.lease)
+    from battlesys.montecarlo import simulate_matchup
+    return simulate_matchup(first, second, args.battles, workers=args.workers, seed=args.seed,
+                            max_turns=args.max_turns)
+
+
+def _simulate(args: argparse.Namespace, out: TextIO) -> int:
+    first, second = _creatures(args)
+    if args.cache is None:
+        result = _matchup(args, first, second)
+    else:
+        from battlesys.cache import MatchupCache
+        from battlesys.hashing import definition_hash
+        cache = MatchupCache(args.cache)
+        key = definition_hash('simulate', first, second, args.battles, args.seed, args.max_turns)
+        result = cache.get(key)
+        if result is None:
+            result = _matchup(args, first, second)
+            cache.put(key, result)
+        cache.close()
+    _emit(out, {'first': args.first, 'second': args.second, 'battles': result.battles, 'wins': result.wins,
+                'draws': result.draws, 'win_rate': result.win_rate(0), 'mean_turns': result.mean_turns})
+    return 0
+
+
+def _replay(args: argparse.Namespace, out: TextIO) -> int:
+    from battlesys.eventlog import EventReader
+    if args.verify:
+        from battlesys.battle import Battle, fresh_creature
+        from battlesys.eventlog import verify_replay
+        from battlesys.rng import BattleRNG
+        args.first, args.second = args.verify
+        first, second = _creatures(args)
+        mismatches = verify_replay(args.log, lambda battle_id: Battle(
+            fresh_creature(first), fresh_creature(second), rng=BattleRNG.stream(args.seed, battle_id),
+            max_turns=args.max_turns))
+        _emit(out, {'log': args.log, 'mismatches': mismatches})
+        return 1 if mismatches else 0
+    with EventReader(args.log) as reader:
+        for event in reader:
+            if args.battle is None or event.battle == args.battle:
+                _emit(out, {'battle': event.battle, 'turn': event.turn, 'caster': event.caster,
+                            'move': int(event.move_pos), 'result': str(event.result), 'damage': event.damage,
+                            'alteration': None if event.alteration is None else
+                            [str(event.alteration[0]), event.alteration[1]],
+                            'condition': event.condition})
+    return 0
+
+
+def _worker(args: argparse.Namespace, out: TextIO) -> int:
+    from battlesys.distributed import work
+    _emit(out, {'job': args.job, 'shards': work(args.job, lease=args.lease, max_attempts=args.max_attempts)})
+    return 0
+
+
+def _bench(args: argparse.Namespace, out: TextIO) -> int:
+    from battlesys.bench import main
+    return main([*args.bench_args, '--json'], out)
+
+
+def _emit(out: TextIO, record: dict[str, Any]) -> None:
+    out.write(json.dumps(record) + '\n')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='battlesys', description="Battle simulation jobs.")
+    parser.add_argument('--stdin-batch', action='store_true',
+                        help="read one subcommand line per job from stdin and answer one JSON line each")
+    commands = parser.add_subparsers(dest='command')
+
+    simulate = commands.add_parser('simulate', help="Monte Carlo win rates of a matchup")
+    simulate.add_argument('first')
+    simulate.add_argument('second')
+    simulate.add_argument('-n', '--battles', type=int, default=1000)
+    simulate.add_argument('--seed', type=int, default=0)
+    simulate.add_argument('--workers', type=int, default=1)
+    simulate.add_argument('--job', help="run as a resumable sharded job in this directory, which `battlesys worker` "
+                                        "processes on other hosts can join")
+    simulate.add_argument('--shard-size', type=int, default=1000)
+    simulate.add_argument('--cache', help="SQLite file of results kept across runs, keyed by the matchup's definitions")
+    simulate.set_defaults(handler=_simulate)
+
+    replay = commands.add_parser('replay', help="print or verify a binary event log")
+    replay.add_argument('log')
+    replay.add_argument('--battle', type=int, help="only this battle's events")
+    replay.add_argument('--verify', nargs=2, metavar=('FIRST', 'SECOND'),
+                        help="re-run every battle as FIRST vs SECOND on BattleRNG.stream(seed, battle id)")
+    replay.add_argument('--seed', type=int, default=0)
+    replay.set_defaults(handler=_replay)
+
+    worker = commands.add_parser('worker', help="work on the shards of a `simulate --job` directory until it is done")
+    worker.add_argument('job')
+    worker.add_argument('--max-attempts', type=int, default=3)
+    worker.set_defaults(handler=_worker)
+
+    for command in (simulate, worker):
+        command.add_argument('--lease', type=float, default=60.0,
+                             help="seconds after which a shard claimed by a silent worker is retried")
+
+    for command in (simulate, replay):
+        command.add_argument('--max-turns', type=int, default=100)
+        command.add_argument('--roster', help="JSON Lines roster (default: the packaged one)")
+        command.add_argument('--catalog', help="JSON Lines move catalog (default: the packaged one)")
+
+    # listed for --help only, the arguments are handed to battlesys.bench as they are, see _parse
+    commands.add_parser('bench', help="hot-path benchmarks, see `battlesys bench --help`", add_help=False)
+    return parser
+
+
+def _parse(parser: argparse.ArgumentParser, argv: Sequence[str]) -> argparse.Namespace:
+    if argv[:1] == ['bench']:
+        return argparse.Namespace(command='bench', handler=_bench, bench_args=list(argv[1:]), stdin_batch=False)
+    return parser.parse_args(argv)
+
+
+def _batch(parser: argparse.ArgumentParser, lines: TextIO, out: TextIO) -> int:
+    failures = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            args = _parse(parser, shlex.split(line))
+            if args.command is None:
+                raise SystemExit('missing subcommand')
+            failures += bool(args.handler(args, out))
+        except SystemExit as error:
+            failures += 1
+            _emit(out, {'error': error.code if isinstance(error.code, str) else 'invalid job', 'job': line.strip()})
+        except Exception as error:
+            failures += 1
+            _emit(out, {'error': f'{type(error).__name__}: {error}', 'job': line.strip()})
+        out.flush()
+    return 1 if failures else 0
+
+
+def main(argv: Sequence[str] | None = None, stdin: TextIO | None = None, stdout: TextIO | None = None) -> int:
+    parser = build_parser()
+    args = _parse(parser, sys.argv[1:] if argv is None else list(argv))
+    out = sys.stdout if stdout is None else stdout
+    if args.stdin_batch:
+        return _batch(parser, sys.stdin if stdin is None else stdin, out)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    return args.handler(args, out)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
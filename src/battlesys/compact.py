@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from typing import Callable, Iterable, Iterator
+
+from battlesys.definitions import (Creature, Move, MoveEffect, MovePos, ResultType, StatsName,
+                                   modifier_factor)
+
+
+STATS: tuple[StatsName, ...] = tuple(StatsName)
+STAT_POSITION: dict[StatsName, int] = {stat: pos for pos, stat in enumerate(STATS)}
+STATS_COUNT = len(STATS)
+
+# base stat slot of a stat the creature does not have
+MISSING = -2 ** 31
+
+_FACTORS = {count: modifier_factor(count) for count in range(-6, 7)}
+
+
+class CreatureTable:
+    """Struct-of-arrays storage for many creatures.
+
+    Every column is a flat :class:`array.array`; base stats and modifier stages
+    take :data:`STATS_COUNT` consecutive slots per creature, ordered as
+    :data:`STATS`, and a stat the creature does not have holds :data:`MISSING`.
+    Rows are handed out as :class:`CompactCreature` views.
+    """
+
+    __slots__ = ('names', 'levels', 'max_health', 'health', 'stats', 'stages', 'moves')
+
+    def __init__(self, creatures: Iterable[Creature] = ()) -> None:
+        self.names: list[str] = []
+        self.levels = array('i')
+        self.max_health = array('i')
+        self.health = array('i')
+        self.stats = array('i')
+        self.stages = array('i')
+        self.moves: list[dict[MovePos, Move]] = []
+        for creature in creatures:
+            self.append(creature)
+
+    def append(self, creature: Creature) -> int:
+        row = len(self.names)
+        self.names.append(creature.name)
+        self.levels.append(creature.level)
+        self.max_health.append(creature.max_health)
+        self.health.append(creature.health)
+        stats, modifiers = creature.stats, creature.stats_modifiers
+        self.stats.extend(stats[stat] if stat in stats else MISSING for stat in STATS)
+        self.stages.extend(modifiers[stat] if stat in stats else 0 for stat in STATS)
+        self.moves.append(creature.moves)
+        return row
+
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column)
+                   for column in (self.levels, self.max_health, self.health, self.stats, self.stages))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, row: int) -> 'CompactCreature':
+        if not 0 <= row < len(self.names):
+            raise IndexError(row)
+        return CompactCreature(self, row)
+
+    def __iter__(self) -> Iterator['CompactCreature']:
+        return (CompactCreature(self, row) for row in range(len(self.names)))
+
+
+class CompactCreature:
+    """Slotted view over one :class:`CreatureTable` row with the :class:`Creature` combat API."""
+
+    __slots__ = ('table', 'row', '_offset')
+
+    def __init__(self, table: CreatureTable, row: int) -> None:
+        self.table = table
+        self.row = row
+        self._offset = row * STATS_COUNT
+
+    @classmethod
+    def from_creature(cls, creature: Creature) -> 'CompactCreature':
+        return cls(CreatureTable([creature]), 0)
+
+    @property
+    def name(self) -> str:
+        return self.table.names[self.row]
+
+    @property
+    def level(self) -> int:
+        return self.table.levels[self.row]
+
+    @property
+    def max_health(self) -> int:
+        return self.table.max_health[self.row]
+
+    @property
+    def health(self) -> int:
+        return self.table.health[self.row]
+
+    @health.setter
+    def health(self, value: int) -> None:
+        self.table.health[self.row] = value
+
+    @property
+    def moves(self) -> dict[MovePos, Move]:
+        return self.table.moves[self.row]
+
+    @property
+    def stats(self) -> dict[StatsName, int]:
+        offset = self._offset
+        return {stat: base for stat, base in zip(STATS, self.table.stats[offset:offset + STATS_COUNT])
+                if base != MISSING}
+
+    @property
+    def stats_modifiers(self) -> dict[StatsName, int]:
+        offset = self._offset
+        return {stat: stage for stat, base, stage in zip(STATS, self.table.stats[offset:offset + STATS_COUNT],
+                                                         self.table.stages[offset:offset + STATS_COUNT])
+                if base != MISSING}
+
+    def current_stats(self, stat_name: StatsName) -> int:
+        return _READERS[stat_name](self)
+
+    def apply(self, effect: MoveEffect) -> ResultType:
+        if (effect.result is ResultType.HIT):
+            if effect.damage:
+                self.table.health[self.row] -= effect.damage
+            if effect.alteration:
+                slot = self._offset + STAT_POSITION[effect.alteration.stats]
+                if self.table.stats[slot] == MISSING:
+                    raise KeyError(effect.alteration.stats)
+                self.table.stages[slot] += effect.alteration.count
+        return effect.result
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(name={self.name!r}, level={self.level}, "
+                f"max_health={self.max_health}, health={self.health}, stats={self.stats})")
+
+
+def _health(creature: CompactCreature) -> int:
+    return creature.table.health[creature.row]
+
+
+def _stage_reader(stat: StatsName) -> Callable[[CompactCreature], int]:
+    position = STAT_POSITION[stat]
+
+    def read(creature: CompactCreature) -> int:
+        slot = creature._offset + position
+        if creature.table.stats[slot] == MISSING:
+            raise KeyError(stat)
+        return creature.table.stages[slot]
+    return read
+
+
+def _stat_reader(stat: StatsName) -> Callable[[CompactCreature], int]:
+    position = STAT_POSITION[stat]
+
+    def read(creature: CompactCreature) -> int:
+        slot = creature._offset + position
+        table = creature.table
+        base = table.stats[slot]
+        if base == MISSING:
+            raise KeyError(stat)
+        stage = table.stages[slot]
+        factor = _FACTORS[stage] if -6 <= stage <= 6 else modifier_factor(stage)
+        return int(base * factor)
+    return read
+
+
+# one reader per stat, so current_stats neither looks up the position nor branches on the kind of stat
+_READERS: dict[StatsName, Callable[[CompactCreature], int]] = {
+    stat: _health if stat is StatsName.HP else
+    _stage_reader(stat) if stat in (StatsName.EVA, StatsName.ACC) else _stat_reader(stat)
+    for stat in STATS}
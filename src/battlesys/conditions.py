@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+from battlesys.definitions import Condition, Creature, MoveEffect, ResultType
+
+
+Tick = tuple[Creature, Condition, MoveEffect]
+
+
+class Affliction:
+    """One active :class:`Condition` on one creature."""
+
+    __slots__ = ('creature', 'condition', 'remaining', 'active')
+
+    def __init__(self, creature: Creature, condition: Condition) -> None:
+        self.creature = creature
+        self.condition = condition
+        self.remaining = condition.duration
+        self.active = True
+
+
+class ConditionScheduler:
+    """Bucketed tick queue of recurring condition effects.
+
+    Every affliction waits in the bucket of the tick it is next due, so
+    :meth:`tick` only touches the creatures with an effect due on that tick
+    and costs nothing per unafflicted creature. Each due effect is applied
+    through :meth:`Creature.apply` as a hit carrying the condition's damage
+    and alteration. A creature holds at most one affliction per condition
+    name; afflicting it again restarts the condition.
+    """
+
+    __slots__ = ('now', '_buckets', '_active')
+
+    def __init__(self, now: int = 0) -> None:
+        self.now = now
+        self._buckets: dict[int, list[Affliction]] = {}
+        self._active: dict[int, dict[str, Affliction]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(afflictions) for afflictions in self._active.values())
+
+    def _schedule(self, affliction: Affliction, due: int) -> None:
+        bucket = self._buckets.get(due)
+        if bucket is None:
+            self._buckets[due] = [affliction]
+        else:
+            bucket.append(affliction)
+
+    def afflict(self, creature: Creature, condition: Condition) -> Affliction:
+        afflictions = self._active.setdefault(id(creature), {})
+        previous = afflictions.get(condition.name)
+        if previous is not None:
+            previous.active = False
+        affliction = afflictions[condition.name] = Affliction(creature, condition)
+        self._schedule(affliction, self.now + condition.period)
+        return affliction
+
+    def cure(self, creature: Creature, name: str | None = None) -> int:
+        """Ends ``creature``'s condition called ``name``, or all of them; returns how many ended."""
+        afflictions = self._active.get(id(creature))
+        if not afflictions:
+            return 0
+        cured = list(afflictions) if name is None else [name] if name in afflictions else []
+        for cured_name in cured:
+            afflictions.pop(cured_name).active = False
+        if not afflictions:
+            del self._active[id(creature)]
+        return len(cured)
+
+    def conditions_of(self, creature: Creature) -> list[Condition]:
+        return [affliction.condition for affliction in self._active.get(id(creature), {}).values()]
+
+    def tick(self) -> list[Tick]:
+        """Advances one tick and applies every effect due on it."""
+        self.now = now = self.now + 1
+        bucket = self._buckets.pop(now, None)
+        if bucket is None:
+            return []
+        ticks = []
+        for affliction in bucket:
+            if not affliction.active:
+                continue
+            creature, condition = affliction.creature, affliction.condition
+            effect = MoveEffect(damage=condition.damage, alteration=condition.alteration, result=ResultType.HIT)
+            creature.apply(effect)
+            ticks.append((creature, condition, effect))
+            affliction.remaining -= 1
+            if affliction.remaining > 0:
+                self._schedule(affliction, now + condition.period)
+            else:
+                self.cure(creature, condition.name)
+        return ticks
+
+    def advance(self, ticks: int) -> list[Tick]:
+        return [applied for _ in range(ticks) for applied in self.tick()]
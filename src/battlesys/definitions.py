@@ -5,6 +5,8 @@ import random
 from dataclasses import dataclass, field
 from enum import IntEnum, StrEnum, auto
 
+from battlesys.rng import BattleRNG
+
 
 class MovePos(IntEnum):
     FIRST = 1
@@ -50,17 +52,27 @@ class InvalidNatureError(Exception):
     def __str__(self) -> str:
         return f"The nature {self.nature} is not valid. Only possible values are {list(Nature)}"
 
-@dataclass
+@dataclass(frozen=True)
 class StatsAlteration:
     stats: StatsName
     count: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class Condition:
+    """A recurring effect applied every ``period`` turns, ``duration`` times."""
     name: str
     damage: int
-    alteration: StatsAlteration
+    alteration: StatsAlteration | None
+    period: int = 1
+    duration: int = 3
+
+    def __post_init__(self) -> None:
+        # a period under 1 would schedule the tick at or before now, where it never fires
+        if self.period < 1:
+            raise ValueError(f"condition {self.name!r} needs a period of at least 1, not {self.period}")
+        if self.duration < 1:
+            raise ValueError(f"condition {self.name!r} needs a duration of at least 1, not {self.duration}")
 
 
 @lru_cache
@@ -68,7 +80,7 @@ def _stats_by_nature() -> dict[Nature, tuple[StatsName, StatsName]]:
     return {Nature.PHYSICAL : (StatsName.ATK, StatsName.DFN),
             Nature.MAGICAL: (StatsName.SAT, StatsName.SDF)}
 
-@dataclass
+@dataclass(frozen=True)
 class Damage:
     _stats: dict[Nature, tuple[StatsName, StatsName]] = field(default_factory=_stats_by_nature, init=False, repr=False, compare=False)
     power: int
@@ -104,8 +116,8 @@ class Move:
 
     description: str = ''
 
-    def effect(self, caster: 'Creature', target: 'Creature') -> MoveEffect:
-        result = self.hit_or_miss(caster, target)
+    def effect(self, caster: 'Creature', target: 'Creature', rng: BattleRNG | None = None) -> MoveEffect:
+        result = self.hit_or_miss(caster, target, rng)
 
         if result is not ResultType.HIT:
             return MoveEffect(result=result)
@@ -114,20 +126,27 @@ class Move:
         if critical:
             result = ResultType.CRIT
 
-        alteration = self.alteration if is_a_hit(self.alteration_rate, 0, 0) else None
+        alteration = (self.alteration
+                      if self.alteration is not None and is_a_hit(self.alteration_rate, 0, 0, rng)
+                      else None)
+        condition = (self.condition
+                     if self.condition is not None and is_a_hit(self.condition_rate, 0, 0, rng)
+                     else None)
 
         _effect = MoveEffect(result=result,
                              damage=damage,
-                             alteration=alteration)
+                             alteration=alteration,
+                             condition=condition)
         return _effect
 
-    def hit_or_miss(self, caster: 'Creature', target: 'Creature') -> ResultType:
+    def hit_or_miss(self, caster: 'Creature', target: 'Creature', rng: BattleRNG | None = None) -> ResultType:
         hit_result = (
             ResultType.HIT
-            if is_a_hit(self.hit_rate,
-                        caster.current_stats(StatsName.ACC),
-                        target.current_stats(StatsName.EVA))
-                or (target is caster)
+            if (target is caster)
+                or is_a_hit(self.hit_rate,
+                            caster.current_stats(StatsName.ACC),
+                            target.current_stats(StatsName.EVA),
+                            rng)
             else ResultType.MISS
         )
         return hit_result
@@ -150,12 +169,18 @@ def _calc_critical() -> bool:
     return False
 
 
-def is_a_hit(move_rate: int, caster_accuracy: int, target_evasiveness: int) -> bool:
+def is_a_hit(move_rate: int, caster_accuracy: int, target_evasiveness: int, rng: BattleRNG | None = None) -> bool:
     if not move_rate:
         return False
     evade_accuracy_mod_ratio = modifier_factor(caster_accuracy) / modifier_factor(target_evasiveness)
     adjusted_hit_rate = move_rate * evade_accuracy_mod_ratio
-    return (random.randint(1, 100) <= adjusted_hit_rate)
+    if adjusted_hit_rate >= 100:
+        return True
+    roll = random.randint(1, 100) if rng is None else rng.roll()
+    return (roll <= adjusted_hit_rate)
+
+
+_STAGE_ONLY_STATS = frozenset({StatsName.EVA, StatsName.ACC})
 
 
 @dataclass
@@ -176,7 +201,7 @@ class Creature:
     def current_stats(self, stat_name: StatsName) -> int:
         if stat_name == StatsName.HP:
             return self.health
-        if stat_name in [StatsName.EVA, StatsName.ACC]:
+        if stat_name in _STAGE_ONLY_STATS:
             return self.stats_modifiers[stat_name]
         base = self.stats[stat_name]
         modifiers_count = self.stats_modifiers[stat_name]
@@ -201,6 +226,13 @@ def sign(number: int | float) -> int:
     return 0
 
 
+def _modifier_factor(modifiers_count: int) -> float:
+    return (1 + 0.5 * min(6, abs(modifiers_count))) ** sign(modifiers_count)
+
+
+_MODIFIER_FACTORS = {count: _modifier_factor(count) for count in range(-6, 7)}
+
+
 def modifier_factor(modifiers_count: int) -> float:
     """Produces the following pattern for :param:`modifiers_count`
 
@@ -221,10 +253,12 @@ def modifier_factor(modifiers_count: int) -> float:
 
     The modifier factor cannot consider `abs(modifier_count) > 6`, so a caping
     of `min(6, abs(modifiers_count))` exists within the factor computation.
+    Counts within that range are read from a precomputed table.
 
     :param modifiers_count: total count of modifiers for any stat
     :type modifiers_count: int
     :return: The computed modifier factor for that stat
     :rtype: float
     """
-    return (1 + 0.5 * min(6, abs(modifiers_count))) ** sign(modifiers_count)
+    factor = _MODIFIER_FACTORS.get(modifiers_count)
+    return _modifier_factor(modifiers_count) if factor is None else factor
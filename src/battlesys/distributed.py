@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import pickle
+import socket
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from battlesys.definitions import Creature
+from battlesys.montecarlo import MatchupResult, play_battles
+
+
+# battles played between two lease renewals
+HEARTBEAT_BATTLES = 100
+
+_DIRECTORIES = ('pending', 'claimed', 'done', 'failed')
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    first: Creature
+    second: Creature
+    battles: int
+    seed: int = 0
+    max_turns: int = 100
+    shard_size: int = 1000
+
+    @property
+    def shards(self) -> int:
+        return -(-self.battles // self.shard_size)
+
+    def shard_range(self, index: int) -> tuple[int, int]:
+        start = index * self.shard_size
+        return start, min(self.shard_size, self.battles - start)
+
+
+@dataclass(frozen=True)
+class Shard:
+    index: int
+    attempt: int
+    worker: str
+
+    @property
+    def name(self) -> str:
+        return f'{self.index:06d}.{self.attempt}.{self.worker}'
+
+
+class JobIncomplete(Exception):
+    pass
+
+
+def worker_id(pid: int | None = None) -> str:
+    return f"{socket.gethostname().replace('.', '_')}-{os.getpid() if pid is None else pid}"
+
+
+class JobQueue:
+    """A simulation job split into shards and shared through a directory.
+
+    Every host that can see the directory (e.g. over a network file system)
+    can work on the job. A shard moves from ``pending/`` to ``claimed/`` by an
+    atomic rename, so exactly one worker claims it, and its result is
+    checkpointed to ``done/`` by an atomic replace. A claim is a lease: its
+    file's mtime is renewed while the shard runs, and a claim older than
+    ``lease`` seconds, left by a worker that died, goes back to ``pending/``
+    for another attempt. After ``max_attempts`` a shard is moved to
+    ``failed/``. Since battle ``i`` always plays on ``BattleRNG.stream(seed, i)``,
+    the merged result equals :func:`simulate_matchup` of the same spec.
+    """
+
+    def __init__(self, path: str | os.PathLike, lease: float = 60.0, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._spec: JobSpec | None = None
+
+    @classmethod
+    def create(cls, path: str | os.PathLike, spec: JobSpec, **kwargs) -> 'JobQueue':
+        """Lays out the job at ``path``, or resumes it if it already holds the same spec."""
+        queue = cls(path, **kwargs)
+        for name in _DIRECTORIES:
+            (queue.path / name).mkdir(parents=True, exist_ok=True)
+        spec_path = queue.path / 'spec.pickle'
+        if spec_path.exists():
+            if queue.spec != spec:
+                raise ValueError(f'{queue.path} holds another job')
+            return queue
+        queued = {int(entry.name.split('.')[0]) for name in _DIRECTORIES for entry in (queue.path / name).iterdir()}
+        for index in range(spec.shards):
+            if index not in queued:
+                (queue.path / 'pending' / f'{index:06d}.0').touch()
+        _write_atomic(spec_path, pickle.dumps(spec))
+        queue._spec = spec
+        return queue
+
+    @property
+    def spec(self) -> JobSpec:
+        if self._spec is None:
+            self._spec = pickle.loads((self.path / 'spec.pickle').read_bytes())
+        return self._spec
+
+    def _entries(self, name: str) -> list[str]:
+        return sorted(entry.name for entry in (self.path / name).iterdir() if not entry.name.endswith('.tmp'))
+
+    def _done(self, index: int) -> Path:
+        return self.path / 'done' / f'{index:06d}.pickle'
+
+    def _retry(self, claimed: str) -> None:
+        index, attempt, _ = claimed.split('.', 2)
+        source = self.path / 'claimed' / claimed
+        if self._done(int(index)).exists():
+            source.unlink(missing_ok=True)
+            return
+        attempt = int(attempt) + 1
+        target = 'pending' if attempt < self.max_attempts else 'failed'
+        try:
+            os.rename(source, self.path / target / f'{index}.{attempt}')
+        except FileNotFoundError:
+            # another worker got to it first
+            pass
+
+    def reclaim_expired(self) -> int:
+        """Returns the claims whose lease ran out to ``pending/`` (or ``failed/``)."""
+        expired = 0
+        now = time.time()
+        for claimed in self._entries('claimed'):
+            try:
+                stale = now - (self.path / 'claimed' / claimed).stat().st_mtime > self.lease
+            except FileNotFoundError:
+                continue
+            if stale:
+                self._retry(claimed)
+                expired += 1
+        return expired
+
+    def abandon(self, worker: str) -> int:
+        """Retries the shards claimed by a worker known to be dead without waiting for their leases."""
+        claims = [claimed for claimed in self._entries('claimed') if claimed.split('.', 2)[2] == worker]
+        for claimed in claims:
+            self._retry(claimed)
+        return len(claims)
+
+    def claim(self, worker: str | None = None) -> Shard | None:
+        worker = worker_id() if worker is None else worker
+        self.reclaim_expired()
+        for pending in self._entries('pending'):
+            index, attempt = map(int, pending.split('.'))
+            shard = Shard(index, attempt, worker)
+            try:
+                os.rename(self.path / 'pending' / pending, self.path / 'claimed' / shard.name)
+            except FileNotFoundError:
+                continue
+            if self._done(index).exists():
+                (self.path / 'claimed' / shard.name).unlink(missing_ok=True)
+                continue
+            return shard
+        return None
+
+    def renew(self, shard: Shard) -> None:
+        try:
+            os.utime(self.path / 'claimed' / shard.name)
+        except FileNotFoundError:
+            # the lease ran out and the shard went back to pending; finishing it is still harmless
+            pass
+
+    def complete(self, shard: Shard, result: MatchupResult) -> None:
+        _write_atomic(self._done(shard.index), pickle.dumps(result))
+        (self.path / 'claimed' / shard.name).unlink(missing_ok=True)
+        # a late result still counts if the shard was given up on meanwhile
+        for failed in (self.path / 'failed').glob(f'{shard.index:06d}.*'):
+            failed.unlink(missing_ok=True)
+
+    def release(self, shard: Shard) -> None:
+        """Gives a shard up after an error, counting it as a failed attempt."""
+        self._retry(shard.name)
+
+    def status(self) -> dict[str, int]:
+        return {name: len(self._entries(name)) for name in _DIRECTORIES}
+
+    @property
+    def finished(self) -> bool:
+        status = self.status()
+        return not status['pending'] and not status['claimed']
+
+    def result(self) -> MatchupResult:
+        """The merge of every shard, in order."""
+        total = MatchupResult()
+        for index in range(self.spec.shards):
+            try:
+                total.merge(pickle.loads(self._done(index).read_bytes()))
+            except FileNotFoundError:
+                raise JobIncomplete(f'shard {index} of {self.path} has no result, see {self.status()}') from None
+        return total
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def run_shard(queue: JobQueue, shard: Shard) -> MatchupResult:
+    spec = queue.spec
+    start, count = spec.shard_range(shard.index)
+    result = MatchupResult()
+    for block in range(start, start + count, HEARTBEAT_BATTLES):
+        result.merge(play_battles(spec.first, spec.second, spec.seed, block,
+                                  min(HEARTBEAT_BATTLES, start + count - block), spec.max_turns))
+        queue.renew(shard)
+    return result
+
+
+def work(path: str | os.PathLike, worker: str | None = None, poll: float = 0.5, lease: float = 60.0,
+         max_attempts: int = 3, limit: int | None = None) -> int:
+    """Runs shards of the job at ``path`` until it is finished (or ``limit`` shards are done); returns the count."""
+    queue = JobQueue(path, lease=lease, max_attempts=max_attempts)
+    worker = worker_id() if worker is None else worker
+    completed = 0
+    while limit is None or completed < limit:
+        shard = queue.claim(worker)
+        if shard is None:
+            if queue.finished:
+                break
+            time.sleep(poll)
+            continue
+        try:
+            result = run_shard(queue, shard)
+        except Exception:
+            queue.release(shard)
+            raise
+        queue.complete(shard, result)
+        completed += 1
+    return completed
+
+
+def run_job(path: str | os.PathLike, spec: JobSpec, workers: int | None = None, poll: float = 0.5,
+            lease: float = 60.0, max_attempts: int = 3) -> MatchupResult:
+    """Creates or resumes the job at ``path`` and works on it with ``workers`` local processes.
+
+    Workers on other hosts may join at any time with :func:`work`. A local
+    worker that dies is replaced and its shard is retried right away; a
+    remote one's shard is retried once its lease runs out.
+    """
+    queue = JobQueue.create(path, spec, lease=lease, max_attempts=max_attempts)
+    workers = workers or os.cpu_count() or 1
+    processes: list[multiprocessing.Process] = []
+    try:
+        while not queue.finished:
+            for process in processes:
+                if process.exitcode:
+                    queue.abandon(worker_id(process.pid))
+            processes = [process for process in processes if process.is_alive()]
+            for _ in range(workers - len(processes)):
+                process = multiprocessing.Process(target=work, args=(path,),
+                                                  kwargs={'poll': poll, 'lease': lease, 'max_attempts': max_attempts})
+                process.start()
+                processes.append(process)
+            time.sleep(poll)
+            queue.reclaim_expired()
+    finally:
+        for process in processes:
+            process.join(poll)
+            if process.is_alive():
+                process.terminate()
+    return queue.result()
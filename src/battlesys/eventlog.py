@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Callable, Iterator
+
+from battlesys.action import CastObserver
+from battlesys.battle import Battle
+from battlesys.definitions import Creature, Move, MoveEffect, MovePos, ResultType, StatsName
+
+
+# battle, turn, caster side, move position, result, flags, damage, alteration stats, alteration count;
+# turn and damage take 32 bits, since neither max_turns nor the damage formula caps them at 16
+RECORD = struct.Struct('<IIBBBBibbxx')
+_BATTLE_ONLY = struct.Struct(f'<I{RECORD.size - 4}x')
+
+STATS: tuple[StatsName, ...] = tuple(StatsName)
+RESULTS: tuple[ResultType, ...] = tuple(ResultType)
+_STAT_CODE = {stat: code for code, stat in enumerate(STATS)}
+_RESULT_CODE = {result: code for code, result in enumerate(RESULTS)}
+
+ALTERATION = 0x01
+CONDITION = 0x02
+
+
+@dataclass(frozen=True)
+class Event:
+    battle: int
+    turn: int
+    caster: int
+    move_pos: MovePos
+    result: ResultType
+    damage: int
+    alteration: tuple[StatsName, int] | None
+    condition: bool
+
+    @classmethod
+    def unpack(cls, record: tuple[int, ...]) -> 'Event':
+        battle, turn, caster, move_pos, result, flags, damage, stat, count = record
+        return cls(battle=battle, turn=turn, caster=caster, move_pos=MovePos(move_pos),
+                   result=RESULTS[result], damage=damage,
+                   alteration=(STATS[stat], count) if flags & ALTERATION else None,
+                   condition=bool(flags & CONDITION))
+
+
+def pack_event(battle: int, turn: int, caster: int, move_pos: MovePos, effect: MoveEffect) -> bytes:
+    flags, stat, count = 0, 0, 0
+    if effect.alteration is not None:
+        flags |= ALTERATION
+        stat, count = _STAT_CODE[effect.alteration.stats], effect.alteration.count
+    if effect.condition is not None:
+        flags |= CONDITION
+    return RECORD.pack(battle, turn, caster, move_pos, _RESULT_CODE[effect.result], flags,
+                       effect.damage, stat, count)
+
+
+class EventLog:
+    """Append-only writer of fixed-size :data:`RECORD` events."""
+
+    def __init__(self, file: str | os.PathLike | BinaryIO, buffering: int = 1 << 16) -> None:
+        if isinstance(file, (str, os.PathLike)):
+            file = open(file, 'ab', buffering=buffering)
+        self.file = file
+
+    def write(self, battle: int, turn: int, caster: int, move_pos: MovePos, effect: MoveEffect) -> None:
+        self.file.write(pack_event(battle, turn, caster, move_pos, effect))
+
+    def recorder(self, battle_id: int, battle: Battle) -> CastObserver:
+        """A :class:`Battle` observer logging every cast of ``battle`` under ``battle_id``."""
+        write = self.file.write
+
+        def observe(caster: Creature, move: Move, target: Creature, effect: MoveEffect) -> None:
+            side = 0 if caster is battle.creatures[0] else 1
+            move_pos = next(pos for pos, known in caster.moves.items() if known is move)
+            write(pack_event(battle_id, battle.turn, side, move_pos, effect))
+        return observe
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> 'EventLog':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventReader:
+    """Memory-mapped view over an event log file."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._size = size - size % RECORD.size
+
+    def __len__(self) -> int:
+        return self._size // RECORD.size
+
+    def __getitem__(self, index: int) -> Event:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return Event.unpack(RECORD.unpack_from(self._map, index * RECORD.size))
+
+    def records(self) -> Iterator[tuple[int, ...]]:
+        """Raw record tuples, without building :class:`Event` objects."""
+        return RECORD.iter_unpack(memoryview(self._map)[:self._size])
+
+    def __iter__(self) -> Iterator[Event]:
+        return map(Event.unpack, self.records())
+
+    def battles(self) -> Iterator[tuple[int, bytes]]:
+        """``(battle id, raw records)`` for each contiguous run of one battle's events."""
+        view = memoryview(self._map)[:self._size]
+        start, current = 0, None
+        for index, (battle,) in enumerate(_BATTLE_ONLY.iter_unpack(view)):
+            if battle != current:
+                if current is not None:
+                    yield current, bytes(view[start:index * RECORD.size])
+                start, current = index * RECORD.size, battle
+        if current is not None:
+            yield current, bytes(view[start:self._size])
+        view.release()
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'EventReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def record_battle(battle_id: int, battle: Battle) -> bytes:
+    """Runs ``battle`` to completion and returns its packed events."""
+    buffer = BytesIO()
+    battle.observer = EventLog(buffer).recorder(battle_id, battle)
+    battle.run()
+    return buffer.getvalue()
+
+
+def verify_replay(path: str | os.PathLike, battle_factory: Callable[[int], Battle]) -> list[int]:
+    """Re-runs every logged battle from ``battle_factory(battle_id)`` and returns the ids whose events differ."""
+    mismatches = []
+    with EventReader(path) as reader:
+        for battle_id, logged in reader.battles():
+            if record_battle(battle_id, battle_factory(battle_id)) != logged:
+                mismatches.append(battle_id)
+    return mismatches
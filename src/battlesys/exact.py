@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+from battlesys.calculator import hit_probability
+from battlesys.definitions import Creature, Move, StatsName, modifier_factor
+
+
+@dataclass(frozen=True)
+class ExactResult:
+    wins: tuple[float, float]
+    draw_rate: float
+    mean_turns: float
+    states: int
+
+    def win_rate(self, side: int = 0) -> float:
+        return self.wins[side]
+
+
+class _View:
+    """Just enough of a :class:`Creature` for :meth:`Move.build_damage`."""
+
+    __slots__ = ('level', 'stats', 'stages')
+
+    def __init__(self, level: int, stats: dict[StatsName, int], stages: dict[StatsName, int]) -> None:
+        self.level = level
+        self.stats = stats
+        self.stages = stages
+
+    def current_stats(self, stat_name: StatsName) -> int:
+        stage = self.stages.get(stat_name, 0)
+        if stat_name in [StatsName.EVA, StatsName.ACC]:
+            return stage
+        return int(self.stats[stat_name] * modifier_factor(stage))
+
+
+def _read_stats(move: Move) -> set[StatsName]:
+    return {StatsName.ACC, StatsName.EVA, StatsName.SPD, *(move.damage.stats if move.damage else ())}
+
+
+def solve_matchup(first: Creature, second: Creature, max_turns: int = 100) -> ExactResult:
+    """Exact outcome distribution of the battles played by :func:`battlesys.montecarlo.simulate_matchup`.
+
+    Both sides start at full health and pick their moves uniformly at random;
+    the chain is expanded depth-first from the initial state, so only
+    reachable states are visited, and each one is memoized on a canonical key
+    of ``(turn, health, tracked stages)``. Stages of stats that no move reads
+    are not tracked, and stages that can only move in one direction are
+    clamped at the ``±6`` cap of :func:`modifier_factor`.
+    """
+    creatures = (first, second)
+    moves = (tuple(first.moves.values()), tuple(second.moves.values()))
+    if any(move.condition is not None and move.condition_rate for side in moves for move in side):
+        raise ValueError('conditions are not modelled by the exact solver')
+    read = set().union(*(_read_stats(move) for side in moves for move in side))
+
+    tracked: list[tuple[StatsName, ...]] = []
+    bounds: list[tuple[tuple[int, int], ...]] = []
+    for side in (0, 1):
+        counts: dict[StatsName, set[int]] = {}
+        for move in moves[1 - side]:
+            if move.alteration is not None and move.alteration_rate and move.alteration.stats in read:
+                counts.setdefault(move.alteration.stats, set()).add(move.alteration.count)
+        stats = tuple(sorted(counts))
+        tracked.append(stats)
+        bounds.append(tuple((-6 if max(counts[stat]) <= 0 else -sys.maxsize,
+                             6 if min(counts[stat]) >= 0 else sys.maxsize) for stat in stats))
+
+    def view(side: int, stages: tuple[int, ...]) -> _View:
+        creature = creatures[side]
+        return _View(creature.level, creature.stats, dict(zip(tracked[side], stages)))
+
+    @lru_cache(maxsize=None)
+    def outcomes(caster: int, move_index: int, stages: tuple[tuple[int, ...], tuple[int, ...]]):
+        target = 1 - caster
+        move = moves[caster][move_index]
+        caster_view, target_view = view(caster, stages[caster]), view(target, stages[target])
+        hit = hit_probability(move.hit_rate,
+                               caster_view.current_stats(StatsName.ACC),
+                               target_view.current_stats(StatsName.EVA))
+        results = []
+        if hit < 1:
+            results.append((1 - hit, 0, stages))
+        if hit > 0:
+            damage, _ = move.build_damage(caster_view, target_view)
+            altered = 0.0
+            if move.alteration is not None and move.alteration.stats in tracked[target]:
+                altered = hit_probability(move.alteration_rate, 0, 0)
+            if altered < 1:
+                results.append((hit * (1 - altered), damage, stages))
+            if altered > 0:
+                position = tracked[target].index(move.alteration.stats)
+                low, high = bounds[target][position]
+                target_stages = list(stages[target])
+                target_stages[position] = min(high, max(low, target_stages[position] + move.alteration.count))
+                new_stages = (stages[0], tuple(target_stages)) if target else (tuple(target_stages), stages[1])
+                results.append((hit * altered, damage, new_stages))
+        return tuple(results)
+
+    @lru_cache(maxsize=None)
+    def order(stages: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+        speed = [view(side, stages[side]).current_stats(StatsName.SPD) for side in (0, 1)]
+        return 1 if speed[1] > speed[0] else 0
+
+    memo: dict[tuple, tuple[float, float, float, float]] = {}
+
+    def value(turn: int, phase: int, leader: int, health: tuple[int, int],
+              stages: tuple[tuple[int, ...], tuple[int, ...]]) -> tuple[float, float, float, float]:
+        if phase == 0:
+            if turn > max_turns:
+                return 0.0, 0.0, 1.0, float(max_turns)
+            leader = order(stages)
+        key = (turn, phase, leader, health, stages)
+        if key in memo:
+            return memo[key]
+
+        caster = leader if phase == 0 else 1 - leader
+        target = 1 - caster
+        total = [0.0, 0.0, 0.0, 0.0]
+        weight = 1 / len(moves[caster])
+        for move_index in range(len(moves[caster])):
+            for probability, damage, new_stages in outcomes(caster, move_index, stages):
+                probability *= weight
+                remaining = health[target] - damage
+                if remaining <= 0:
+                    total[caster] += probability
+                    total[3] += probability * turn
+                    continue
+                new_health = (health[0], remaining) if target else (remaining, health[1])
+                if phase == 0:
+                    child = value(turn, 1, leader, new_health, new_stages)
+                else:
+                    child = value(turn + 1, 0, 0, new_health, new_stages)
+                for idx in range(4):
+                    total[idx] += probability * child[idx]
+
+        memo[key] = result = (total[0], total[1], total[2], total[3])
+        return result
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 4 * max_turns + 100))
+    try:
+        start = (tuple(0 for _ in tracked[0]), tuple(0 for _ in tracked[1]))
+        wins_first, wins_second, draws, turns = value(1, 0, 0, (first.max_health, second.max_health), start)
+    finally:
+        sys.setrecursionlimit(limit)
+    return ExactResult(wins=(wins_first, wins_second), draw_rate=draws, mean_turns=turns, states=len(memo))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any
+
+from battlesys.definitions import Creature, Move
+
+
+# salted into every definition_hash: bump it whenever a change to the engine (rules, RNG, defaults)
+# makes the same definitions play out differently, so cached results of older engines are never reused
+ENGINE_VERSION = 1
+
+# the parts of a creature that decide how its battles play out; health and stages are reset by fresh_creature
+_CREATURE_FIELDS = ('name', 'level', 'max_health', 'stats', 'moves')
+
+
+def canonical(value: Any) -> Any:
+    """A JSON-ready form of a definition in which equal content always encodes the same way."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Creature):
+        return {'Creature': {name: canonical(getattr(value, name)) for name in _CREATURE_FIELDS}}
+    if is_dataclass(value):
+        # catalog moves are plain moves content-wise
+        kind = 'Move' if isinstance(value, Move) else type(value).__name__
+        return {kind: {field.name: canonical(getattr(value, field.name)) for field in fields(value)
+                       if not field.name.startswith('_')}}
+    if isinstance(value, dict):
+        return sorted([canonical(key), canonical(item)] for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    return value
+
+
+def definition_hash(*values: Any) -> str:
+    """SHA-256 of :data:`ENGINE_VERSION` and the canonical form of ``values``, e.g. a matchup and its settings."""
+    encoded = json.dumps([ENGINE_VERSION, *(canonical(value) for value in values)], separators=(',', ':'),
+                         sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
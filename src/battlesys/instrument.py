@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any, Callable, Sequence
+
+from battlesys.definitions import Creature, Move, MoveEffect, ResultType
+
+
+Target = tuple[type, str]
+
+DEFAULT_TARGETS: tuple[Target, ...] = (
+    (Move, 'hit_or_miss'),
+    (Move, 'build_damage'),
+    (Move, 'effect'),
+    (Creature, 'current_stats'),
+    (Creature, 'apply'),
+)
+
+
+class ProfilerActiveError(Exception):
+    def __init__(self, target: Target) -> None:
+        self.target = target
+
+    def __str__(self) -> str:
+        cls, name = self.target
+        return f"{cls.__name__}.{name} is already instrumented by another profiler"
+
+
+def _phase(target: Target) -> str:
+    cls, name = target
+    return f'{cls.__name__}.{name}'
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """Call counts, cumulative (inclusive) nanoseconds and outcome counts per phase."""
+    calls: dict[str, int] = field(default_factory=dict)
+    nanoseconds: dict[str, int] = field(default_factory=dict)
+    outcomes: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def diff(self, earlier: 'ProfileSnapshot') -> 'ProfileSnapshot':
+        """What happened between ``earlier`` and this snapshot."""
+        def sub(now: dict[str, int], before: dict[str, int]) -> dict[str, int]:
+            return {key: value - before.get(key, 0) for key, value in now.items()}
+        return ProfileSnapshot(calls=sub(self.calls, earlier.calls),
+                               nanoseconds=sub(self.nanoseconds, earlier.nanoseconds),
+                               outcomes={phase: sub(counts, earlier.outcomes.get(phase, {}))
+                                         for phase, counts in self.outcomes.items()})
+
+    def to_json(self) -> str:
+        return json.dumps({'calls': self.calls, 'nanoseconds': self.nanoseconds, 'outcomes': self.outcomes},
+                          indent=2, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str) -> 'ProfileSnapshot':
+        return cls(**json.loads(text))
+
+
+class Profiler:
+    """Opt-in per-phase instrumentation of the combat hot path.
+
+    :meth:`enable` swaps timing wrappers onto the ``targets`` class attributes
+    and :meth:`disable` puts the original functions back, so nothing is left
+    in the hot path while the profiler is off.
+    """
+
+    def __init__(self, targets: Sequence[Target] = DEFAULT_TARGETS) -> None:
+        self.targets = tuple(targets)
+        self.calls: Counter[str] = Counter()
+        self.nanoseconds: Counter[str] = Counter()
+        self.outcomes: dict[str, Counter[str]] = {}
+        self._originals: dict[Target, Callable] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def _wrap(self, target: Target, original: Callable) -> Callable:
+        phase = _phase(target)
+        calls, nanoseconds = self.calls, self.nanoseconds
+        outcomes = self.outcomes.setdefault(phase, Counter())
+
+        @functools.wraps(original)
+        def instrumented(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            value = original(*args, **kwargs)
+            nanoseconds[phase] += perf_counter_ns() - start
+            calls[phase] += 1
+            if isinstance(value, ResultType):
+                outcomes[value.name] += 1
+            elif isinstance(value, MoveEffect):
+                outcomes[value.result.name] += 1
+            return value
+        instrumented.__instrumented__ = original
+        return instrumented
+
+    def enable(self) -> 'Profiler':
+        if self.enabled:
+            return self
+        for target in self.targets:
+            cls, name = target
+            original = cls.__dict__[name]
+            if hasattr(original, '__instrumented__'):
+                self.disable()
+                raise ProfilerActiveError(target)
+            self._originals[target] = original
+            setattr(cls, name, self._wrap(target, original))
+        return self
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.nanoseconds.clear()
+        for counts in self.outcomes.values():
+            counts.clear()
+
+    def snapshot(self) -> ProfileSnapshot:
+        return ProfileSnapshot(calls=dict(self.calls),
+                               nanoseconds=dict(self.nanoseconds),
+                               outcomes={phase: dict(counts) for phase, counts in self.outcomes.items() if counts})
+
+    def __enter__(self) -> 'Profiler':
+        return self.enable()
+
+    def __exit__(self, *exc) -> None:
+        self.disable()
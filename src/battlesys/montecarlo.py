@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import os
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from math import sqrt
+from statistics import NormalDist
+
+from battlesys.battle import DRAW, Battle, fresh_creature
+from battlesys.definitions import Creature
+from battlesys.rng import BattleRNG
+
+
+@dataclass
+class MatchupResult:
+    battles: int = 0
+    wins: list[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    turns: Counter = field(default_factory=Counter)
+    confidence: float = 0.95
+
+    def merge(self, other: 'MatchupResult') -> None:
+        self.battles += other.battles
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.draws += other.draws
+        self.turns.update(other.turns)
+
+    def win_rate(self, side: int = 0) -> float:
+        return self.wins[side] / self.battles if self.battles else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        return self.draws / self.battles if self.battles else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return sum(turns * count for turns, count in self.turns.items()) / self.battles if self.battles else 0.0
+
+    def confidence_interval(self, side: int = 0) -> tuple[float, float]:
+        """Wilson score interval of :meth:`win_rate` at :attr:`confidence`."""
+        if not self.battles:
+            return 0.0, 1.0
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        n, p = self.battles, self.win_rate(side)
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        margin = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+    def ci_width(self, side: int = 0) -> float:
+        low, high = self.confidence_interval(side)
+        return high - low
+
+
+_worker_matchup: tuple[Creature, Creature, int] | None = None
+
+
+def _init_worker(first: Creature, second: Creature, max_turns: int) -> None:
+    global _worker_matchup
+    _worker_matchup = (first, second, max_turns)
+
+
+def _run_chunk(seed: int, start: int, count: int) -> MatchupResult:
+    first, second, max_turns = _worker_matchup
+    return play_battles(first, second, seed, start, count, max_turns)
+
+
+def play_battles(first: Creature, second: Creature, seed: int, start: int, count: int,
+                 max_turns: int = 100) -> MatchupResult:
+    """Battles ``start`` to ``start + count - 1`` of a matchup, battle ``i`` on ``BattleRNG.stream(seed, i)``."""
+    result = MatchupResult(battles=count)
+    for index in range(start, start + count):
+        battle = Battle(fresh_creature(first), fresh_creature(second),
+                        rng=BattleRNG.stream(seed, index, block_size=256), max_turns=max_turns)
+        outcome = battle.run()
+        if outcome.winner == DRAW:
+            result.draws += 1
+        else:
+            result.wins[outcome.winner] += 1
+        result.turns[outcome.turns] += 1
+    return result
+
+
+def _chunks(n: int, chunk_size: int):
+    for start in range(0, n, chunk_size):
+        yield start, min(chunk_size, n - start)
+
+
+def simulate_matchup(first: Creature, second: Creature, n: int, workers: int | None = None,
+                     seed: int = 0, chunk_size: int = 1000, max_turns: int = 100,
+                     ci_width: float | None = None, confidence: float = 0.95) -> MatchupResult:
+    """Plays ``n`` battles of ``first`` against ``second`` with uniformly random move choices.
+
+    Battle ``i`` draws from ``BattleRNG.stream(seed, i)`` and chunks are merged
+    in order, so the result only depends on ``seed``, never on ``workers``.
+    With ``ci_width`` set, the run stops after the first chunk at which the
+    confidence interval of ``first``'s win rate is at most that wide.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = MatchupResult(confidence=confidence)
+
+    def done() -> bool:
+        return ci_width is not None and total.ci_width() <= ci_width
+
+    if workers == 1:
+        for start, count in _chunks(n, chunk_size):
+            total.merge(play_battles(first, second, seed, start, count, max_turns))
+            if done():
+                break
+        return total
+
+    chunks = _chunks(n, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(first, second, max_turns)) as pool:
+        pending: list[Future] = []
+        for start, count in chunks:
+            pending.append(pool.submit(_run_chunk, seed, start, count))
+            if len(pending) == 2 * workers:
+                break
+        while pending:
+            total.merge(pending.pop(0).result())
+            if done():
+                for future in pending:
+                    future.cancel()
+                break
+            for start, count in chunks:
+                pending.append(pool.submit(_run_chunk, seed, start, count))
+                break
+    return total
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Mapping
+
+from battlesys.battle import Battle, Policy, fresh_creature, random_policy
+from battlesys.definitions import Creature, MovePos
+from battlesys.rng import BattleRNG
+
+
+MAX_LINE = 4096
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@dataclass
+class Session:
+    id: int
+    battle: Battle
+    # ids of the sessions of the connection that opened this one, None outside a connection
+    owner: set[int] | None = None
+    choice: MovePos = MovePos.FIRST
+    last_seen: float = field(default_factory=time.monotonic)
+
+    def state(self) -> dict[str, Any]:
+        return {
+            'turn': self.battle.turn,
+            'winner': self.battle.winner,
+            'health': [creature.health for creature in self.battle.creatures],
+            'moves': [[int(pos) for pos in positions] for positions in self.battle.positions],
+        }
+
+
+class BattleServer:
+    """Hosts many concurrent :class:`Battle` sessions behind a line-delimited JSON protocol.
+
+    Each request is one JSON object per line with an ``op`` of ``new``
+    (``player``, ``enemy`` roster names and an optional ``seed``), ``move``
+    (``session`` and ``move``, a :class:`MovePos` value) or ``close``
+    (``session``); every reply is one JSON object with ``ok`` set. A
+    connection's requests are answered in order and the next line is only
+    read once the previous reply has drained, so slow clients push back on
+    their own socket instead of growing server buffers. A session can only be
+    played and closed by the connection that opened it and is dropped when
+    that connection ends or after ``session_timeout`` seconds idle.
+    """
+
+    def __init__(self, roster: Mapping[str, Creature], max_sessions: int = 10_000,
+                 session_timeout: float = 60.0, enemy_policy: Policy = random_policy) -> None:
+        self.roster = {name.lower(): creature for name, creature in roster.items()}
+        self.max_sessions = max_sessions
+        self.session_timeout = session_timeout
+        self.enemy_policy = enemy_policy
+        self.sessions: dict[int, Session] = {}
+        self.turns = 0
+        self._ids = count(1)
+        self._servers: list[asyncio.AbstractServer] = []
+        self._reaper: asyncio.Task | None = None
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0, backlog: int = 1024) -> asyncio.AbstractServer:
+        server = await asyncio.start_server(self._handle, host, port, limit=MAX_LINE, backlog=backlog)
+        return self._started(server)
+
+    async def start_unix(self, path: str | os.PathLike, backlog: int = 1024) -> asyncio.AbstractServer:
+        server = await asyncio.start_unix_server(self._handle, path, limit=MAX_LINE, backlog=backlog)
+        return self._started(server)
+
+    def _started(self, server: asyncio.AbstractServer) -> asyncio.AbstractServer:
+        self._servers.append(server)
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap())
+        return server
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        self.sessions.clear()
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(self.session_timeout / 4)
+            self.expire()
+
+    def expire(self, now: float | None = None) -> int:
+        deadline = (time.monotonic() if now is None else now) - self.session_timeout
+        expired = [id for id, session in self.sessions.items() if session.last_seen < deadline]
+        for id in expired:
+            self._drop(self.sessions[id])
+        return len(expired)
+
+    def _drop(self, session: Session) -> None:
+        del self.sessions[session.id]
+        if session.owner is not None:
+            session.owner.discard(session.id)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        owned: set[int] = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b'{"ok": false, "error": "line too long"}\n')
+                    break
+                if not line:
+                    break
+                writer.write(json.dumps(self.handle_line(line, owned)).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            for id in list(owned):
+                # close() may have dropped them already
+                if id in self.sessions:
+                    self._drop(self.sessions[id])
+
+    def handle_line(self, line: bytes, owner: set[int] | None = None) -> dict[str, Any]:
+        """The reply to one request line from the connection whose sessions are ``owner``."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ProtocolError('request must be a JSON object')
+            handler = getattr(self, f"_op_{request.get('op')}", None)
+            if handler is None:
+                raise ProtocolError(f"unknown op {request.get('op')!r}")
+            return {'ok': True, **handler(request, owner)}
+        except (ProtocolError, ValueError) as error:
+            return {'ok': False, 'error': str(error)}
+        except Exception as error:
+            # a bug in one request must not take the connection's other sessions down
+            return {'ok': False, 'error': f'internal error: {type(error).__name__}: {error}'}
+
+    def _session(self, request: dict[str, Any], owner: set[int] | None) -> Session:
+        if not _is_int(request.get('session')):
+            raise ProtocolError(f"session must be an integer, not {request.get('session')!r}")
+        session = self.sessions.get(request['session'])
+        # another connection's session is reported as missing, so ids reveal nothing
+        if session is None or session.owner is not owner:
+            raise ProtocolError(f"no session {request.get('session')!r}")
+        session.last_seen = time.monotonic()
+        return session
+
+    def _op_new(self, request: dict[str, Any], owner: set[int] | None) -> dict[str, Any]:
+        if len(self.sessions) >= self.max_sessions:
+            raise ProtocolError('server is full')
+        try:
+            player = self.roster[str(request.get('player', '')).lower()]
+            enemy = self.roster[str(request.get('enemy', '')).lower()]
+        except KeyError as missing:
+            raise ProtocolError(f'unknown creature {missing}') from None
+        seed = request.get('seed')
+        if seed is not None and not _is_int(seed):
+            raise ProtocolError(f'seed must be an integer, not {seed!r}')
+        # the player's policy reads the session's choice, bound once the session exists
+        battle = Battle(fresh_creature(player), fresh_creature(enemy),
+                        policies=(lambda battle, side: session.choice, self.enemy_policy), rng=BattleRNG(seed))
+        session = Session(next(self._ids), battle, owner)
+        self.sessions[session.id] = session
+        if owner is not None:
+            owner.add(session.id)
+        return {'session': session.id, 'state': session.state()}
+
+    def _op_move(self, request: dict[str, Any], owner: set[int] | None) -> dict[str, Any]:
+        session = self._session(request, owner)
+        if session.battle.finished:
+            raise ProtocolError(f'session {session.id} is over')
+        try:
+            move_pos = MovePos(request.get('move'))
+        except ValueError:
+            raise ProtocolError(f"invalid move {request.get('move')!r}") from None
+        if move_pos not in session.battle.creatures[0].moves:
+            raise ProtocolError(f'move {int(move_pos)} is not available')
+        session.choice = move_pos
+        actions = session.battle.step()
+        self.turns += 1
+        return {'actions': [[action.caster, int(action.move_pos), str(action.result)] for action in actions],
+                'state': session.state()}
+
+    def _op_close(self, request: dict[str, Any], owner: set[int] | None) -> dict[str, Any]:
+        session = self._session(request, owner)
+        self._drop(session)
+        return {'session': session.id}
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+
+from battlesys.definitions import Creature, Move, MoveEffect, MovePos, ResultType, StatsName, modifier_factor
+from battlesys.rng import BattleRNG
+
+
+STATS: tuple[StatsName, ...] = tuple(StatsName)
+STAT_POSITION: dict[StatsName, int] = {stat: pos for pos, stat in enumerate(STATS)}
+
+_NO_STAGES = (0,) * len(STATS)
+_STAGE_ONLY = frozenset({StatsName.EVA, StatsName.ACC})
+
+
+@dataclass(frozen=True, slots=True)
+class CreatureState:
+    """Immutable snapshot of a creature's health and stages.
+
+    The name, level, stats and moves stay on the shared ``template``, and
+    :meth:`apply` returns a new state that reuses the stages tuple unless the
+    effect altered a stat, so branching a state copies two fields at most.
+    """
+    template: Creature
+    health: int
+    stages: tuple[int, ...] = _NO_STAGES
+
+    @classmethod
+    def from_creature(cls, creature: Creature) -> 'CreatureState':
+        modifiers = creature.stats_modifiers
+        stages = tuple(modifiers.get(stat, 0) for stat in STATS)
+        return cls(creature, creature.health, _NO_STAGES if not any(stages) else stages)
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def level(self) -> int:
+        return self.template.level
+
+    @property
+    def max_health(self) -> int:
+        return self.template.max_health
+
+    @property
+    def stats(self) -> dict[StatsName, int]:
+        return self.template.stats
+
+    @property
+    def moves(self) -> dict[MovePos, Move]:
+        return self.template.moves
+
+    def stage(self, stat_name: StatsName) -> int:
+        return self.stages[STAT_POSITION[stat_name]]
+
+    def current_stats(self, stat_name: StatsName) -> int:
+        if stat_name == StatsName.HP:
+            return self.health
+        stage = self.stages[STAT_POSITION[stat_name]]
+        if stat_name in _STAGE_ONLY:
+            return stage
+        return int(self.template.stats[stat_name] * modifier_factor(stage))
+
+    def apply(self, effect: MoveEffect) -> 'CreatureState':
+        """The state after ``effect``, following :meth:`Creature.apply`."""
+        if effect.result is not ResultType.HIT or not (effect.damage or effect.alteration):
+            return self
+        stages = self.stages
+        if effect.alteration:
+            position = STAT_POSITION[effect.alteration.stats]
+            stages = (*stages[:position], stages[position] + effect.alteration.count, *stages[position + 1:])
+        return CreatureState(self.template, self.health - effect.damage, stages)
+
+    def to_creature(self) -> Creature:
+        """A mutable :class:`Creature` in this state."""
+        creature = Creature(name=self.name, level=self.level, max_health=self.max_health, health=self.health,
+                            stats=self.stats, moves=self.moves)
+        creature.stats_modifiers.update({stat: self.stages[STAT_POSITION[stat]] for stat in creature.stats_modifiers})
+        return creature
+
+
+@dataclass(frozen=True, slots=True)
+class BattleState:
+    creatures: tuple[CreatureState, CreatureState]
+    turn: int = 0
+
+    @classmethod
+    def from_creatures(cls, first: Creature, second: Creature, turn: int = 0) -> 'BattleState':
+        return cls((CreatureState.from_creature(first), CreatureState.from_creature(second)), turn)
+
+    def replace(self, side: int, creature: CreatureState) -> 'BattleState':
+        if creature is self.creatures[side]:
+            return self
+        creatures = (creature, self.creatures[1]) if side == 0 else (self.creatures[0], creature)
+        return BattleState(creatures, self.turn)
+
+
+def cast_move_state(state: BattleState, caster: int, move_pos: MovePos,
+                    rng: BattleRNG | None = None) -> tuple[BattleState, MoveEffect]:
+    """:func:`battlesys.action.cast_move` on a snapshot: ``caster`` side casts at the foe, ``state`` is left as is."""
+    caster_state, target_state = state.creatures[caster], state.creatures[1 - caster]
+    effect = caster_state.moves[move_pos].effect(caster_state, target_state, rng)
+    return state.replace(1 - caster, target_state.apply(effect)), effect
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Mapping
+
+from battlesys.definitions import Creature, Move, MoveEffect, MovePos, ResultType, StatsName, modifier_factor
+
+
+_STAGE_ONLY = frozenset({StatsName.EVA, StatsName.ACC})
+
+
+@dataclass(frozen=True, eq=False)
+class Species:
+    """Static data shared by every :class:`Individual` of a species.
+
+    ``stats`` and ``moves`` are read-only views, so no instance can change
+    what the others see. ``level`` is the level new instances start at.
+    """
+    name: str
+    max_health: int
+    stats: Mapping[StatsName, int]
+    moves: Mapping[MovePos, Move]
+    level: int = 5
+    description: str = ''
+    no_stages: Mapping[StatsName, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'stats', MappingProxyType(dict(self.stats)))
+        object.__setattr__(self, 'moves', MappingProxyType(dict(self.moves)))
+        object.__setattr__(self, 'no_stages', MappingProxyType({stat: 0 for stat in self.stats}))
+
+    @classmethod
+    def from_creature(cls, creature: Creature, description: str = '') -> 'Species':
+        return cls(name=creature.name, max_health=creature.max_health, stats=creature.stats, moves=creature.moves,
+                   level=creature.level, description=description)
+
+    def variant(self, name: str | None = None, stats: Mapping[StatsName, int] | None = None,
+                moves: Mapping[MovePos, Move] | None = None) -> 'Species':
+        """A species overriding some of this one's name, stats or moves, to be shared by the instances that need it."""
+        return replace(self, name=self.name if name is None else name, stats={**self.stats, **(stats or {})},
+                       moves={**self.moves, **(moves or {})})
+
+    def spawn(self, level: int | None = None) -> 'Individual':
+        return Individual(self, level)
+
+
+class Individual:
+    """One creature of a :class:`Species`, holding only what differs between instances.
+
+    It stores its level, health and stages and reads everything else from
+    its species, and it can stand in for a :class:`Creature` in
+    :func:`cast_move` and :class:`Battle`. Stages are copied on the first
+    alteration; until then :attr:`stats_modifiers` is the species' shared
+    read-only all-zero mapping, so change stages through :meth:`apply`.
+    """
+    __slots__ = ('species', 'level', 'health', '_stages')
+
+    def __init__(self, species: Species, level: int | None = None, health: int | None = None) -> None:
+        self.species = species
+        self.level = species.level if level is None else level
+        self.health = species.max_health if health is None else health
+        self._stages: dict[StatsName, int] | None = None
+
+    def __repr__(self) -> str:
+        return f'Individual({self.name!r}, level={self.level}, health={self.health}/{self.max_health})'
+
+    @property
+    def name(self) -> str:
+        return self.species.name
+
+    @property
+    def max_health(self) -> int:
+        return self.species.max_health
+
+    @property
+    def stats(self) -> Mapping[StatsName, int]:
+        return self.species.stats
+
+    @property
+    def moves(self) -> Mapping[MovePos, Move]:
+        return self.species.moves
+
+    @property
+    def stats_modifiers(self) -> Mapping[StatsName, int]:
+        return self.species.no_stages if self._stages is None else self._stages
+
+    def current_stats(self, stat_name: StatsName) -> int:
+        if stat_name == StatsName.HP:
+            return self.health
+        stages = self._stages
+        if stat_name in _STAGE_ONLY:
+            return 0 if stages is None else stages[stat_name]
+        base = self.species.stats[stat_name]
+        # an unaltered instance is at stage 0 everywhere
+        return base if stages is None else int(base * modifier_factor(stages[stat_name]))
+
+    def apply(self, effect: MoveEffect) -> ResultType:
+        if effect.result is ResultType.HIT:
+            if effect.damage:
+                self.health -= effect.damage
+            if effect.alteration:
+                if self._stages is None:
+                    self._stages = dict(self.species.no_stages)
+                self._stages[effect.alteration.stats] += effect.alteration.count
+        return effect.result
+
+    def reset(self) -> None:
+        """Back to full health with no stages, as after :func:`fresh_creature`."""
+        self.health = self.species.max_health
+        self._stages = None
+
+    def to_creature(self) -> Creature:
+        creature = Creature(name=self.name, level=self.level, max_health=self.max_health, health=self.health,
+                            stats=dict(self.stats), moves=dict(self.moves))
+        creature.stats_modifiers.update(self.stats_modifiers)
+        return creature
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import permutations, product
+from pathlib import Path
+from typing import Mapping, Sequence
+
+from battlesys.cache import MatchupCache
+from battlesys.definitions import Creature, MovePos
+from battlesys.hashing import definition_hash
+from battlesys.montecarlo import simulate_matchup
+
+
+PARAMETERS = ('hit_rate', 'power', 'alteration_rate')
+
+# first's win rate and the draw rate
+Evaluation = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class Axis:
+    """One swept parameter: ``parameter`` of the move at ``move_pos`` of roster entry ``creature``."""
+    creature: str
+    move_pos: MovePos
+    parameter: str
+    values: tuple[int, ...]
+
+    def __post_init__(self) -> None:
+        if self.parameter not in PARAMETERS:
+            raise ValueError(f"cannot sweep {self.parameter!r}, only {PARAMETERS}")
+
+    @property
+    def label(self) -> str:
+        return f'{self.creature}.{int(self.move_pos)}.{self.parameter}'
+
+
+def with_parameter(creature: Creature, move_pos: MovePos, parameter: str, value: int) -> Creature:
+    """A full-health copy of ``creature`` whose move at ``move_pos`` has ``parameter`` set to ``value``."""
+    move = creature.moves[move_pos]
+    if parameter == 'power':
+        if move.damage is None:
+            raise ValueError(f'{move.name} deals no damage')
+        move = replace(move, damage=replace(move.damage, power=value))
+    else:
+        move = replace(move, **{parameter: value})
+    return Creature(name=creature.name, level=creature.level, max_health=creature.max_health,
+                    health=creature.max_health, stats=creature.stats, moves={**creature.moves, move_pos: move})
+
+
+class SweepCache:
+    """Evaluations keyed by the :func:`definition_hash` of a matchup, optionally kept in a JSON file."""
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = None if path is None else Path(path)
+        self.entries: dict[str, Evaluation] = {}
+        if self.path is not None and self.path.exists():
+            self.entries = {key: tuple(value) for key, value in json.loads(self.path.read_text()).items()}
+
+    def get(self, key: str) -> Evaluation | None:
+        return self.entries.get(key)
+
+    def put(self, key: str, evaluation: Evaluation) -> None:
+        self.entries[key] = evaluation
+
+    def save(self) -> None:
+        if self.path is not None:
+            temporary = self.path.with_name(self.path.name + '.tmp')
+            temporary.write_text(json.dumps(self.entries))
+            os.replace(temporary, self.path)
+
+
+@dataclass(frozen=True)
+class SweepRow:
+    point: tuple[int, ...]
+    first: str
+    second: str
+    win_rate: float
+    draw_rate: float
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    axes: tuple[Axis, ...]
+    rows: tuple[SweepRow, ...]
+    computed: int
+    reused: int
+
+    def heatmap(self, x: int, y: int, first: str, second: str) -> tuple[list[int], list[int], list[list[float]]]:
+        """``(x values, y values, win rates[y][x])`` of ``first`` against ``second`` over axes ``x`` and ``y``.
+
+        Points that differ only on other axes are averaged into one cell.
+        """
+        xs, ys = list(self.axes[x].values), list(self.axes[y].values)
+        totals = [[0.0] * len(xs) for _ in ys]
+        counts = [[0] * len(xs) for _ in ys]
+        for row in self.rows:
+            if (row.first, row.second) == (first, second):
+                column, line = xs.index(row.point[x]), ys.index(row.point[y])
+                totals[line][column] += row.win_rate
+                counts[line][column] += 1
+        return xs, ys, [[total / count if count else float('nan') for total, count in zip(*pair)]
+                        for pair in zip(totals, counts)]
+
+    def write_csv(self, path: str | os.PathLike) -> None:
+        """One line per grid point and matchup, ready to pivot into heatmaps."""
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow([*(axis.label for axis in self.axes), 'first', 'second', 'win_rate', 'draw_rate'])
+            for row in self.rows:
+                writer.writerow([*row.point, row.first, row.second, row.win_rate, row.draw_rate])
+
+
+def _evaluate(first: Creature, second: Creature, battles: int, seed: int, max_turns: int) -> Evaluation:
+    result = simulate_matchup(first, second, battles, workers=1, seed=seed, max_turns=max_turns)
+    return result.win_rate(0), result.draw_rate
+
+
+def sweep(roster: Mapping[str, Creature], axes: Sequence[Axis],
+          matchups: Sequence[tuple[str, str]] | None = None, battles: int = 1000, seed: int = 0,
+          max_turns: int = 100, workers: int | None = None,
+          cache: SweepCache | MatchupCache | None = None) -> SweepResult:
+    """Win rates of ``matchups`` (default: every ordered pair of the roster) at every point of the ``axes`` grid.
+
+    Each matchup is keyed by the content hash of both creatures and the
+    simulation settings, so a matchup that a grid point leaves unchanged, or
+    that ``cache`` already holds from an earlier sweep, is not simulated
+    again; a :class:`MatchupCache` keeps them across processes and deploys.
+    The remaining matchups run on a pool of ``workers`` processes.
+    """
+    axes = tuple(axes)
+    matchups = list(permutations(roster, 2)) if matchups is None else list(matchups)
+    cache = SweepCache() if cache is None else cache
+    plan: list[tuple[tuple[int, ...], str, str, str]] = []
+    known: dict[str, Evaluation] = {}
+    pending: dict[str, tuple[Creature, Creature]] = {}
+    for point in product(*(axis.values for axis in axes)):
+        creatures = dict(roster)
+        for axis, value in zip(axes, point):
+            creatures[axis.creature] = with_parameter(creatures[axis.creature], axis.move_pos, axis.parameter, value)
+        for first, second in matchups:
+            key = definition_hash(creatures[first], creatures[second], battles, seed, max_turns)
+            plan.append((point, first, second, key))
+            if key in known or key in pending:
+                continue
+            evaluation = cache.get(key)
+            if evaluation is None:
+                pending[key] = (creatures[first], creatures[second])
+            else:
+                known[key] = evaluation
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(pending)))
+    jobs = [(first, second, battles, seed, max_turns) for first, second in pending.values()]
+    if workers == 1:
+        evaluations = [_evaluate(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            evaluations = list(pool.map(_evaluate, *zip(*jobs)))
+    for key, evaluation in zip(pending, evaluations):
+        cache.put(key, evaluation)
+        known[key] = evaluation
+    cache.save()
+
+    rows = tuple(SweepRow(point, first, second, *known[key]) for point, first, second, key in plan)
+    return SweepResult(axes, rows, computed=len(pending), reused=len(known) - len(pending))
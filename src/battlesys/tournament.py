@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+from array import array
+from itertools import combinations, islice
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from battlesys.battle import DRAW, Battle, fresh_creature
+from battlesys.definitions import Creature
+from battlesys.rng import BattleRNG
+
+
+COLUMNS: dict[str, str] = {
+    'pairing': 'I',
+    'first': 'H',
+    'second': 'H',
+    'winner': 'b',
+    'turns': 'I',
+}
+MANIFEST = 'manifest.json'
+
+
+class ResumeMismatchError(Exception):
+    def __init__(self, path: Path, field: str) -> None:
+        self.path = path
+        self.field = field
+
+    def __str__(self) -> str:
+        return f"Cannot resume tournament at {self.path}: its {self.field} differs from the requested run"
+
+
+def _column_path(path: Path, name: str) -> Path:
+    return path / f'{name}.col'
+
+
+def _write_manifest(path: Path, manifest: dict) -> None:
+    tmp = path / f'{MANIFEST}.tmp'
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, path / MANIFEST)
+
+
+def read_manifest(path: str | os.PathLike) -> dict:
+    return json.loads((Path(path) / MANIFEST).read_text())
+
+
+def run_tournament(roster: Sequence[Creature], battles: int, path: str | os.PathLike, seed: int = 0,
+                   max_turns: int = 100, resume: bool = False, flush_every: int = 4096) -> dict:
+    """Plays ``battles`` battles for every pairing of ``roster`` and streams them to ``path``.
+
+    Results go to one append-only binary file per column of :data:`COLUMNS`,
+    flushed every ``flush_every`` rows. ``manifest.json`` is rewritten after
+    each pairing, so ``resume=True`` truncates the columns back to the last
+    completed pairing and carries on from there. Battle ``k`` of pairing ``p``
+    uses ``BattleRNG.stream(seed, p * battles + k)``.
+    """
+    if len(roster) > 1 << 8 * array(COLUMNS['first']).itemsize:
+        raise ValueError(f"a roster of {len(roster)} creatures does not fit the '{COLUMNS['first']}' columns")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        'roster': [creature.name for creature in roster],
+        'battles': battles,
+        'seed': seed,
+        'max_turns': max_turns,
+        'byteorder': sys.byteorder,
+        'columns': COLUMNS,
+        'completed_pairings': 0,
+        'rows': 0,
+    }
+    if resume and (path / MANIFEST).exists():
+        previous = read_manifest(path)
+        for field in ('roster', 'battles', 'seed', 'max_turns', 'byteorder', 'columns'):
+            if previous[field] != manifest[field]:
+                raise ResumeMismatchError(path, field)
+        manifest = previous
+
+    files = {}
+    try:
+        for name, typecode in COLUMNS.items():
+            column = _column_path(path, name)
+            column.touch()
+            files[name] = handle = open(column, 'r+b')
+            handle.truncate(manifest['rows'] * array(typecode).itemsize)
+            handle.seek(0, os.SEEK_END)
+        buffers = {name: array(typecode) for name, typecode in COLUMNS.items()}
+
+        def flush() -> None:
+            for name, buffer in buffers.items():
+                buffer.tofile(files[name])
+                del buffer[:]
+
+        # pairings are generated, not listed, so a large roster keeps the memory flat
+        completed = manifest['completed_pairings']
+        pairings = islice(combinations(range(len(roster)), 2), completed, None)
+        for pairing, (first, second) in enumerate(pairings, completed):
+            for battle in range(battles):
+                outcome = Battle(fresh_creature(roster[first]), fresh_creature(roster[second]),
+                                 rng=BattleRNG.stream(seed, pairing * battles + battle, block_size=256),
+                                 max_turns=max_turns).run()
+                buffers['pairing'].append(pairing)
+                buffers['first'].append(first)
+                buffers['second'].append(second)
+                buffers['winner'].append(outcome.winner)
+                buffers['turns'].append(outcome.turns)
+                if len(buffers['pairing']) >= flush_every:
+                    flush()
+            flush()
+            for handle in files.values():
+                handle.flush()
+                os.fsync(handle.fileno())
+            manifest['completed_pairings'] = pairing + 1
+            manifest['rows'] += battles
+            _write_manifest(path, manifest)
+    finally:
+        for handle in files.values():
+            handle.close()
+    return manifest
+
+
+def iter_results(path: str | os.PathLike, chunk_rows: int = 65536) -> Iterator[dict[str, array]]:
+    """Yields the committed rows of a tournament as column chunks of at most ``chunk_rows`` rows."""
+    path = Path(path)
+    manifest = read_manifest(path)
+    rows, columns = manifest['rows'], manifest['columns']
+    handles = {name: open(_column_path(path, name), 'rb') for name in columns}
+    try:
+        for start in range(0, rows, chunk_rows):
+            count = min(chunk_rows, rows - start)
+            chunk = {}
+            for name, typecode in columns.items():
+                chunk[name] = column = array(typecode)
+                column.fromfile(handles[name], count)
+            yield chunk
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+
+def standings(path: str | os.PathLike) -> dict[str, list[int]]:
+    """``[wins, losses, draws]`` per creature name, streamed from the column files."""
+    roster = read_manifest(path)['roster']
+    table = {name: [0, 0, 0] for name in roster}
+    for chunk in iter_results(path):
+        for first, second, winner in zip(chunk['first'], chunk['second'], chunk['winner']):
+            if winner == DRAW:
+                table[roster[first]][2] += 1
+                table[roster[second]][2] += 1
+                continue
+            winner, loser = (first, second) if winner == 0 else (second, first)
+            table[roster[winner]][0] += 1
+            table[roster[loser]][1] += 1
+    return table
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from battlesys.batch import NO_WINNER, STATS, BattleBatch
+from battlesys.definitions import Creature, MovePos
+
+
+_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+_SHIFTS = (np.uint64(30), np.uint64(27), np.uint64(31), np.uint64(11))
+_MASK = 2 ** 64 - 1
+
+MOVES = len(MovePos)
+# observation layout, from the agent's (side 0) point of view
+HEALTH = slice(0, 2)
+STAGES = slice(2, 2 + 2 * len(STATS))
+AVAILABLE = slice(STAGES.stop, STAGES.stop + MOVES)
+OBSERVATION_SIZE = AVAILABLE.stop
+
+
+def splitmix64(state: np.ndarray) -> np.ndarray:
+    """The SplitMix64 output function, element-wise over ``uint64`` states."""
+    z = state ^ (state >> _SHIFTS[0])
+    z *= _MIX[0]
+    z ^= z >> _SHIFTS[1]
+    z *= _MIX[1]
+    return z ^ (z >> _SHIFTS[2])
+
+
+class SeededBattleBatch(BattleBatch):
+    """A :class:`BattleBatch` in which every battle draws from its own SplitMix64 stream.
+
+    Battle ``i``'s stream is a pure function of its seed and of how many
+    times it has drawn, so its rolls do not depend on the other battles in
+    the batch.
+    """
+
+    def __init__(self, pairs: Sequence[tuple[Creature, Creature]], seeds: Sequence[int] | None = None) -> None:
+        super().__init__(pairs)
+        self.state = np.zeros(self.size, dtype=np.uint64)
+        self.seed(np.arange(self.size) if seeds is None else seeds)
+
+    def seed(self, seeds: Sequence[int], rows: np.ndarray | None = None) -> None:
+        rows = self._index if rows is None else rows
+        # any Python int is a seed: reduce it mod 2 ** 64 rather than overflow the cast
+        self.state[rows] = splitmix64(np.array([int(seed) & _MASK for seed in seeds], dtype=np.uint64) * _GAMMA)
+
+    def randint(self, high: np.ndarray | int, rows: int = 1) -> np.ndarray:
+        steps = np.arange(1, rows + 1, dtype=np.uint64)[:, None] * _GAMMA
+        bits = splitmix64(self.state + steps)
+        self.state += steps[-1]
+        return ((bits >> _SHIFTS[3]).astype(np.float64) * 2.0 ** -53 * high).astype(np.int64)
+
+
+Opponent = Callable[[BattleBatch], np.ndarray]
+
+
+def random_opponent(batch: BattleBatch) -> np.ndarray:
+    return batch.random_slots(1)
+
+
+class VecBattleEnv:
+    """``N`` battles stepped together, Gymnasium vector-environment style.
+
+    The agent plays side ``0`` of every battle and ``opponent`` picks side
+    ``1``'s move slots. Actions and slots are ``MovePos - 1``. Observations are
+    ``float32`` rows of :data:`OBSERVATION_SIZE` holding both health
+    fractions, both sides' stages over six and the agent's available moves
+    (see :data:`HEALTH`, :data:`STAGES` and :data:`AVAILABLE`). A win rewards
+    ``1``, a loss ``-1``. Battles that end are reset in the same step, and
+    the reported observation is the one after the reset.
+    """
+
+    def __init__(self, pairs: Sequence[tuple[Creature, Creature]], max_turns: int = 100,
+                 opponent: Opponent = random_opponent, seeds: Sequence[int] | None = None) -> None:
+        self.batch = SeededBattleBatch(pairs, seeds)
+        self.num_envs = self.batch.size
+        self.max_turns = max_turns
+        self.opponent = opponent
+        self.available = self.batch.moves[:, 0, :] >= 0
+
+    @classmethod
+    def replicate(cls, first: Creature, second: Creature, n: int, **kwargs: Any) -> 'VecBattleEnv':
+        return cls([(first, second)] * n, **kwargs)
+
+    def _restart(self, rows: np.ndarray) -> None:
+        batch = self.batch
+        batch.health[rows] = batch.max_health[rows]
+        batch.stages[rows] = 0
+        batch.turns[rows] = 0
+        batch.winner[rows] = NO_WINNER
+        batch.done[rows] = False
+
+    def observe(self) -> np.ndarray:
+        batch = self.batch
+        observation = np.empty((self.num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        observation[:, HEALTH] = np.maximum(batch.health, 0) / batch.max_health
+        observation[:, STAGES] = batch.stages.reshape(self.num_envs, -1) / 6
+        observation[:, AVAILABLE] = self.available
+        return observation
+
+    def reset(self, seed: int | Sequence[int] | None = None) -> tuple[np.ndarray, dict[str, Any]]:
+        """Restarts every battle; an int ``seed`` seeds battle ``i`` with ``seed + i``."""
+        if seed is not None:
+            self.batch.seed([seed + i for i in range(self.num_envs)] if np.isscalar(seed) else seed)
+        self._restart(self.batch._index)
+        return self.observe(), {}
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """Plays one turn everywhere: ``(observations, rewards, terminated, truncated, info)``.
+
+        ``info`` holds the ``winner`` and ``turns`` of the battles that just
+        ended (``-1`` and ``0`` elsewhere).
+        """
+        batch = self.batch
+        slots = np.stack([np.asarray(actions, dtype=np.int64), self.opponent(batch)], axis=-1)
+        batch.turn(slots)
+        terminated = batch.winner != NO_WINNER
+        truncated = ~terminated & (batch.turns >= self.max_turns)
+        rewards = np.where(batch.winner == 0, 1.0, np.where(terminated, -1.0, 0.0)).astype(np.float32)
+        ended = terminated | truncated
+        info = {'winner': np.where(ended, batch.winner, NO_WINNER), 'turns': np.where(ended, batch.turns, 0)}
+        if ended.any():
+            self._restart(np.flatnonzero(ended))
+        return self.observe(), rewards, terminated, truncated, info
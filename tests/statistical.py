@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Helpers for testing the probabilistic combat rules.
+
+Casts are sampled in bulk from a seeded BattleRNG and their counts are checked
+with an exact two-sided binomial test. A correct rule fails a check with
+probability ALPHA at most, whatever seed or sample size is used, so the
+checks can be tight without being flaky.
+"""
+
+from collections import Counter
+from math import exp, lgamma, log
+
+from battlesys.definitions import Creature, Move, ResultType, StatsName, modifier_factor
+from battlesys.rng import BattleRNG
+
+
+ALPHA = 1e-6
+SAMPLES = 10_000
+
+_HITS = (ResultType.HIT, ResultType.CRIT)
+
+
+def expected_hit_probability(hit_rate: int, accuracy: int, evasion: int) -> float:
+    """Share of the rolls ``1..100`` at or under the hit rate adjusted by the accuracy / evasion factor ratio."""
+    if not hit_rate:
+        return 0.0
+    # same float expression as is_a_hit, which lands a hair under some whole rates (e.g. 30 * (1/3 / 0.4))
+    adjusted = hit_rate * (modifier_factor(accuracy) / modifier_factor(evasion))
+    return sum(roll <= adjusted for roll in range(1, 101)) / 100
+
+
+def binomial_p_value(successes: int, n: int, p: float) -> float:
+    """Exact two-sided p-value of ``successes`` in ``n`` trials of probability ``p``.
+
+    Sums the probabilities of every outcome no more likely than the observed one.
+    """
+    if p in (0.0, 1.0):
+        return float(successes == round(p * n))
+    log_pmf = [lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1) + k * log(p) + (n - k) * log(1 - p)
+               for k in range(n + 1)]
+    # relative tolerance so that equally likely outcomes are not split by rounding
+    observed = log_pmf[successes] + 1e-7
+    return min(1.0, sum(exp(value) for value in log_pmf if value <= observed))
+
+
+def assert_binomial(successes: int, n: int, p: float, alpha: float = ALPHA, what: str = 'successes') -> None:
+    p_value = binomial_p_value(successes, n, p)
+    assert p_value >= alpha, (f'{successes}/{n} {what} ({successes / n:.4f}) against an expected {p:.4f}: '
+                              f'p-value {p_value:.2e} < {alpha:.0e}')
+
+
+def creatures(accuracy: int = 0, evasion: int = 0) -> tuple[Creature, Creature]:
+    """A caster at ``accuracy`` stages and a target at ``evasion`` stages."""
+    stats = {StatsName.ATK: 10, StatsName.DFN: 10, StatsName.SAT: 10, StatsName.SDF: 10, StatsName.SPD: 10,
+             StatsName.EVA: 0, StatsName.ACC: 0}
+    caster, target = Creature(stats=stats), Creature(stats=stats)
+    caster.stats_modifiers[StatsName.ACC] = accuracy
+    target.stats_modifiers[StatsName.EVA] = evasion
+    return caster, target
+
+
+def sample_hits(move: Move, caster: Creature, target: Creature, n: int = SAMPLES, seed: int = 0) -> int:
+    """How many of ``n`` :meth:`Move.hit_or_miss` calls hit."""
+    rng = BattleRNG(seed)
+    hit_or_miss = move.hit_or_miss
+    return sum(hit_or_miss(caster, target, rng) is ResultType.HIT for _ in range(n))
+
+
+def sample_effects(move: Move, caster: Creature, target: Creature, n: int = SAMPLES, seed: int = 0) -> Counter:
+    """Counts of ``'hit'``, ``'alteration'`` and ``'condition'`` over ``n`` :meth:`Move.effect` calls.
+
+    The target is never changed, so every call is drawn from the same distribution.
+    """
+    rng = BattleRNG(seed)
+    effect = move.effect
+    counts: Counter = Counter()
+    for _ in range(n):
+        result = effect(caster, target, rng)
+        counts['hit'] += result.result in _HITS
+        counts['alteration'] += result.alteration is not None
+        counts['condition'] += result.condition is not None
+    return counts
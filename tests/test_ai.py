@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from time import perf_counter
+
+from battlesys.ai import ExpectimaxPolicy, ZobristKeys
+from battlesys.battle import Battle, fresh_creature, random_policy
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsAlteration, StatsName
+from battlesys.rng import BattleRNG
+from battlesys.snapshot import BattleState
+
+
+def _creature(*moves: Move, max_health: int = 30) -> Creature:
+    return fresh_creature(Creature(
+        max_health=max_health,
+        stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 5, StatsName.EVA: 0, StatsName.ACC: 0},
+        moves={MovePos(pos): move for pos, move in enumerate(moves, 1)}))
+
+
+POUND = Move(name='pound', hit_rate=100, damage=Damage(power=40, nature=Nature.PHYSICAL))
+WILD = Move(name='wild swing', hit_rate=30, damage=Damage(power=60, nature=Nature.PHYSICAL))
+SPLASH = Move(name='splash', hit_rate=100)
+SAND = Move(name='sand attack', hit_rate=100, alteration=StatsAlteration(StatsName.ACC, -1), alteration_rate=100)
+
+
+def test_picks_the_stronger_line_within_budget():
+    state = BattleState.from_creatures(_creature(SPLASH, WILD, POUND), _creature(POUND, SAND))
+    policy = ExpectimaxPolicy(budget_ms=30)
+    start = perf_counter()
+    result = policy.search(state, 0)
+    assert perf_counter() - start < 0.5
+    assert result.move == MovePos.THIRD
+    assert result.depth >= 2
+    assert len(policy.table) == 1 << 16
+
+
+def test_incremental_hash_matches_a_full_rehash():
+    keys = ZobristKeys(seed=3)
+    policy = ExpectimaxPolicy(seed=3)
+    policy.keys = keys
+    state = BattleState.from_creatures(_creature(SAND), _creature(POUND))
+    state_hash = keys.hash(state)
+    for caster in (0, 1, 0, 1):
+        _, state, state_hash = policy._casts(state, state_hash, caster, MovePos.FIRST)[-1]
+        assert state_hash == keys.hash(state)
+    assert state.creatures[1].stage(StatsName.ACC) == -2
+
+
+def test_beats_a_random_opponent_as_a_battle_policy():
+    def wins(policy_factory) -> int:
+        return sum(Battle(_creature(SPLASH, WILD, POUND), _creature(SPLASH, POUND, SAND),
+                          policies=(policy_factory(), random_policy), rng=BattleRNG(seed)).run().winner == 0
+                   for seed in range(30))
+    assert wins(lambda: ExpectimaxPolicy(budget_ms=5, table_size=1 << 10)) >= wins(lambda: random_policy) + 10
+
+
+def test_one_instance_searches_both_sides_and_turns():
+    state = BattleState.from_creatures(_creature(SPLASH, WILD, POUND), _creature(POUND, SAND))
+    shared = ExpectimaxPolicy(max_depth=2)
+    for side in (0, 1, 0, 1):
+        result = shared.search(state, side)
+        fresh = ExpectimaxPolicy(max_depth=2).search(state, side)
+        assert (result.move, result.value) == (fresh.move, fresh.value)
+
+    near_draw = BattleState(state.creatures, turn=99)
+    result, fresh = shared.search(near_draw, 0), ExpectimaxPolicy(max_depth=2).search(near_draw, 0)
+    assert (result.move, result.value) == (fresh.move, fresh.value)
+
+
+def test_battle_policy_searches_from_the_turns_played_to_the_battle_horizon():
+    policy, seen = ExpectimaxPolicy(max_depth=2), []
+    search = policy.search
+
+    def recording(state: BattleState, side: int):
+        seen.append((state.turn, policy.max_turns))
+        return search(state, side)
+    policy.search = recording
+    Battle(_creature(SPLASH), _creature(SPLASH), policies=(policy, random_policy), max_turns=3).run()
+    assert seen == [(0, 3), (1, 3), (2, 3)]
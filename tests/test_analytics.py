@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+from battlesys.analytics import CastStats, Histogram, QuantileSketch
+from battlesys.battle import Battle, fresh_creature
+from battlesys.catalog import load_catalog, load_roster
+from battlesys.definitions import MoveEffect, Nature, ResultType, StatsAlteration, StatsName
+from battlesys.rng import BattleRNG
+
+
+def _effects(n: int, seed: int = 0):
+    rolls = random.Random(seed)
+    for _ in range(n):
+        if rolls.random() < 0.2:
+            yield MoveEffect(result=ResultType.MISS)
+        else:
+            alteration = StatsAlteration(StatsName.DFN, 1) if rolls.random() < 0.3 else None
+            yield MoveEffect(result=ResultType.HIT, damage=rolls.randint(1, 400), alteration=alteration)
+
+
+def test_sketch_quantiles_are_within_their_relative_accuracy():
+    values = [random.Random(1).lognormvariate(3, 1) for _ in range(20_000)]
+    sketch = QuantileSketch(accuracy=0.02)
+    for value in values:
+        sketch.add(value)
+    values.sort()
+    for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.021)
+    assert len(sketch.buckets) < 500
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+
+
+def test_histogram_clamps_into_its_last_bin():
+    histogram = Histogram(bins=4)
+    for value in (0, 1, 3, 9):
+        histogram.add(value)
+    assert histogram.counts == [1, 1, 0, 2]
+    assert (histogram.count, histogram.mean) == (4, 13 / 4)
+    with pytest.raises(ValueError):
+        histogram.merge(Histogram(bins=8))
+
+
+def test_partial_aggregates_merge_into_the_whole():
+    moves = load_catalog()
+    whole = CastStats().update(_effects(3000), moves['claw_attack'])
+    parts = [CastStats().update(list(_effects(3000))[start::3], moves['claw_attack']) for start in range(3)]
+    merged = CastStats()
+    for part in parts:
+        merged.merge(part)
+    assert merged == whole
+    assert whole.casts == 3000 and whole.hits == whole.alteration_chances
+    assert set(whole.damage) == {Nature.PHYSICAL}
+    assert 0.75 < whole.hit_rate < 0.85 and 0.25 < whole.alteration_rate < 0.35
+    assert whole.damage_quantiles[Nature.PHYSICAL].quantile(0.5) == pytest.approx(200, rel=0.1)
+
+
+def test_observer_aggregates_the_casts_of_battles():
+    roster = load_roster()
+    stats = CastStats()
+    turns = 0
+    for seed in range(30):
+        battle = Battle(fresh_creature(roster['agumon']), fresh_creature(roster['gabumon']),
+                        rng=BattleRNG(seed), observer=stats.observer())
+        while not battle.finished:
+            turns += len(battle.step())
+    assert stats.casts == turns
+    assert sum(stats.results.values()) == stats.casts
+    assert set(stats.damage) <= {Nature.PHYSICAL, Nature.MAGICAL} and stats.damage
+    assert sum(histogram.count for histogram in stats.damage.values()) == stats.hits
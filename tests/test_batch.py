@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from battlesys.action import cast_move
+from battlesys.batch import HIT, MISS, STAT_INDEX, BattleBatch
+from battlesys.definitions import (Creature, Damage, Move, MovePos, Nature, StatsAlteration,
+                                   StatsName)
+
+
+def _stats(**kwargs: int) -> dict[StatsName, int]:
+    stats = {StatsName[name.upper()]: value for name, value in kwargs.items()}
+    stats.update({StatsName.EVA: 0, StatsName.ACC: 0})
+    return stats
+
+
+def _claw_attack() -> Move:
+    return Move(name='claw attack',
+                hit_rate=100,
+                damage=Damage(power=35, nature=Nature.PHYSICAL),
+                alteration=StatsAlteration(StatsName.DFN, -1),
+                alteration_rate=30)
+
+
+def _horn_attack() -> Move:
+    return Move(name='horn attack',
+                hit_rate=85,
+                damage=Damage(power=50, nature=Nature.PHYSICAL))
+
+
+def _agumon() -> Creature:
+    return Creature(name='agumon', max_health=26,
+                    stats=_stats(atk=10, dfn=8, sat=9, sdf=7, spd=8),
+                    moves={MovePos.FIRST: _claw_attack(), MovePos.SECOND: _horn_attack()})
+
+
+def _gabumon() -> Creature:
+    return Creature(name='gabumon', max_health=22,
+                    stats=_stats(atk=8, dfn=8, sat=10, sdf=9, spd=7),
+                    moves={MovePos.FIRST: _horn_attack()})
+
+
+def _scalar_battle(first: Creature, second: Creature, max_turns: int = 100) -> int:
+    sides = [first, second]
+    for side in sides:
+        side.health = side.max_health
+        side.stats_modifiers = {stat: 0 for stat in side.stats}
+    for _ in range(max_turns):
+        order = [1, 0] if second.current_stats(StatsName.SPD) > first.current_stats(StatsName.SPD) else [0, 1]
+        for caster in order:
+            creature = sides[caster]
+            cast_move(creature, random.choice(list(creature.moves)), sides[1 - caster])
+            if sides[1 - caster].health <= 0:
+                return caster
+    return -1
+
+
+def test_deterministic_damage_matches_scalar_cast_move():
+    caster, target = _agumon(), _gabumon()
+    caster.moves = {MovePos.FIRST: Move(name='pound', hit_rate=100,
+                                        damage=Damage(power=40, nature=Nature.PHYSICAL),
+                                        alteration=StatsAlteration(StatsName.DFN, -1),
+                                        alteration_rate=100)}
+    target.max_health = target.health = 1000
+    batch = BattleBatch.replicate(caster, target, 4)
+    batch.health[:] = 1000
+
+    for _ in range(8):
+        health = target.health
+        cast_move(caster, MovePos.FIRST, target)
+        results = batch.cast(0, np.zeros(4, dtype=np.int64))
+        assert (results == HIT).all()
+        assert (batch.health[:, 1] == target.health).all(), f"damage differs from scalar {health - target.health}"
+        assert (batch.stages[:, 1, STAT_INDEX[StatsName.DFN]] == target.stats_modifiers[StatsName.DFN]).all()
+
+
+def test_hit_and_alteration_rates_follow_move_rates():
+    n = 40_000
+    batch = BattleBatch.replicate(_agumon(), _gabumon(), n, seed=7)
+    batch.stages[:, 0, STAT_INDEX[StatsName.EVA]] = 1
+    results = batch.cast(1, np.zeros(n, dtype=np.int64))
+
+    # 85 * modifier_factor(0) / modifier_factor(1) == 56.67, so rolls 1..56 hit
+    assert abs(np.mean(results == HIT) - 0.56) < 0.01
+    assert set(np.unique(results)) <= {HIT, MISS}
+
+    batch = BattleBatch.replicate(_agumon(), _gabumon(), n, seed=7)
+    batch.health[:, 1] = 1000
+    batch.cast(0, np.zeros(n, dtype=np.int64))
+    lowered = batch.stages[:, 1, STAT_INDEX[StatsName.DFN]] == -1
+    assert abs(np.mean(lowered) - 0.30) < 0.01
+
+
+def test_batch_win_rate_is_statistically_identical_to_scalar_battles():
+    random.seed(3)
+    n = 4_000
+    scalar_wins = sum(_scalar_battle(_agumon(), _gabumon()) == 0 for _ in range(n)) / n
+
+    batch = BattleBatch.replicate(_agumon(), _gabumon(), n, seed=3)
+    batch.run()
+
+    assert batch.done.all()
+    assert (batch.winner >= 0).all()
+    # both estimates have a standard error below 0.008
+    assert abs(batch.win_rate(0) - scalar_wins) < 0.035
+
+
+def test_random_slots_only_picks_available_moves():
+    batch = BattleBatch.replicate(_agumon(), _gabumon(), 1_000, seed=1)
+    assert set(np.unique(batch.random_slots(0))) == {0, 1}
+    assert set(np.unique(batch.random_slots(1))) == {0}
+
+
+def test_stats_the_engine_would_trip_on_are_rejected_up_front():
+    no_speed = Creature(name='slowpoke', max_health=20, stats={StatsName.ATK: 10, StatsName.DFN: 8,
+                                                                StatsName.EVA: 0, StatsName.ACC: 0},
+                        moves={MovePos.FIRST: _horn_attack()})
+    with pytest.raises(KeyError):
+        BattleBatch.replicate(_agumon(), no_speed, 4)
+
+    no_defense = _agumon()
+    no_defense.stats[StatsName.DFN] = 0
+    with pytest.raises(ZeroDivisionError):
+        cast_move(_agumon(), MovePos.SECOND, no_defense)
+    with pytest.raises(ZeroDivisionError):
+        BattleBatch.replicate(_agumon(), no_defense, 4)
+
+
+def test_a_defense_lowered_to_zero_divides_by_zero_as_in_the_engine():
+    brittle = _agumon()
+    brittle.stats[StatsName.DFN] = 3
+    brittle.stats_modifiers[StatsName.DFN] = -6
+    with pytest.raises(ZeroDivisionError):
+        cast_move(_agumon(), MovePos.FIRST, brittle)
+
+    batch = BattleBatch.replicate(_agumon(), brittle, 4, seed=0)
+    batch.stages[:, 1, STAT_INDEX[StatsName.DFN]] = -6
+    with pytest.raises(ZeroDivisionError):
+        batch.cast(0, np.zeros(4, dtype=np.int64))
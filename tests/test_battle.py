@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from battlesys.battle import DRAW, Battle, fixed_policy, fresh_creature
+from battlesys.definitions import (Creature, Damage, Move, MovePos, Nature, StatsAlteration,
+                                   StatsName)
+from battlesys.rng import BattleRNG
+
+
+def _creature(speed: int) -> Creature:
+    return Creature(name=f'speed {speed}', max_health=20,
+                    stats={StatsName.ATK: 10, StatsName.DFN: 10, StatsName.SPD: speed,
+                           StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos.FIRST: Move(name='pound', hit_rate=100,
+                                               damage=Damage(power=40, nature=Nature.PHYSICAL)),
+                           MovePos.SECOND: Move(name='scary face', hit_rate=100,
+                                                alteration=StatsAlteration(StatsName.SPD, -2),
+                                                alteration_rate=100),
+                           MovePos.THIRD: Move(name='splash', hit_rate=100)})
+
+
+def test_faster_creature_acts_first_and_wins_the_race():
+    battle = Battle(fresh_creature(_creature(8)), fresh_creature(_creature(9)),
+                    policies=(fixed_policy(MovePos.FIRST), fixed_policy(MovePos.FIRST)))
+
+    actions = battle.step()
+    assert [action.caster for action in actions] == [1, 0]
+
+    outcome = battle.run()
+    assert outcome.winner == 1
+    assert outcome.turns == 4
+    assert battle.creatures[0].health <= 0 < battle.creatures[1].health
+    assert battle.step() == []
+
+
+def test_speed_changes_reorder_later_turns():
+    battle = Battle(_creature(8), _creature(9), policies=(fixed_policy(MovePos.SECOND), fixed_policy(MovePos.THIRD)))
+
+    assert [action.caster for action in battle.step()] == [1, 0]
+    assert [action.caster for action in battle.step()] == [0, 1]
+
+
+def test_battle_without_damage_ends_in_a_draw():
+    battle = Battle(_creature(8), _creature(8), policies=(fixed_policy(MovePos.THIRD), fixed_policy(MovePos.THIRD)),
+                    max_turns=12)
+
+    outcome = battle.run()
+    assert outcome.winner == DRAW
+    assert outcome.turns == 12
+
+
+def test_seeded_battles_are_reproducible():
+    template = _creature(8)
+    outcomes = [Battle(fresh_creature(template), fresh_creature(template), rng=BattleRNG(seed=3)).run()
+                for _ in range(2)]
+    assert outcomes[0] == outcomes[1]
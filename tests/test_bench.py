@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from battlesys.bench import BENCHMARKS, compare, main, run_benchmarks
+
+
+def test_compare_flags_only_slowdowns_past_threshold():
+    baseline = {'cast_move': 1000.0, 'effect': 800.0, 'battle': 50_000.0}
+    results = {'cast_move': 1300.0, 'effect': 900.0, 'battle': 20_000.0, 'new_benchmark': 5.0}
+
+    regressions = compare(results, baseline, threshold=0.2)
+
+    assert [regression.name for regression in regressions] == ['cast_move']
+    assert round(regressions[0].slowdown, 2) == 0.3
+
+
+def test_every_hot_path_benchmark_runs():
+    results = run_benchmarks(repeat=1, min_time=0.001)
+    assert list(results) == list(BENCHMARKS)
+    assert all(nanoseconds > 0 for nanoseconds in results.values())
+
+
+def test_main_fails_on_regression_and_writes_results(tmp_path):
+    baseline, output = tmp_path / 'baseline.json', tmp_path / 'results.json'
+    baseline.write_text(json.dumps({'results': {'modifier_factor': 0.001}}))
+    argv = ['modifier_factor', '--repeat', '1', '--min-time', '0.001', '--baseline', str(baseline)]
+
+    assert main([*argv, '--output', str(output)]) == 1
+    assert 'modifier_factor' in json.loads(output.read_text())['results']
+    assert main([*argv, '--update-baseline']) == 0
+    assert main([*argv, '--threshold', '100']) == 0
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import multiprocessing
+from dataclasses import replace
+
+import battlesys.hashing as hashing
+from battlesys.cache import MatchupCache
+from battlesys.catalog import load_roster
+from battlesys.cli import main
+from battlesys.definitions import Condition, MovePos, Nature, StatsAlteration, StatsName
+from battlesys.hashing import definition_hash
+from battlesys.sweep import Axis, sweep
+
+
+def _hammer(path, worker: int) -> None:
+    cache = MatchupCache(path, maxsize=60)
+    for index in range(40):
+        cache.put(f'{worker}:{index}', (worker, index))
+        assert cache.get(f'{worker}:{index // 2}') in (None, (worker, index // 2))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = MatchupCache(tmp_path / 'cache.sqlite', maxsize=3)
+    assert cache.get('a') is None
+    for key in 'abc':
+        cache.put(key, {'key': key})
+    assert cache.get('a') == {'key': 'a'}
+    cache.put('d', {'key': 'd'})
+    assert 'b' not in cache and len(cache) == 3
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 1, 1, 3)
+    cache.close()
+    assert MatchupCache(tmp_path / 'cache.sqlite').get('d') == {'key': 'd'}
+
+
+def test_every_definition_field_is_part_of_the_key(monkeypatch):
+    roster = load_roster()
+    first, second = roster['agumon'], roster['gabumon']
+    move = first.moves[MovePos.FIRST]
+    variants = [replace(move, hit_rate=move.hit_rate - 1),
+                replace(move, damage=replace(move.damage, power=move.damage.power + 1)),
+                replace(move, damage=replace(move.damage, nature=Nature.PHYSICAL)),
+                replace(move, alteration=StatsAlteration(StatsName.ATK, -1)),
+                replace(move, alteration_rate=move.alteration_rate + 1),
+                replace(move, condition=Condition('burn', 1, None), condition_rate=10)]
+    key = definition_hash(first, second, 100, 0, 100)
+    keys = {definition_hash(replace(first, moves={**first.moves, MovePos.FIRST: variant}), second, 100, 0, 100)
+            for variant in variants}
+    keys |= {definition_hash(replace(first, level=6), second, 100, 0, 100),
+             definition_hash(replace(first, stats={**first.stats, StatsName.SPD: 9}), second, 100, 0, 100),
+             definition_hash(first, second, 100, 1, 100)}
+    assert key not in keys and len(keys) == len(variants) + 3
+    assert definition_hash(first, second, 100, 0, 100) == key
+    monkeypatch.setattr(hashing, 'ENGINE_VERSION', hashing.ENGINE_VERSION + 1)
+    assert definition_hash(first, second, 100, 0, 100) != key
+
+
+def test_concurrent_processes_share_one_cache(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    workers = [multiprocessing.Process(target=_hammer, args=(path, worker)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [worker.exitcode for worker in workers] == [0] * 4
+    assert len(MatchupCache(path)) == 60
+
+
+def test_sweeps_and_the_cli_reuse_persisted_results(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    roster = load_roster()
+    axes = [Axis('agumon', MovePos.FIRST, 'hit_rate', (80, 100))]
+    first = sweep(roster, axes, battles=50, workers=1, cache=MatchupCache(path))
+    cache = MatchupCache(path)
+    again = sweep(roster, axes, battles=50, workers=1, cache=cache)
+    assert (again.computed, again.reused, again.rows) == (0, 4, first.rows)
+    assert (cache.hits, cache.misses) == (4, 0)
+
+    def simulate():
+        out = io.StringIO()
+        assert main(['simulate', 'agumon', 'gabumon', '-n', '30', '--cache', str(path)], stdout=out) == 0
+        return json.loads(out.getvalue())
+
+    assert simulate() == simulate()
+    assert len(MatchupCache(path)) == 5
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.calculator import DamageCalculator
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsAlteration, StatsName
+
+
+def _creature(**moves: Move) -> Creature:
+    creature = Creature(stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SAT: 9, StatsName.SDF: 7,
+                               StatsName.EVA: 0, StatsName.ACC: 0},
+                        moves={MovePos[pos.upper()]: move for pos, move in moves.items()})
+    creature.health = 20
+    return creature
+
+
+def test_matrix_matches_build_damage_and_hit_math():
+    caster = _creature(first=Move(name='horn attack', hit_rate=85, damage=Damage(power=50, nature=Nature.PHYSICAL)),
+                       second=Move(name='howl', hit_rate=100, alteration=StatsAlteration(StatsName.ATK, 1),
+                                   alteration_rate=100))
+    target = _creature()
+    matrix = DamageCalculator().matrix(caster, target, attack_stages=range(-2, 3), defense_stages=range(-2, 3),
+                                       evasion_stages=(0, 1))
+    assert len(matrix) == 2 * 5 * 5 * 2
+
+    for entry in matrix:
+        caster.stats_modifiers[StatsName.ATK] = entry.attack_stage
+        target.stats_modifiers[StatsName.DFN] = entry.defense_stage
+        expected, _ = caster.moves[entry.move_pos].build_damage(caster, target)
+        assert entry.damage == expected
+
+    entry = matrix[MovePos.FIRST, 0, 0, 0, 1]
+    assert entry.hit_probability == pytest.approx(0.56)
+    assert entry.hits_to_ko == -(-20 // entry.damage)
+    assert entry.ko_probabilities[entry.hits_to_ko - 2] == 0
+    assert entry.ko_probabilities[entry.hits_to_ko - 1] == pytest.approx(0.56 ** entry.hits_to_ko)
+    assert matrix.damage_range(MovePos.SECOND) == (0, 0)
+    assert matrix[MovePos.SECOND, 0, 0, 0, 0].ko_probabilities == (0.0,) * 5
+    low, high = matrix.damage_range(MovePos.FIRST)
+    assert low == matrix[MovePos.FIRST, -2, 2, 0, 0].damage < high == matrix[MovePos.FIRST, 2, -2, 0, 0].damage
+
+
+def test_repeated_queries_hit_the_bounded_cache():
+    calculator = DamageCalculator(cache_size=8)
+    caster = _creature(first=Move(name='pound', hit_rate=100, damage=Damage(power=40, nature=Nature.PHYSICAL)))
+    calculator.matrix(caster, _creature(), attack_stages=range(-6, 7))
+    calculator.matrix(caster, _creature(), attack_stages=range(-1, 2))
+    info = calculator.cache_info()['damage_value']
+    assert (info.hits, info.misses, info.currsize) == (3, 13, 8)
+    calculator.matrix(caster, _creature(), attack_stages=(-6,))
+    assert calculator.cache_info()['damage_value'].misses == 14
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+import battlesys.catalog as catalog
+from battlesys.catalog import CatalogError, MoveCatalog, UnknownMoveError, load_catalog
+from battlesys.definitions import Damage, Nature, StatsAlteration, StatsName
+
+
+def _write(path, *entries):
+    path.write_text(''.join((entry if isinstance(entry, str) else json.dumps(entry)) + '\n' for entry in entries))
+    return path
+
+
+def test_default_catalog_builds_interned_immutable_moves():
+    moves = load_catalog()
+    claw_attack = moves['claw_attack']
+    assert claw_attack.name == 'Claw Attack'
+    assert claw_attack.damage == Damage(power=35, nature=Nature.PHYSICAL)
+    assert claw_attack.alteration == StatsAlteration(StatsName.DFN, 1)
+    assert claw_attack.alteration_rate == 30
+    assert moves['claw_attack'] is claw_attack
+    assert moves['tackle'].damage is claw_attack.damage
+    with pytest.raises(FrozenInstanceError):
+        claw_attack.hit_rate = 0
+    with pytest.raises(FrozenInstanceError):
+        claw_attack.damage.power = 0
+    with pytest.raises(UnknownMoveError):
+        moves['splash']
+
+
+def test_entries_are_parsed_on_first_access(tmp_path):
+    path = _write(tmp_path / 'moves.jsonl',
+                  {'id': 'pound', 'name': 'Pound', 'hit_rate': 100, 'damage': {'power': 40, 'nature': 'physical'}},
+                  '{"id": "broken", "name": ')
+    moves = MoveCatalog(path)
+    assert list(moves) == ['pound', 'broken']
+    assert moves['pound'].damage.power == 40
+    with pytest.raises(CatalogError, match='broken'):
+        moves['broken']
+
+
+def test_index_is_cached_until_the_catalog_changes(tmp_path, monkeypatch):
+    path = _write(tmp_path / 'moves.jsonl', {'id': 'howl', 'name': 'Howl', 'hit_rate': 100})
+    MoveCatalog(path)
+    assert (tmp_path / 'moves.jsonl.idx').exists()
+
+    def rescan(path):
+        raise AssertionError('index should come from the cache')
+    with monkeypatch.context() as patch:
+        patch.setattr(catalog, '_scan', rescan)
+        assert 'howl' in MoveCatalog(path)
+
+    _write(path, {'id': 'growl', 'name': 'Growl', 'hit_rate': 100}, {'id': 'howl', 'name': 'Howl', 'hit_rate': 100})
+    moves = MoveCatalog(path)
+    assert list(moves) == ['growl', 'howl']
+    assert moves['howl'].name == 'Howl'
+
+
+def test_a_read_only_catalog_keeps_its_index_in_the_user_cache(tmp_path, monkeypatch):
+    shipped = tmp_path / 'site-packages'
+    shipped.mkdir()
+    path = _write(shipped / 'moves.jsonl', {'id': 'howl', 'name': 'Howl', 'hit_rate': 100})
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    shipped.chmod(0o555)
+    try:
+        if os.access(shipped, os.W_OK):
+            # root ignores the mode bits
+            monkeypatch.setattr(catalog.os, 'access', lambda path, mode: path != shipped)
+        assert 'howl' in MoveCatalog(path)
+        assert [entry.name for entry in shipped.iterdir()] == ['moves.jsonl']
+        assert len(list((tmp_path / 'cache' / 'battlesys').glob('moves.jsonl.*.idx'))) == 1
+
+        def rescan(path):
+            raise AssertionError('index should come from the cache')
+        with monkeypatch.context() as patch:
+            patch.setattr(catalog, '_scan', rescan)
+            assert 'howl' in MoveCatalog(path)
+
+        # no writable cache at all: the catalog still loads
+        (tmp_path / 'blocked').write_text('')
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'blocked'))
+        assert MoveCatalog(path)['howl'].name == 'Howl'
+    finally:
+        shipped.chmod(0o755)
+
+
+def test_duplicate_ids_are_rejected(tmp_path):
+    path = _write(tmp_path / 'moves.jsonl', {'id': 'howl', 'name': 'Howl'}, {'id': 'howl', 'name': 'Howl'})
+    with pytest.raises(CatalogError, match='duplicate'):
+        MoveCatalog(path, cache=False)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import subprocess
+import sys
+
+from battlesys.battle import Battle, fresh_creature
+from battlesys.catalog import load_roster
+import battlesys.cli as cli
+from battlesys.cli import main
+from battlesys.eventlog import EventLog
+from battlesys.rng import BattleRNG
+
+
+def _run(*argv, stdin=''):
+    out = io.StringIO()
+    code = main(list(argv), stdin=io.StringIO(stdin), stdout=out)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_simulate_prints_one_json_summary():
+    code, [summary] = _run('simulate', 'agumon', 'gabumon', '-n', '50', '--seed', '3')
+    assert code == 0
+    assert summary['battles'] == 50
+    assert sum(summary['wins']) + summary['draws'] == 50
+    assert summary['win_rate'] == summary['wins'][0] / 50
+
+
+def test_simulate_as_a_sharded_job_gives_the_same_summary(tmp_path):
+    job = str(tmp_path / 'job')
+    sharded = _run('simulate', 'agumon', 'gabumon', '-n', '60', '--job', job, '--shard-size', '25')
+    assert sharded == _run('simulate', 'agumon', 'gabumon', '-n', '60')
+    assert _run('worker', job) == (0, [{'job': job, 'shards': 0}])
+
+
+def test_stdin_batch_answers_every_job_and_reports_failures():
+    jobs = 'simulate agumon gabumon -n 20\n\nsimulate agumon nobody\nfly away\nsimulate gabumon agumon -n 20\n'
+    code, lines = _run('--stdin-batch', stdin=jobs)
+    assert code == 1
+    assert [line.get('battles') for line in lines] == [20, None, None, 20]
+    assert 'nobody' in lines[1]['error']
+    assert lines[2] == {'error': 'invalid job', 'job': 'fly away'}
+
+
+def test_replay_prints_and_verifies_a_log(tmp_path):
+    roster = load_roster()
+    path = tmp_path / 'events.bin'
+    with EventLog(path) as log:
+        for battle_id in range(3):
+            battle = Battle(fresh_creature(roster['agumon']), fresh_creature(roster['gabumon']),
+                            rng=BattleRNG.stream(7, battle_id))
+            battle.observer = log.recorder(battle_id, battle)
+            battle.run()
+    code, events = _run('replay', str(path), '--battle', '1')
+    assert code == 0 and events
+    assert {event['battle'] for event in events} == {1}
+    assert _run('replay', str(path), '--verify', 'agumon', 'gabumon', '--seed', '7')[1] == [
+        {'log': str(path), 'mismatches': []}]
+    code, [report] = _run('replay', str(path), '--verify', 'gabumon', 'agumon', '--seed', '7')
+    assert code == 1 and report['mismatches']
+
+
+def test_importing_the_cli_loads_no_subsystem():
+    loaded = subprocess.run([sys.executable, '-c', 'import sys, battlesys.cli; print(sorted(sys.modules))'],
+                            capture_output=True, text=True, check=True).stdout
+    for heavy in ('numpy', 'battlesys.definitions', 'battlesys.montecarlo', 'battlesys.catalog'):
+        assert f"'{heavy}'" not in loaded
+
+
+def test_batch_bench_jobs_answer_one_json_line_and_share_the_roster(tmp_path):
+    jobs = (f'bench modifier_factor --repeat 1 --min-time 0.001 --baseline {tmp_path / "none.json"}\n'
+            'simulate agumon gabumon -n 5\nsimulate gabumon agumon -n 5\n')
+    cli._rosters.clear()
+    code, (bench, *simulations) = _run('--stdin-batch', stdin=jobs)
+    assert code == 0
+    assert list(bench['results']) == ['modifier_factor'] and bench['regressions'] == []
+    assert [simulation['battles'] for simulation in simulations] == [5, 5]
+    assert len(cli._rosters) == 1
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.action import cast_move
+from battlesys.compact import CompactCreature, CreatureTable
+from battlesys.definitions import (Creature, Damage, Move, MoveEffect, MovePos, Nature, ResultType,
+                                   StatsAlteration, StatsName)
+
+
+def _moves() -> dict[MovePos, Move]:
+    return {MovePos.FIRST: Move(name='pound', hit_rate=100,
+                                damage=Damage(power=40, nature=Nature.PHYSICAL)),
+            MovePos.SECOND: Move(name='screech', hit_rate=100,
+                                 alteration=StatsAlteration(StatsName.DFN, -2),
+                                 alteration_rate=100),
+            MovePos.THIRD: Move(name='howl', hit_rate=100,
+                                alteration=StatsAlteration(StatsName.ATK, 1),
+                                alteration_rate=100)}
+
+
+def _creature() -> Creature:
+    return Creature(name='eevee', max_health=200, health=200, moves=_moves(),
+                    stats={StatsName.ATK: 11, StatsName.DFN: 9, StatsName.SAT: 8, StatsName.SDF: 8,
+                           StatsName.SPD: 10, StatsName.EVA: 0, StatsName.ACC: 0})
+
+
+def test_compact_creature_matches_dataclass_through_cast_move():
+    player, enemy = _creature(), _creature()
+    table = CreatureTable([_creature(), _creature()])
+    compact_player, compact_enemy = table[0], table[1]
+
+    script = [(MovePos.FIRST, 'enemy'), (MovePos.THIRD, 'self'), (MovePos.SECOND, 'enemy'),
+              (MovePos.FIRST, 'enemy'), (MovePos.SECOND, 'enemy'), (MovePos.SECOND, 'enemy'),
+              (MovePos.SECOND, 'enemy'), (MovePos.SECOND, 'enemy'), (MovePos.FIRST, 'enemy')]
+    for move_pos, target in script:
+        expected = cast_move(player, move_pos, player if target == 'self' else enemy)
+        result = cast_move(compact_player, move_pos, compact_player if target == 'self' else compact_enemy)
+        assert result is expected
+        assert compact_enemy.health == enemy.health
+        for stat in enemy.stats:
+            assert compact_enemy.current_stats(stat) == enemy.current_stats(stat)
+            assert compact_player.current_stats(stat) == player.current_stats(stat)
+
+    assert compact_enemy.stats_modifiers[StatsName.DFN] == enemy.stats_modifiers[StatsName.DFN] == -10
+
+
+def test_table_rows_share_storage():
+    table = CreatureTable()
+    row = table.append(_creature())
+    view = table[row]
+    view.health -= 15
+
+    assert table.health[row] == 185
+    assert table[row].health == 185
+    assert CompactCreature.from_creature(_creature()).stats[StatsName.ATK] == 11
+    assert len(table) == 1
+    assert [creature.name for creature in table] == ['eevee']
+
+
+def test_a_stat_the_creature_does_not_have_raises_like_the_dataclass():
+    creature = _creature()
+    compact = CompactCreature.from_creature(creature)
+
+    assert compact.stats == creature.stats
+    assert compact.stats_modifiers == creature.stats_modifiers
+    for stat in (StatsName.STR, StatsName.LUK):
+        with pytest.raises(KeyError):
+            creature.current_stats(stat)
+        with pytest.raises(KeyError):
+            compact.current_stats(stat)
+    with pytest.raises(KeyError):
+        compact.apply(MoveEffect(result=ResultType.HIT, alteration=StatsAlteration(StatsName.STR, 1)))
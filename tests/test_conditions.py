@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.action import cast_move
+from battlesys.battle import Battle, fixed_policy
+from battlesys.catalog import load_catalog, move_from_dict
+from battlesys.conditions import ConditionScheduler
+from battlesys.definitions import (Condition, Creature, Damage, Move, MovePos, Nature, ResultType, StatsAlteration,
+                                   StatsName)
+from battlesys.rng import BattleRNG
+
+
+POISON = Condition(name='poison', damage=2, alteration=None, period=1, duration=3)
+SLOW = Condition(name='slow', damage=0, alteration=StatsAlteration(StatsName.SPD, -1), period=2, duration=2)
+
+
+def _creature(*moves: Move) -> Creature:
+    return Creature(max_health=20, health=20,
+                    stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 5, StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos(pos): move for pos, move in enumerate(moves, 1)})
+
+
+def test_only_due_afflictions_are_ticked():
+    scheduler = ConditionScheduler()
+    poisoned, slowed, healthy = _creature(), _creature(), _creature()
+    scheduler.afflict(poisoned, POISON)
+    scheduler.afflict(slowed, SLOW)
+
+    assert [creature for creature, _, _ in scheduler.tick()] == [poisoned]
+    assert [creature for creature, _, _ in scheduler.tick()] == [slowed, poisoned]
+    assert poisoned.health == 16 and slowed.stats_modifiers[StatsName.SPD] == -1
+    assert healthy.health == 20
+    assert scheduler.conditions_of(slowed) == [SLOW]
+
+    scheduler.afflict(poisoned, POISON)  # restarts the poison instead of stacking it
+    assert len(scheduler.advance(10)) == 4
+    assert poisoned.health == 10 and slowed.stats_modifiers[StatsName.SPD] == -2
+    assert len(scheduler) == 0 and scheduler.conditions_of(poisoned) == []
+
+
+def test_cure_stops_the_ticks():
+    scheduler = ConditionScheduler()
+    creature = _creature()
+    scheduler.afflict(creature, POISON)
+    scheduler.afflict(creature, SLOW)
+    assert scheduler.cure(creature, 'poison') == 1
+    assert scheduler.advance(4) and creature.health == 20
+    assert scheduler.cure(creature) == 0
+
+
+def test_moves_inflict_conditions_that_can_knock_out():
+    sting = Move(name='sting', hit_rate=100, damage=Damage(power=1, nature=Nature.PHYSICAL),
+                 condition=Condition(name='poison', damage=5, alteration=None, duration=10), condition_rate=100)
+    caster, target = _creature(sting), _creature(sting)
+    scheduler = ConditionScheduler()
+    assert cast_move(caster, MovePos.FIRST, target, BattleRNG(0), conditions=scheduler) is ResultType.HIT
+    assert scheduler.conditions_of(target) == [sting.condition]
+
+    splash = Move(name='splash', hit_rate=100)
+    battle = Battle(_creature(sting), _creature(splash), policies=(fixed_policy(MovePos.FIRST),) * 2,
+                    rng=BattleRNG(1))
+    outcome = battle.run()
+    assert outcome.winner == 0
+    assert battle.creatures[1].health <= 0 < battle.creatures[0].health
+
+
+def test_catalog_moves_carry_their_conditions():
+    sting = load_catalog()['poison_sting']
+    assert sting.condition == Condition(name='poison', damage=2, alteration=None, period=1, duration=4)
+    assert sting.condition_rate == 30
+
+
+def test_conditions_need_a_positive_period_and_duration():
+    for period, duration in ((0, 3), (-1, 3), (1, 0)):
+        with pytest.raises(ValueError, match='at least 1'):
+            Condition(name='stuck', damage=1, alteration=None, period=period, duration=duration)
+    with pytest.raises(ValueError, match='period'):
+        move_from_dict({'name': 'Stuck', 'condition': {'name': 'stuck', 'period': 0}})
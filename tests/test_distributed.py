@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from battlesys.catalog import load_roster
+from battlesys.distributed import JobIncomplete, JobQueue, JobSpec, run_job, work, worker_id
+from battlesys.montecarlo import simulate_matchup
+
+
+def _spec(battles: int = 250, shard_size: int = 50) -> JobSpec:
+    roster = load_roster()
+    return JobSpec(roster['agumon'], roster['gabumon'], battles, seed=5, shard_size=shard_size)
+
+
+def _expected(spec: JobSpec):
+    return simulate_matchup(spec.first, spec.second, spec.battles, workers=1, seed=spec.seed,
+                            max_turns=spec.max_turns)
+
+
+def _claim_and_die(path) -> None:
+    JobQueue(path).claim()
+    os._exit(1)
+
+
+def test_an_interrupted_job_resumes_without_redoing_shards(tmp_path):
+    spec = _spec()
+    queue = JobQueue.create(tmp_path, spec)
+    assert queue.status() == {'pending': 5, 'claimed': 0, 'done': 0, 'failed': 0}
+    assert work(tmp_path, limit=2) == 2
+    done = {path.name: path.stat().st_mtime_ns for path in (tmp_path / 'done').iterdir()}
+    with pytest.raises(JobIncomplete):
+        queue.result()
+
+    resumed = JobQueue.create(tmp_path, spec)
+    assert work(tmp_path) == 3
+    assert resumed.finished and resumed.result() == _expected(spec)
+    assert all((tmp_path / 'done' / name).stat().st_mtime_ns == mtime for name, mtime in done.items())
+    with pytest.raises(ValueError):
+        JobQueue.create(tmp_path, _spec(battles=100))
+
+
+def test_expired_claims_are_retried_until_their_attempts_run_out(tmp_path):
+    spec = _spec(battles=100)
+    queue = JobQueue.create(tmp_path, spec, lease=0.05, max_attempts=2)
+    lost = queue.claim('dead-worker')
+    time.sleep(0.1)
+    assert work(tmp_path, lease=0.05, max_attempts=2) == 2
+    assert queue.result() == _expected(spec)
+    assert not (tmp_path / 'claimed' / lost.name).exists()
+
+    failing = tmp_path / 'failing'
+    queue = JobQueue.create(failing, spec, lease=0.05, max_attempts=2)
+    for _ in range(2):
+        queue.claim('dead-worker')
+        queue.claim('dead-worker')
+        time.sleep(0.1)
+        queue.reclaim_expired()
+    assert queue.finished and queue.status()['failed'] == 2
+    with pytest.raises(JobIncomplete):
+        queue.result()
+
+
+def test_local_workers_replace_a_dead_one(tmp_path):
+    spec = _spec(battles=400)
+    JobQueue.create(tmp_path, spec)
+    dying = multiprocessing.Process(target=_claim_and_die, args=(tmp_path,))
+    dying.start()
+    dying.join()
+    queue = JobQueue(tmp_path)
+    assert queue.status()['claimed'] == 1
+    assert run_job(tmp_path, spec, workers=3, poll=0.05, lease=1.0) == _expected(spec)
+    assert queue.status() == {'pending': 0, 'claimed': 0, 'done': 8, 'failed': 0}
+    assert queue.abandon(worker_id(dying.pid)) == 0
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.definitions import Creature, Damage, Move, Nature, ResultType, StatsAlteration, StatsName
+from battlesys.rng import BattleRNG
+
+
+class CountingRNG(BattleRNG):
+    __slots__ = ('rolls',)
+
+    def __init__(self, seed: int) -> None:
+        super().__init__(seed)
+        self.rolls = 0
+
+    def roll(self) -> int:
+        self.rolls += 1
+        return super().roll()
+
+
+def _creature(**stages: int) -> Creature:
+    creature = Creature(stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SAT: 9, StatsName.SDF: 7,
+                               StatsName.EVA: 0, StatsName.ACC: 0})
+    creature.stats_modifiers.update({StatsName[stat.upper()]: count for stat, count in stages.items()})
+    return creature
+
+
+@pytest.mark.parametrize('move, rolls', [
+    (Move(name='pound', hit_rate=100, damage=Damage(power=40, nature=Nature.PHYSICAL)), 0),
+    (Move(name='pepper breath', hit_rate=90, damage=Damage(power=45, nature=Nature.MAGICAL)), 1),
+    (Move(name='howl', hit_rate=100, alteration=StatsAlteration(StatsName.ATK, 1), alteration_rate=100), 0),
+    (Move(name='claw attack', hit_rate=100, damage=Damage(power=35, nature=Nature.PHYSICAL),
+          alteration=StatsAlteration(StatsName.DFN, -1), alteration_rate=30), 1),
+    (Move(name='splash', hit_rate=0), 0),
+], ids=lambda value: value.name if isinstance(value, Move) else str(value))
+def test_effect_only_rolls_for_outcomes_left_to_chance(move, rolls):
+    caster, target, rng = _creature(), _creature(), CountingRNG(seed=5)
+    move.effect(caster, target, rng)
+    assert rng.rolls == rolls
+
+    # casting on itself never misses and so never rolls to hit
+    rng.rolls = 0
+    assert move.effect(caster, caster, rng).result is ResultType.HIT
+    assert rng.rolls == (move.alteration_rate not in (0, 100))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from battlesys.battle import Battle, fresh_creature
+from battlesys.definitions import (Creature, Damage, Move, MoveEffect, MovePos, Nature, ResultType,
+                                   StatsAlteration, StatsName)
+from battlesys.eventlog import RECORD, EventLog, EventReader, verify_replay
+from battlesys.rng import BattleRNG
+
+
+def _creature() -> Creature:
+    return Creature(name='gabumon', max_health=22,
+                    stats={StatsName.ATK: 8, StatsName.DFN: 8, StatsName.SAT: 10, StatsName.SDF: 9,
+                           StatsName.SPD: 7, StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos.FIRST: Move(name='blue blaster', hit_rate=90,
+                                               damage=Damage(power=35, nature=Nature.MAGICAL),
+                                               alteration=StatsAlteration(StatsName.ACC, -1),
+                                               alteration_rate=30),
+                           MovePos.SECOND: Move(name='horn attack', hit_rate=85,
+                                                damage=Damage(power=50, nature=Nature.PHYSICAL))})
+
+
+def _battle(seed: int) -> Battle:
+    return Battle(fresh_creature(_creature()), fresh_creature(_creature()), rng=BattleRNG.stream(99, seed))
+
+
+def _write_log(path, battles: int) -> int:
+    casts = 0
+    with EventLog(path) as log:
+        for battle_id in range(battles):
+            battle = _battle(battle_id)
+            battle.observer = log.recorder(battle_id, battle)
+            for _ in range(battle.max_turns):
+                casts += len(battle.step())
+                if battle.finished:
+                    break
+    return casts
+
+
+def test_events_are_fixed_size_records_of_each_cast(tmp_path):
+    path = tmp_path / 'events.bin'
+    casts = _write_log(path, 20)
+
+    assert path.stat().st_size == casts * RECORD.size
+    with EventReader(path) as reader:
+        assert len(reader) == casts
+        events = list(reader)
+        assert [event.battle for event in events] == sorted(event.battle for event in events)
+        assert {event.result for event in events} <= {ResultType.HIT, ResultType.MISS}
+        assert all(event.damage > 0 for event in events if event.result is ResultType.HIT)
+        assert all(event.damage == 0 and event.alteration is None
+                   for event in events if event.result is ResultType.MISS)
+        assert any(event.alteration == (StatsName.ACC, -1) for event in events)
+        assert reader[0] == events[0]
+        assert sum(1 for _ in reader.records()) == casts
+
+
+def test_replay_detects_diverging_battles(tmp_path):
+    path = tmp_path / 'events.bin'
+    _write_log(path, 10)
+
+    assert verify_replay(path, _battle) == []
+    assert verify_replay(path, lambda battle_id: _battle(battle_id + (battle_id == 4) * 1000)) == [4]
+
+
+def test_long_battles_and_heavy_hits_fit_a_record(tmp_path):
+    path = tmp_path / 'events.bin'
+    hit = MoveEffect(damage=2 ** 31 - 1, alteration=StatsAlteration(StatsName.DFN, -6), result=ResultType.HIT)
+    with EventLog(path) as log:
+        log.write(2 ** 32 - 1, 70_000, 1, MovePos.SECOND, MoveEffect(damage=40_000, result=ResultType.CRIT))
+        log.write(0, 2 ** 32 - 1, 0, MovePos.FIRST, hit)
+
+    with EventReader(path) as reader:
+        first, last = reader
+    assert (first.battle, first.turn, first.damage, first.result) == (2 ** 32 - 1, 70_000, 40_000, ResultType.CRIT)
+    assert (last.turn, last.damage, last.alteration) == (2 ** 32 - 1, 2 ** 31 - 1, (StatsName.DFN, -6))
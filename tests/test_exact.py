@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from battlesys.definitions import (Creature, Damage, Move, MovePos, Nature, StatsAlteration,
+                                   StatsName)
+from battlesys.exact import solve_matchup
+from battlesys.montecarlo import simulate_matchup
+
+
+def _stats(**kwargs: int) -> dict[StatsName, int]:
+    stats = {StatsName[name.upper()]: value for name, value in kwargs.items()}
+    stats.update({StatsName.EVA: 0, StatsName.ACC: 0})
+    return stats
+
+
+def _pound() -> Move:
+    return Move(name='pound', hit_rate=100, damage=Damage(power=40, nature=Nature.PHYSICAL))
+
+
+def test_certain_outcome_is_solved_exactly():
+    fast = Creature(max_health=20, stats=_stats(atk=10, dfn=10, spd=9), moves={MovePos.FIRST: _pound()})
+    slow = Creature(max_health=20, stats=_stats(atk=10, dfn=10, spd=8), moves={MovePos.FIRST: _pound()})
+
+    result = solve_matchup(fast, slow)
+
+    # each pound deals 5 damage, so the faster creature lands the fourth hit first
+    assert result.wins == (1.0, 0.0)
+    assert result.draw_rate == 0.0
+    assert result.mean_turns == 4.0
+
+
+def test_turn_limit_is_reported_as_draw():
+    shy = Creature(max_health=20, stats=_stats(atk=10, dfn=10, spd=9),
+                   moves={MovePos.FIRST: Move(name='splash', hit_rate=100)})
+
+    result = solve_matchup(shy, shy, max_turns=7)
+
+    assert result.draw_rate == 1.0
+    assert result.mean_turns == 7.0
+
+
+def test_agrees_with_monte_carlo_estimate():
+    first = Creature(max_health=24, stats=_stats(atk=10, dfn=8, sat=9, sdf=7, spd=8),
+                     moves={MovePos.FIRST: Move(name='pepper breath', hit_rate=90,
+                                                damage=Damage(power=45, nature=Nature.MAGICAL)),
+                            MovePos.SECOND: Move(name='sand attack', hit_rate=100,
+                                                 alteration=StatsAlteration(StatsName.ACC, -1),
+                                                 alteration_rate=100)})
+    second = Creature(max_health=22, stats=_stats(atk=8, dfn=8, sat=10, sdf=9, spd=7),
+                      moves={MovePos.FIRST: Move(name='horn attack', hit_rate=85,
+                                                 damage=Damage(power=50, nature=Nature.PHYSICAL),
+                                                 alteration=StatsAlteration(StatsName.DFN, -1),
+                                                 alteration_rate=30)})
+
+    exact = solve_matchup(first, second)
+    sampled = simulate_matchup(first, second, 4_000, workers=1, seed=11, confidence=0.999)
+
+    assert abs(sum(exact.wins) + exact.draw_rate - 1) < 1e-9
+    low, high = sampled.confidence_interval(0)
+    assert low <= exact.win_rate(0) <= high
+    assert abs(exact.mean_turns - sampled.mean_turns) < 0.2
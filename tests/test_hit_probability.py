@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.calculator import hit_probability
+from battlesys.definitions import Damage, Move, Nature, StatsAlteration, StatsName
+from battlesys.catalog import load_catalog
+from tests.statistical import (ALPHA, assert_binomial, binomial_p_value, creatures, expected_hit_probability,
+                               sample_effects, sample_hits)
+
+
+_STAGES = range(-6, 7)
+
+
+def _move(hit_rate: int, alteration_rate: int = 0) -> Move:
+    return Move(name='probe', hit_rate=hit_rate, damage=Damage(power=40, nature=Nature.PHYSICAL),
+                alteration=StatsAlteration(StatsName.DFN, -1) if alteration_rate else None,
+                alteration_rate=alteration_rate)
+
+
+def test_the_binomial_test_holds_its_false_failure_rate():
+    assert binomial_p_value(50, 100, 0.5) == pytest.approx(1.0)
+    assert binomial_p_value(0, 100, 0.0) == 1.0 and binomial_p_value(1, 100, 0.0) == 0.0
+    # the test has the power to reject a 3% bias: 53% heads in 10,000 flips of a fair coin falls under ALPHA
+    assert binomial_p_value(5_300, 10_000, 0.5) < ALPHA
+    with pytest.raises(AssertionError):
+        assert_binomial(sample_hits(_move(50), *creatures()), 10_000, 0.55)
+
+
+def test_calculator_matches_the_roll_count_of_every_stage_pair():
+    for hit_rate in (1, 30, 50, 75, 99, 100):
+        for accuracy in _STAGES:
+            for evasion in _STAGES:
+                assert hit_probability(hit_rate, accuracy, evasion) == pytest.approx(
+                    expected_hit_probability(hit_rate, accuracy, evasion))
+
+
+@pytest.mark.parametrize('hit_rate', [0, 30, 70, 100])
+@pytest.mark.parametrize('accuracy, evasion', [(0, 0), (2, 0), (0, 2), (-3, 1), (1, -4), (6, -6)])
+def test_hit_or_miss_follows_the_accuracy_evasion_ratio(hit_rate, accuracy, evasion):
+    caster, target = creatures(accuracy, evasion)
+    hits = sample_hits(_move(hit_rate), caster, target, seed=hit_rate)
+    assert_binomial(hits, 10_000, expected_hit_probability(hit_rate, accuracy, evasion), what='hits')
+
+
+@pytest.mark.parametrize('hit_rate, alteration_rate, evasion', [(90, 30, 0), (60, 50, 1), (100, 10, -2)])
+def test_effect_alters_on_a_share_of_hits(hit_rate, alteration_rate, evasion):
+    caster, target = creatures(evasion=evasion)
+    counts = sample_effects(_move(hit_rate, alteration_rate), caster, target, seed=7)
+    hit = expected_hit_probability(hit_rate, 0, evasion)
+    assert_binomial(counts['hit'], 10_000, hit, what='hits')
+    assert_binomial(counts['alteration'], 10_000, hit * alteration_rate / 100, what='alterations')
+
+
+def test_conditions_trigger_on_their_rate_of_hits():
+    caster, target = creatures()
+    poison_sting = load_catalog()['poison_sting']
+    counts = sample_effects(poison_sting, caster, target, seed=3)
+    hit = expected_hit_probability(poison_sting.hit_rate, 0, 0)
+    assert_binomial(counts['condition'], 10_000, hit * poison_sting.condition_rate / 100, what='conditions')
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.action import cast_move
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsName
+from battlesys.instrument import Profiler, ProfilerActiveError, ProfileSnapshot
+from battlesys.rng import BattleRNG
+
+
+def _creature() -> Creature:
+    return Creature(stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos.FIRST: Move(name='horn attack', hit_rate=85,
+                                               damage=Damage(power=50, nature=Nature.PHYSICAL))})
+
+
+def test_phases_are_counted_only_while_enabled():
+    original = Move.__dict__['effect']
+    player, enemy, rng = _creature(), _creature(), BattleRNG(seed=8)
+
+    with Profiler() as profiler:
+        assert Move.__dict__['effect'] is not original
+        for _ in range(200):
+            cast_move(player, MovePos.FIRST, enemy, rng)
+        first = profiler.snapshot()
+        cast_move(player, MovePos.FIRST, enemy, rng)
+
+    assert Move.__dict__['effect'] is original
+    cast_move(player, MovePos.FIRST, enemy, rng)
+
+    assert first.calls['Move.effect'] == first.calls['Move.hit_or_miss'] == first.calls['Creature.apply'] == 200
+    assert first.calls['Move.build_damage'] == first.outcomes['Move.effect']['HIT']
+    assert first.outcomes['Move.effect']['HIT'] + first.outcomes['Move.effect']['MISS'] == 200
+    assert first.nanoseconds['Move.effect'] >= first.nanoseconds['Move.hit_or_miss']
+
+    delta = profiler.snapshot().diff(first)
+    assert delta.calls['Move.effect'] == 1
+    assert ProfileSnapshot.from_json(profiler.snapshot().to_json()) == profiler.snapshot()
+
+
+def test_only_one_profiler_instruments_a_method():
+    with Profiler():
+        with pytest.raises(ProfilerActiveError):
+            Profiler().enable()
+    assert not hasattr(Move.__dict__['effect'], '__instrumented__')
+
+
+
+def test_profilers_can_be_disabled_in_any_order():
+    originals = {name: Move.__dict__[name] for name in ('effect', 'hit_or_miss', 'build_damage')}
+    rolls, damage = Profiler(targets=[(Move, 'hit_or_miss')]), Profiler(targets=[(Move, 'build_damage')])
+    rolls.enable()
+    damage.enable()
+    assert Move.__dict__['effect'] is originals['effect']
+    rolls.disable()
+    damage.disable()
+    assert {name: Move.__dict__[name] for name in originals} == originals
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import battlesys.montecarlo as montecarlo
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsName
+from battlesys.montecarlo import simulate_matchup
+
+
+def _stats(**kwargs: int) -> dict[StatsName, int]:
+    stats = {StatsName[name.upper()]: value for name, value in kwargs.items()}
+    stats.update({StatsName.EVA: 0, StatsName.ACC: 0})
+    return stats
+
+
+def _agumon() -> Creature:
+    return Creature(name='Agumon', max_health=26,
+                    stats=_stats(atk=10, dfn=8, sat=9, sdf=7, spd=8),
+                    moves={MovePos.FIRST: Move(name='Pepper Breath', hit_rate=90,
+                                               damage=Damage(power=45, nature=Nature.MAGICAL))})
+
+
+def _gabumon() -> Creature:
+    return Creature(name='Gabumon', max_health=22,
+                    stats=_stats(atk=8, dfn=8, sat=10, sdf=9, spd=7),
+                    moves={MovePos.FIRST: Move(name='Horn Attack', hit_rate=85,
+                                               damage=Damage(power=50, nature=Nature.PHYSICAL))})
+
+
+def test_result_does_not_depend_on_worker_count():
+    inline = simulate_matchup(_agumon(), _gabumon(), 600, workers=1, seed=5, chunk_size=100)
+    pooled = simulate_matchup(_agumon(), _gabumon(), 600, workers=2, seed=5, chunk_size=100)
+
+    assert inline == pooled
+    assert inline.battles == 600
+    assert sum(inline.wins) + inline.draws == 600
+    assert sum(inline.turns.values()) == 600
+    # the inline run leaves the pool workers' matchup alone
+    assert montecarlo._worker_matchup is None
+
+
+def test_win_rate_lies_within_its_confidence_interval():
+    result = simulate_matchup(_agumon(), _gabumon(), 2_000, workers=1, seed=1)
+    low, high = result.confidence_interval(0)
+
+    assert low < result.win_rate(0) < high
+    assert result.win_rate(0) > result.win_rate(1)
+    assert result.mean_turns >= 1
+
+
+def test_stops_early_once_interval_is_narrow_enough():
+    result = simulate_matchup(_agumon(), _gabumon(), 100_000, workers=2, seed=2, chunk_size=200, ci_width=0.08)
+
+    assert result.battles < 100_000
+    assert result.battles % 200 == 0
+    assert result.ci_width() <= 0.08
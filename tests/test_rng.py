@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from battlesys.action import cast_move
+from battlesys.battle import Battle, fresh_creature
+from battlesys.definitions import (Creature, Damage, Move, MovePos, Nature, ResultType,
+                                   StatsAlteration, StatsName, is_a_hit)
+from battlesys.rng import BattleRNG
+
+
+def _creature() -> Creature:
+    return Creature(stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.EVA: 0, StatsName.ACC: 0},
+                    moves={MovePos.FIRST: Move(name='horn attack', hit_rate=85,
+                                               damage=Damage(power=50, nature=Nature.PHYSICAL),
+                                               alteration=StatsAlteration(StatsName.EVA, 1),
+                                               alteration_rate=30)})
+
+
+def _battle(stream: int) -> list[tuple[ResultType, int]]:
+    rng = BattleRNG.stream(1234, stream, block_size=64)
+    player, enemy = _creature(), _creature()
+    trace = []
+    for _ in range(50):
+        result = cast_move(player, MovePos.FIRST, enemy, rng)
+        trace.append((result, enemy.health))
+    return trace
+
+
+def test_rolls_are_uniform_between_1_and_100():
+    rng = BattleRNG(seed=0, block_size=100)
+    counts = Counter(rng.roll() for _ in range(100_000))
+    assert set(counts) == set(range(1, 101))
+    assert max(counts.values()) < 1_200
+    assert min(counts.values()) > 800
+
+
+def test_same_seed_replays_the_same_hits():
+    first, second = BattleRNG(seed=42), BattleRNG(seed=42)
+    assert ([is_a_hit(50, 0, 0, first) for _ in range(10_000)]
+            == [is_a_hit(50, 0, 0, second) for _ in range(10_000)])
+
+
+def test_streams_are_independent_of_process_layout():
+    sequential = [_battle(stream) for stream in range(8)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = list(pool.map(_battle, reversed(range(8))))
+
+    assert parallel[::-1] == sequential
+    assert len({tuple(trace) for trace in sequential}) == 8
+
+
+def test_block_size_does_not_change_the_battle():
+    fighter = Creature(max_health=60, stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 8,
+                                             StatsName.EVA: 0, StatsName.ACC: 0},
+                       moves={**_creature().moves,
+                              MovePos.SECOND: Move(name='growl', hit_rate=100,
+                                                   alteration=StatsAlteration(StatsName.ATK, -1),
+                                                   alteration_rate=100)})
+
+    def outcome(block_size: int) -> list[tuple[int, int]]:
+        battles = [Battle(fresh_creature(fighter), fresh_creature(fighter),
+                          rng=BattleRNG.stream(7, index, block_size=block_size)).run() for index in range(50)]
+        return [(result.winner, result.turns) for result in battles]
+
+    small, large = BattleRNG(seed=5, block_size=3), BattleRNG(seed=5)
+    assert [small.roll() for _ in range(500)] == [large.roll() for _ in range(500)]
+    assert outcome(3) == outcome(256) == outcome(4096)
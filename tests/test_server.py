@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsName
+from battlesys.server import BattleServer
+
+
+def _roster() -> dict[str, Creature]:
+    def creature(name: str, speed: int) -> Creature:
+        return Creature(name=name, max_health=20,
+                        stats={StatsName.ATK: 10, StatsName.DFN: 10, StatsName.SPD: speed,
+                               StatsName.EVA: 0, StatsName.ACC: 0},
+                        moves={MovePos.FIRST: Move(name='pound', hit_rate=100,
+                                                   damage=Damage(power=40, nature=Nature.PHYSICAL))})
+    return {'Agumon': creature('Agumon', 9), 'Gabumon': creature('Gabumon', 8)}
+
+
+async def _session_over_socket(path) -> list[dict]:
+    server = BattleServer(_roster(), max_sessions=2)
+    await server.start_unix(path)
+    reader, writer = await asyncio.open_unix_connection(path)
+
+    async def call(request) -> dict:
+        writer.write((request if isinstance(request, bytes) else json.dumps(request).encode()) + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    replies = [await call({'op': 'new', 'player': 'agumon', 'enemy': 'gabumon', 'seed': 1})]
+    session = replies[0]['session']
+    while replies[-1]['state']['winner'] is None:
+        replies.append(await call({'op': 'move', 'session': session, 'move': 1}))
+    replies.append(await call({'op': 'move', 'session': session, 'move': 1}))
+    replies.append(await call({'op': 'close', 'session': session}))
+    replies.append(await call(b'not json'))
+    replies.append(await call({'op': 'new', 'player': 'patamon', 'enemy': 'gabumon'}))
+
+    writer.close()
+    await server.close()
+    return replies
+
+
+def test_session_plays_to_completion_over_unix_socket(tmp_path):
+    replies = asyncio.run(_session_over_socket(str(tmp_path / 'battle.sock')))
+
+    opened, *turns, over, closed, garbage, unknown = replies
+    assert opened['ok'] and opened['state'] == {'turn': 0, 'winner': None, 'health': [20, 20], 'moves': [[1], [1]]}
+    assert all(reply['ok'] for reply in turns)
+    assert turns[0]['actions'] == [[0, 1, 'hit'], [1, 1, 'hit']]
+    assert turns[-1]['state']['winner'] == 0
+    assert turns[-1]['state']['turn'] == 4
+    assert not over['ok'] and 'over' in over['error']
+    assert closed == {'ok': True, 'session': opened['session']}
+    assert not garbage['ok']
+    assert not unknown['ok'] and 'patamon' in unknown['error']
+
+
+def test_full_server_and_idle_sessions():
+    server = BattleServer(_roster(), max_sessions=2, session_timeout=5.0)
+    new = json.dumps({'op': 'new', 'player': 'agumon', 'enemy': 'agumon'}).encode()
+
+    assert server.handle_line(new)['ok']
+    assert server.handle_line(new)['ok']
+    assert server.handle_line(new) == {'ok': False, 'error': 'server is full'}
+
+    session = next(iter(server.sessions.values()))
+    assert server.expire(now=session.last_seen + 1) == 0
+    assert server.expire(now=session.last_seen + 10) == 2
+    assert server.handle_line(new)['ok']
+
+
+def test_mistyped_fields_get_an_error_reply():
+    server = BattleServer(_roster())
+
+    def call(request: dict) -> dict:
+        return server.handle_line(json.dumps(request).encode())
+
+    assert call({'op': 'new', 'player': 'agumon', 'enemy': 'gabumon', 'seed': {}}) == {
+        'ok': False, 'error': 'seed must be an integer, not {}'}
+    assert call({'op': 'move', 'session': [1], 'move': 1}) == {
+        'ok': False, 'error': 'session must be an integer, not [1]'}
+    assert call({'op': 'close', 'session': True})['error'] == 'session must be an integer, not True'
+    assert not server.sessions
+    opened = call({'op': 'new', 'player': 'agumon', 'enemy': 'gabumon', 'seed': -3})
+    assert call({'op': 'move', 'session': opened['session'], 'move': 1})['ok']
+
+
+async def _two_clients(path) -> tuple[list[dict], BattleServer]:
+    def failing_policy(battle, side):
+        raise RuntimeError('policy bug')
+    server = BattleServer(_roster(), enemy_policy=failing_policy)
+    await server.start_unix(path)
+    connections = [await asyncio.open_unix_connection(path) for _ in range(2)]
+
+    async def call(client: int, request: dict) -> dict:
+        reader, writer = connections[client]
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    opened = await call(0, {'op': 'new', 'player': 'agumon', 'enemy': 'gabumon'})
+    session = opened['session']
+    replies = [await call(1, {'op': 'move', 'session': session, 'move': 1}),
+               await call(1, {'op': 'close', 'session': session}),
+               await call(0, {'op': 'move', 'session': session, 'move': 1}),
+               await call(0, {'op': 'new', 'player': 'agumon', 'enemy': 'gabumon'})]
+    assert len(server.sessions) == 2
+    connections[0][1].close()
+    await connections[0][1].wait_closed()
+    for _ in range(100):
+        if not server.sessions:
+            break
+        await asyncio.sleep(0.01)
+    replies.append({'sessions': len(server.sessions)})
+    connections[1][1].close()
+    await server.close()
+    return replies, server
+
+
+def test_sessions_belong_to_their_connection(tmp_path):
+    (stolen, closed, failed, reopened, remaining), server = asyncio.run(_two_clients(str(tmp_path / 'battle.sock')))
+
+    assert not stolen['ok'] and not closed['ok'] and 'no session' in closed['error']
+    assert failed == {'ok': False, 'error': 'internal error: RuntimeError: policy bug'}
+    assert reopened['ok']
+    assert remaining == {'sessions': 0}
+    assert server._reaper is None
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from battlesys.action import cast_move
+from battlesys.battle import fresh_creature
+from battlesys.definitions import (Creature, Damage, Move, MoveEffect, MovePos, Nature, ResultType,
+                                   StatsAlteration, StatsName)
+from battlesys.rng import BattleRNG
+from battlesys.snapshot import BattleState, CreatureState, cast_move_state
+
+
+def _creature() -> Creature:
+    return fresh_creature(Creature(
+        max_health=40,
+        stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 5, StatsName.EVA: 0, StatsName.ACC: 0},
+        moves={MovePos.FIRST: Move(name='claw', hit_rate=90, damage=Damage(power=35, nature=Nature.PHYSICAL),
+                                   alteration=StatsAlteration(StatsName.DFN, -1), alteration_rate=50)}))
+
+
+def test_snapshots_share_unchanged_structure():
+    state = BattleState.from_creatures(_creature(), _creature())
+    first, second = state.creatures
+    assert first.current_stats(StatsName.ATK) == 10
+
+    damaged = second.apply(MoveEffect(damage=3, result=ResultType.HIT))
+    assert damaged.health == second.health - 3
+    assert damaged.stages is second.stages and damaged.template is second.template
+    assert second.apply(MoveEffect(result=ResultType.MISS)) is second
+
+    lowered = second.apply(MoveEffect(alteration=StatsAlteration(StatsName.DFN, -1), result=ResultType.HIT))
+    assert lowered.stage(StatsName.DFN) == -1 and second.stage(StatsName.DFN) == 0
+    assert lowered.to_creature().current_stats(StatsName.DFN) == lowered.current_stats(StatsName.DFN) == 5
+    with pytest.raises(FrozenInstanceError):
+        second.health = 0
+
+
+def test_cast_move_state_follows_cast_move():
+    player, enemy = _creature(), _creature()
+    state = initial = BattleState.from_creatures(player, enemy)
+    mutable_rng, snapshot_rng = BattleRNG(seed=4), BattleRNG(seed=4)
+    for turn in range(20):
+        caster = turn % 2
+        mutable = (player, enemy)
+        result = cast_move(mutable[caster], MovePos.FIRST, mutable[1 - caster], mutable_rng)
+        state, effect = cast_move_state(state, caster, MovePos.FIRST, snapshot_rng)
+        assert effect.result is result
+        for creature, snapshot in zip(mutable, state.creatures):
+            assert snapshot.health == creature.health
+            assert snapshot.current_stats(StatsName.DFN) == creature.current_stats(StatsName.DFN)
+    assert initial.creatures[1].health == 40
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from battlesys.action import cast_move
+from battlesys.battle import Battle, fresh_creature
+from battlesys.catalog import load_catalog, load_roster
+from battlesys.definitions import MoveEffect, MovePos, ResultType, StatsAlteration, StatsName
+from battlesys.rng import BattleRNG
+from battlesys.species import Species
+
+
+def test_instances_share_the_species_until_altered():
+    species = Species.from_creature(load_roster()['agumon'])
+    first, second = species.spawn(), species.spawn(level=7)
+    assert (first.level, second.level, first.health) == (5, 7, species.max_health)
+    assert first.moves is second.moves and first.stats_modifiers is second.stats_modifiers
+    first.apply(MoveEffect(result=ResultType.HIT, damage=3, alteration=StatsAlteration(StatsName.DFN, -2)))
+    assert (first.health, first.stats_modifiers[StatsName.DFN]) == (species.max_health - 3, -2)
+    assert (second.health, second.stats_modifiers[StatsName.DFN]) == (species.max_health, 0)
+    assert species.no_stages[StatsName.DFN] == 0
+    first.reset()
+    assert first.health == species.max_health and first.stats_modifiers is species.no_stages
+    with pytest.raises(TypeError):
+        species.stats[StatsName.ATK] = 99
+
+
+def test_instances_play_exactly_like_creatures():
+    roster = load_roster()
+    agumon, gabumon = Species.from_creature(roster['agumon']), Species.from_creature(roster['gabumon'])
+    for seed in range(20):
+        creatures = Battle(fresh_creature(roster['agumon']), fresh_creature(roster['gabumon']),
+                           rng=BattleRNG(seed))
+        individuals = Battle(agumon.spawn(), gabumon.spawn(), rng=BattleRNG(seed))
+        assert creatures.run() == individuals.run()
+        for creature, individual in zip(creatures.creatures, individuals.creatures):
+            assert creature.health == individual.health
+            assert all(creature.current_stats(stat) == individual.current_stats(stat) for stat in creature.stats)
+            assert individual.to_creature().stats_modifiers == creature.stats_modifiers
+
+
+def test_variant_overrides_only_what_it_names():
+    species = Species.from_creature(load_roster()['gabumon'])
+    variant = species.variant(name='shiny gabumon', stats={StatsName.ATK: 20},
+                              moves={MovePos.THIRD: load_catalog()['growl']})
+    shiny, target = variant.spawn(), species.spawn()
+    assert shiny.name == 'shiny gabumon' and shiny.current_stats(StatsName.ATK) == 20
+    assert shiny.current_stats(StatsName.DFN) == target.current_stats(StatsName.DFN)
+    assert shiny.moves[MovePos.FIRST] is species.moves[MovePos.FIRST]
+    assert cast_move(shiny, MovePos.THIRD, target, BattleRNG(0)) is ResultType.HIT
+    assert target.stats_modifiers[StatsName.ATK] == -1
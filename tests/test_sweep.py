@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from battlesys.battle import fresh_creature
+from battlesys.catalog import load_catalog
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsName
+from battlesys.hashing import definition_hash
+from battlesys.sweep import Axis, SweepCache, sweep, with_parameter
+
+
+def _creature(name: str, move: Move) -> Creature:
+    return fresh_creature(Creature(name=name, max_health=20,
+                                   stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 5,
+                                          StatsName.EVA: 0, StatsName.ACC: 0},
+                                   moves={MovePos.FIRST: move}))
+
+
+ROSTER = {
+    'pounder': _creature('Pounder', Move(name='Pound', hit_rate=100, damage=Damage(power=40, nature=Nature.PHYSICAL))),
+    'tackler': _creature('Tackler', Move(name='Tackle', hit_rate=100, damage=Damage(power=35, nature=Nature.PHYSICAL))),
+}
+
+
+def test_definition_hash_follows_content():
+    catalog_tackle = _creature('Tackler', load_catalog()['tackle'])
+    assert definition_hash(catalog_tackle) == definition_hash(ROSTER['tackler'])
+    assert definition_hash(with_parameter(ROSTER['tackler'], MovePos.FIRST, 'power', 36)) != \
+        definition_hash(ROSTER['tackler'])
+    assert definition_hash(ROSTER['pounder'], 1) != definition_hash(ROSTER['pounder'], 2)
+
+
+def test_sweep_reuses_unchanged_matchups(tmp_path):
+    cache = SweepCache(tmp_path / 'sweep.json')
+    axes = [Axis('pounder', MovePos.FIRST, 'hit_rate', (50, 100)),
+            Axis('pounder', MovePos.FIRST, 'power', (20, 40))]
+    result = sweep(ROSTER, axes, matchups=[('pounder', 'tackler')], battles=200, workers=1, cache=cache)
+    assert (result.computed, result.reused) == (4, 0)
+
+    xs, ys, grid = result.heatmap(0, 1, 'pounder', 'tackler')
+    assert (xs, ys) == ([50, 100], [20, 40])
+    assert grid[1][1] > grid[0][0]
+    assert grid[1][1] > grid[1][0] and grid[1][1] > grid[0][1]
+
+    axes[0] = Axis('pounder', MovePos.FIRST, 'hit_rate', (50, 75, 100))
+    rerun = sweep(ROSTER, axes, matchups=[('pounder', 'tackler')], battles=200, workers=1,
+                  cache=SweepCache(tmp_path / 'sweep.json'))
+    assert (rerun.computed, rerun.reused) == (2, 4)
+    assert rerun.heatmap(0, 1, 'pounder', 'tackler')[2][1][2] == grid[1][1]
+
+    rerun.write_csv(tmp_path / 'sweep.csv')
+    lines = (tmp_path / 'sweep.csv').read_text().splitlines()
+    assert lines[0] == 'pounder.1.hit_rate,pounder.1.power,first,second,win_rate,draw_rate'
+    assert len(lines) == 1 + 6
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsAlteration, StatsName
+from battlesys.tournament import COLUMNS, ResumeMismatchError, iter_results, run_tournament, standings
+
+
+def _roster() -> list[Creature]:
+    def creature(name: str, atk: int, spd: int) -> Creature:
+        return Creature(name=name, max_health=20,
+                        stats={StatsName.ATK: atk, StatsName.DFN: 8, StatsName.SPD: spd,
+                               StatsName.EVA: 0, StatsName.ACC: 0},
+                        moves={MovePos.FIRST: Move(name='tackle', hit_rate=80,
+                                                   damage=Damage(power=35, nature=Nature.PHYSICAL))})
+    return [creature('a', 10, 8), creature('b', 8, 9), creature('c', 9, 7)]
+
+
+def _columns(path) -> dict[str, bytes]:
+    return {name: (path / f'{name}.col').read_bytes() for name in COLUMNS}
+
+
+def test_every_pairing_is_streamed_to_columns(tmp_path):
+    manifest = run_tournament(_roster(), 50, tmp_path, seed=4, flush_every=16)
+
+    assert manifest['completed_pairings'] == 3
+    assert manifest['rows'] == 150
+    rows = [row for chunk in iter_results(tmp_path, chunk_rows=40) for row in zip(*chunk.values())]
+    assert len(rows) == 150
+    assert {(pairing, first, second) for pairing, first, second, _, _ in rows} == {(0, 0, 1), (1, 0, 2), (2, 1, 2)}
+
+    table = standings(tmp_path)
+    assert sum(wins + losses + draws for wins, losses, draws in table.values()) == 300
+
+
+def test_resume_discards_partial_pairing_and_finishes_identically(tmp_path):
+    complete, crashed = tmp_path / 'complete', tmp_path / 'crashed'
+    run_tournament(_roster(), 30, complete, seed=9)
+    run_tournament(_roster(), 30, crashed, seed=9)
+
+    # pretend the run died halfway through the second pairing
+    manifest = json.loads((crashed / 'manifest.json').read_text())
+    manifest.update(completed_pairings=1, rows=30)
+    (crashed / 'manifest.json').write_text(json.dumps(manifest))
+    for name in COLUMNS:
+        column = crashed / f'{name}.col'
+        column.write_bytes(column.read_bytes()[:len(column.read_bytes()) // 2])
+
+    run_tournament(_roster(), 30, crashed, seed=9, resume=True)
+
+    assert _columns(crashed) == _columns(complete)
+    with pytest.raises(ResumeMismatchError):
+        run_tournament(_roster(), 31, crashed, seed=9, resume=True)
+
+
+def test_battles_longer_than_65535_turns_are_recorded(tmp_path):
+    growl = Move(name='growl', hit_rate=100, alteration=StatsAlteration(StatsName.ATK, -1), alteration_rate=100)
+    stalled = [Creature(name=name, max_health=20, stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 8,
+                                                         StatsName.EVA: 0, StatsName.ACC: 0},
+                        moves={MovePos.FIRST: growl}) for name in 'ab']
+    run_tournament(stalled, 1, tmp_path, max_turns=70_000)
+
+    assert [list(chunk['turns']) for chunk in iter_results(tmp_path)] == [[70_000]]
+    assert standings(tmp_path) == {'a': [0, 0, 1], 'b': [0, 0, 1]}
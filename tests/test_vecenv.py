@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from battlesys.battle import fresh_creature
+from battlesys.definitions import Creature, Damage, Move, MovePos, Nature, StatsAlteration, StatsName
+from battlesys.vecenv import AVAILABLE, HEALTH, OBSERVATION_SIZE, STAGES, VecBattleEnv
+
+
+def _creature(*moves: Move) -> Creature:
+    return fresh_creature(Creature(
+        max_health=20,
+        stats={StatsName.ATK: 10, StatsName.DFN: 8, StatsName.SPD: 5, StatsName.EVA: 0, StatsName.ACC: 0},
+        moves={MovePos(pos): move for pos, move in enumerate(moves, 1)}))
+
+
+POUND = Move(name='pound', hit_rate=90, damage=Damage(power=40, nature=Nature.PHYSICAL))
+GROWL = Move(name='growl', hit_rate=100, alteration=StatsAlteration(StatsName.ATK, -1), alteration_rate=100)
+
+
+def _rollout(env: VecBattleEnv, steps: int) -> list[tuple[np.ndarray, ...]]:
+    trajectory = []
+    for step in range(steps):
+        observation, rewards, terminated, truncated, _ = env.step(np.full(env.num_envs, step % 2))
+        trajectory.append((observation, rewards, terminated, truncated))
+    return trajectory
+
+
+def test_step_observes_rewards_and_auto_resets():
+    env = VecBattleEnv.replicate(_creature(POUND, GROWL), _creature(POUND, GROWL), 64, max_turns=30)
+    observation, _ = env.reset(seed=7)
+    assert observation.shape == (64, OBSERVATION_SIZE)
+    assert (observation[:, HEALTH] == 1).all()
+    assert (observation[:, AVAILABLE] == [1, 1, 0]).all()
+
+    finished = 0
+    for observation, rewards, terminated, truncated in _rollout(env, 60):
+        assert set(np.unique(rewards)) <= {-1.0, 0.0, 1.0}
+        assert (rewards[~terminated] == 0).all()
+        ended = terminated | truncated
+        assert (observation[ended][:, HEALTH] == 1).all()
+        assert (observation[ended][:, STAGES] == 0).all()
+        finished += ended.sum()
+    assert finished > 64
+    assert (env.batch.turns < 30).all()
+
+
+def test_sub_environments_are_seeded_independently():
+    pair = (_creature(POUND, GROWL), _creature(POUND, GROWL))
+    wide = VecBattleEnv([pair] * 8)
+    wide.reset(seed=[11, 12, 13, 14, 15, 16, 17, 18])
+    single = VecBattleEnv([pair])
+    single.reset(seed=[13])
+    for (wide_step, single_step) in zip(_rollout(wide, 40), _rollout(single, 40)):
+        for wide_array, single_array in zip(wide_step, single_step):
+            assert np.array_equal(wide_array[2], single_array[0])
+
+
+def test_seeds_are_taken_mod_two_to_the_64():
+    pair = (_creature(POUND, GROWL), _creature(POUND, GROWL))
+    negative, wrapped = VecBattleEnv([pair] * 2), VecBattleEnv([pair] * 2)
+    negative.reset(seed=-1)
+    wrapped.reset(seed=[2 ** 64 - 1, 2 ** 64])
+    assert np.array_equal(negative.batch.state, wrapped.batch.state)
+    for negative_step, wrapped_step in zip(_rollout(negative, 20), _rollout(wrapped, 20)):
+        for negative_array, wrapped_array in zip(negative_step, wrapped_step):
+            assert np.array_equal(negative_array, wrapped_array)